@@ -3,9 +3,7 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils.styling import apply_custom_styling, load_css
-from utils.state_management import initialize_session_state
-from src._3_frameworks.streamlit_app import VibratonicApp
+from utils.shared_services import get_timing_registry
 
 # Configure page
 st.set_page_config(
@@ -15,13 +13,17 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Initialize session state
-initialize_session_state()
-
-# Apply custom styling
-apply_custom_styling()
-load_css("static/custom.css")
-
-# Initialize and run the main app
-app = VibratonicApp()
-app.run()
+# Every page runs through here, so its whole script run is timed in one place
+# as "page.<name>"; a with-block also records runs that st.rerun, st.stop or
+# st.switch_page end early by raising
+page = st.navigation([
+    st.Page("home.py", title="Home", icon="⚡", default=True),
+    st.Page("pages/1_Create_Hackathon.py"),
+    st.Page("pages/2_Map_View.py"),
+    st.Page("pages/3_MVP_Showcase.py"),
+    st.Page("pages/4_Investor_Feed.py"),
+    st.Page("pages/5_Profile.py"),
+    st.Page("pages/6_Admin_Dashboard.py"),
+])
+with get_timing_registry().timed(f"page.{page.url_path.lower() or 'home'}"):
+    page.run()
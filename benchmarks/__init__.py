@@ -0,0 +1 @@
+# Benchmarks - Offline load tests for adapters and services
@@ -0,0 +1,109 @@
+"""Paged admin catalog query latency.
+
+Fills the MVP service with N MVPs, then times page queries (plain, sorted,
+searched, filtered) against the old approach of building the whole list
+and sorting it on every render, and queries interleaved with fundings,
+checking the funding order still matches a fresh sort.
+
+    python -m benchmarks.admin_catalog --mvps 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._0_domain.mvp import MVP, MVPStatus
+from src._1_use_cases.mvp_service import MVPService
+from benchmarks.results import percentile, record_result, print_comparison
+
+BENCHMARK_NAME = "admin_catalog"
+WORDS = ["climate", "fintech", "health", "ai", "iot", "energy", "mobility", "food", "learning", "civic"]
+STACKS = ["Python", "React", "Node.js", "Go", "Rust", "Flutter", "PostgreSQL", "TensorFlow"]
+
+
+def timed(fn, repeat: int):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return percentile(latencies, 50), percentile(latencies, 99)
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    service = MVPService()
+    start = datetime(2024, 1, 1)
+    for i in range(args.mvps):
+        service._mvps[f"bench{i}"] = MVP(
+            id=f"bench{i}", hackathon_id=f"hack{i % 50}", creator_id=f"user{i % 5000}",
+            title=f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} {i}",
+            description=" ".join(rng.choices(WORDS, k=12)), tech_stack=rng.sample(STACKS, 3),
+            current_funding=float(rng.randint(0, 50_000)), backers_count=rng.randint(0, 300),
+            status=rng.choice(list(MVPStatus)), submission_datetime=start + timedelta(minutes=i)
+        )
+    service.catalog_version += 1
+
+    queries = {
+        "first_page": lambda: service.query_mvps(page_size=args.page_size),
+        "sorted_deep_page": lambda: service.query_mvps(sort_by="funding", page=50, page_size=args.page_size),
+        "search": lambda: service.query_mvps(search="climate python", page_size=args.page_size),
+        "search_and_status": lambda: service.query_mvps(search="health", status=MVPStatus.FUNDED,
+                                                        page_size=args.page_size),
+    }
+    metrics = {"mvps": len(service.get_all_mvps())}
+    # First query after a change builds the sorted views
+    build_start = time.perf_counter()
+    service.query_mvps()
+    metrics["index_build_ms"] = (time.perf_counter() - build_start) * 1000
+    for name, query in queries.items():
+        query()
+        p50, p99 = timed(query, args.repeat)
+        metrics[f"{name}_p50_ms"] = p50
+        metrics[f"{name}_p99_ms"] = p99
+
+    naive = lambda: sorted(service.get_all_mvps(), key=lambda mvp: mvp.current_funding, reverse=True)[:args.page_size]
+    metrics["naive_sort_p50_ms"], _ = timed(naive, args.repeat)
+
+    # Fundings only move the funded MVP within the funding and backers orders
+    fundable = [mvp.id for mvp in service.get_all_mvps() if mvp.status in (MVPStatus.SUBMITTED, MVPStatus.FUNDED)]
+    def funded_query():
+        service.add_funding(rng.choice(fundable), float(rng.randint(10, 5_000)), "bench")
+        return service.query_mvps(sort_by="funding", page_size=args.page_size)
+    metrics["funded_query_p50_ms"], metrics["funded_query_p99_ms"] = timed(funded_query, args.repeat * 10)
+    last_page = service.query_mvps(sort_by="funding", page_size=args.page_size)["items"]
+    metrics["funding_order_exact"] = ([mvp.current_funding for mvp in last_page]
+                                      == [mvp.current_funding for mvp in naive()])
+    return metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Admin catalog query benchmark")
+    parser.add_argument("--mvps", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["first_page_p99_ms", "sorted_deep_page_p99_ms", "search_p99_ms"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>24}: {value:,.3f}" if isinstance(value, float) else f"{key:>24}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Vocabulary autocomplete update rate and completion latency.
+
+Counts Zipf-distributed uses of N synthetic one- to three-word terms in a
+PrefixTrie, removes some of them again as edits do, then times top-10
+completions for one- to three-letter prefixes against scanning every term
+the way a filter built from all entities would. Completions are checked
+against the scan, again after the most used terms are forgotten entirely.
+
+    python -m benchmarks.autocomplete --terms 100000 --uses 1000000
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._1_use_cases.vocabulary_service import PrefixTrie, normalize_term
+from benchmarks.results import percentile, record_result, print_comparison, current_rss_mb
+
+BENCHMARK_NAME = "autocomplete"
+SYLLABLES = ["ra", "to", "ki", "ne", "so", "lu", "ma", "de", "vi", "go", "py", "th", "on", "ex", "ql", "js"]
+
+
+def make_terms(rng: random.Random, count: int) -> list:
+    terms = set()
+    while len(terms) < count:
+        words = [("".join(rng.choices(SYLLABLES, k=rng.randint(1, 4)))).capitalize()
+                 for _ in range(rng.choice((1, 1, 1, 2, 2, 3)))]
+        terms.add(" ".join(words))
+    return sorted(terms)
+
+
+def scan(counts: dict, prefix: str, limit: int) -> list:
+    """Every term with a word starting with `prefix`, most used first"""
+    matches = [term for term in counts
+               if any(word.startswith(prefix) for word in normalize_term(term).replace("-", " ").replace("/", " ").split())]
+    return sorted(matches, key=lambda term: (-counts[term], normalize_term(term)))[:limit]
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    terms = make_terms(rng, args.terms)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(terms))))
+    uses = rng.choices(terms, cum_weights=cum_weights, k=args.uses)
+
+    trie = PrefixTrie()
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    for term in uses:
+        trie.add(term)
+    add_seconds = time.perf_counter() - start
+    rss_after = current_rss_mb()
+
+    removed = rng.sample(uses, args.removes)
+    start = time.perf_counter()
+    for term in removed:
+        trie.remove(term)
+    remove_seconds = time.perf_counter() - start
+
+    counts = {}
+    for term in uses:
+        counts[term] = counts.get(term, 0) + 1
+    for term in removed:
+        counts[term] -= 1
+        if not counts[term]:
+            del counts[term]
+
+    metrics = {
+        "terms": len(trie),
+        "adds_per_second": args.uses / add_seconds,
+        "removes_per_second": args.removes / remove_seconds,
+        "trie_rss_mb": rss_after - rss_before,
+    }
+    alphabet = "abcdeghiklmnopqrstuvxyz"
+    for length in (1, 2, 3):
+        prefixes = ["".join(rng.choices(alphabet, k=length)) for _ in range(args.queries)]
+        latencies = []
+        for prefix in prefixes:
+            start = time.perf_counter_ns()
+            trie.complete(prefix, 10)
+            latencies.append((time.perf_counter_ns() - start) / 1000)
+        latencies.sort()
+        metrics[f"prefix{length}_p50_us"] = percentile(latencies, 50)
+        metrics[f"prefix{length}_p99_us"] = percentile(latencies, 99)
+
+    checked = ["".join(rng.choices(alphabet, k=2)) for _ in range(args.checks)]
+    start = time.perf_counter()
+    for prefix in checked:
+        scan(counts, prefix, 10)
+    metrics["scan_ms"] = (time.perf_counter() - start) / len(checked) * 1000
+    metrics["exact"] = matches_scan(trie, counts, checked)
+
+    # Forgetting the most used terms empties the front of every list they are on
+    forgotten = sorted(counts, key=lambda term: -counts[term])[:args.forgets]
+    for term in forgotten:
+        trie.remove(term, counts.pop(term))
+    metrics["exact_after_forgets"] = matches_scan(trie, counts, checked)
+    return metrics
+
+
+def matches_scan(trie: PrefixTrie, counts: dict, prefixes: list) -> bool:
+    return all(
+        [normalize_term(term) for term in trie.complete(prefix, 10)]
+        == [normalize_term(term) for term in scan(counts, prefix, 10)]
+        for prefix in prefixes
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prefix trie autocomplete benchmark")
+    parser.add_argument("--terms", type=int, default=100_000)
+    parser.add_argument("--uses", type=int, default=1_000_000)
+    parser.add_argument("--removes", type=int, default=100_000)
+    parser.add_argument("--forgets", type=int, default=1_000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--checks", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["prefix1_p99_us", "prefix2_p99_us", "adds_per_second"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>22}: {value:,.3f}" if isinstance(value, float) else f"{key:>22}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
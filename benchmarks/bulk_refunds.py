@@ -0,0 +1,129 @@
+"""Bulk refund throughput and exactly-once check against the local Mollie stub.
+
+Seeds N paid and funded payments, refunds them all, then replays the run
+twice: once with the same ledger (everything is skipped) and once with a
+ledger that lost its refund entries, as after a crash mid-run, where the
+idempotency keys must stop Mollie from refunding anything again.
+
+    python -m benchmarks.bulk_refunds --payments 10000 --concurrency 16
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._0_domain.funding import FundingEntry
+from src._1_use_cases.payment_service import PaymentService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.funding_ledger import FundingLedger
+from src._1_use_cases.refund_service import RefundService
+from src._2_adapters.mollie_client import MollieClient
+from src._2_adapters.mollie_stub_server import MollieStubServer
+from benchmarks.results import peak_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "bulk_refunds"
+
+
+def seed(server: MollieStubServer, payment_service: PaymentService, mvp_service: MVPService, args, rng):
+    """Create paid payments in the stub and apply them as funding"""
+    mvps = mvp_service.get_all_mvps()
+    entries = []
+    now = datetime.now().isoformat()
+    for i in range(args.payments):
+        payment_id = f"tr_ref{i:010d}"
+        mvp = rng.choice(mvps)
+        amount = float(rng.randint(10, 500))
+        server.payments[payment_id] = {
+            "resource": "payment",
+            "id": payment_id,
+            "status": "paid",
+            "amount": {"currency": "EUR", "value": f"{amount:.2f}"},
+            "metadata": {"mvp_id": mvp.id, "backer_id": f"backer{i}"},
+            "createdAt": now,
+            "paidAt": now,
+        }
+        fees = payment_service.calculate_fees(amount)
+        entries.append(FundingEntry(
+            payment_id=payment_id, mvp_id=mvp.id, backer_id=f"backer{i}", amount=amount,
+            platform_fee=fees["platform_fee"], creator_amount=fees["creator_amount"], creator_id=mvp.creator_id
+        ))
+    mvp_service.apply_funding_batch([{"mvp_id": e.mvp_id, "amount": e.amount} for e in entries])
+    return entries
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    server = MollieStubServer(latency_ms=args.latency_ms)
+    base_url = server.serve_in_thread()
+    client = MollieClient(api_key="test_benchmark", base_url=base_url,
+                          max_connections=args.concurrency, max_concurrency=args.concurrency)
+    payment_service = PaymentService(mollie_adapter=client)
+    mvp_service = MVPService()
+    funding_before = {mvp.id: mvp.current_funding for mvp in mvp_service.get_all_mvps()}
+
+    entries = seed(server, payment_service, mvp_service, args, rng)
+    ledger = FundingLedger()
+    ledger.append(entries)
+    payment_ids = [entry.payment_id for entry in entries]
+
+    service = RefundService(payment_service, mvp_service, ledger,
+                            concurrency=args.concurrency, batch_size=args.batch_size)
+    start = time.perf_counter()
+    result = service.refund_payments(payment_ids, reason="Benchmark")
+    elapsed = time.perf_counter() - start
+    refunds_created = len(server.refunds)
+
+    repeat = service.refund_payments(payment_ids)
+
+    # A ledger that never recorded the reversals, as if the process died after calling Mollie
+    lost_ledger = FundingLedger()
+    lost_ledger.append([FundingEntry(**{**vars(entry), "offset": -1}) for entry in entries])
+    replay = RefundService(payment_service, MVPService(), lost_ledger,
+                           concurrency=args.concurrency, batch_size=args.batch_size).refund_payments(payment_ids)
+    client.close()
+
+    exact = all(abs(mvp.current_funding - funding_before[mvp.id]) < 1e-6 for mvp in mvp_service.get_all_mvps())
+    return {
+        "payments": args.payments,
+        "elapsed_seconds": elapsed,
+        "refunds_per_second": result["refunded"] / elapsed,
+        "refunded": result["refunded"],
+        "failed": result["failed"],
+        "repeat_skipped": repeat["skipped"],
+        "replay_new_refunds": len(server.refunds) - refunds_created,
+        "replay_reversed": replay["refunded"],
+        "exact_totals": exact and refunds_created == args.payments and len(ledger) == 2 * args.payments,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk refund benchmark against the stub server")
+    parser.add_argument("--payments", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Stub server latency")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["refunds_per_second", "replay_new_refunds", "exact_totals"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>20}: {value:,.3f}" if isinstance(value, float) else f"{key:>20}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Chart downsampling speed, payload reduction and peak retention.
+
+Generates a spiky random-walk series of N points, reduces it to a chart's
+width with LTTB and with min/max bucketing, and reports the time taken,
+the figure JSON size before and after, and whether the global peak and
+trough survived, including when they sit next to each other.
+
+    python -m benchmarks.downsampling --points 1000000 --width 800
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import plotly.graph_objects as go
+
+from src._1_use_cases.downsampling import lttb_indices, minmax_indices
+from benchmarks.results import percentile, record_result, print_comparison
+
+BENCHMARK_NAME = "downsampling"
+
+
+def timed(fn, repeat: int):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return result, percentile(latencies, 50)
+
+
+def payload_kb(x, y) -> float:
+    return len(go.Figure(go.Scatter(x=x, y=y, mode="lines")).to_json()) / 1024
+
+
+def run_benchmark(args) -> dict:
+    rng = np.random.default_rng(args.seed)
+    x = np.arange(args.points, dtype=np.int64) * 3_600_000_000_000  # Hourly, in ns
+    y = np.cumsum(rng.normal(size=args.points))
+    spikes = rng.choice(args.points, size=max(args.points // 10_000, 1), replace=False)
+    y[spikes] += rng.normal(scale=50, size=len(spikes))
+
+    lttb, lttb_ms = timed(lambda: lttb_indices(x, y, args.width), args.repeat)
+    minmax, minmax_ms = timed(lambda: minmax_indices(y, args.width), args.repeat)
+    peaks = {int(np.argmax(y)), int(np.argmin(y))}
+
+    # A spike straight into a dip puts both peaks in one bucket
+    flat = np.zeros(args.points)
+    flat[args.points // 2], flat[args.points // 2 + 1] = 100, -100
+    flat_lttb = lttb_indices(x, flat, args.width)
+    return {
+        "points": args.points,
+        "lttb_ms": lttb_ms,
+        "minmax_ms": minmax_ms,
+        "lttb_points": len(lttb),
+        "minmax_points": len(minmax),
+        "lttb_keeps_peaks": peaks <= set(lttb.tolist()),
+        "minmax_keeps_peaks": peaks <= set(minmax.tolist()),
+        "lttb_keeps_adjacent_peaks": flat[flat_lttb].max() == 100 and flat[flat_lttb].min() == -100
+                                     and bool(np.all(np.diff(flat_lttb) > 0)),
+        "full_payload_kb": payload_kb(x, y),
+        "lttb_payload_kb": payload_kb(x[lttb], y[lttb]),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chart downsampling benchmark")
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--width", type=int, default=800, help="Target points per trace")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["lttb_ms", "minmax_ms"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>25}: {value:,.3f}" if isinstance(value, float) else f"{key:>25}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Streaming export throughput and memory.
+
+Streams N generated transactions through the exporter to CSV and Parquet,
+sampling resident memory after every chunk. The rows never exist all at
+once, so RSS growth should stay flat as N grows; compare runs at different
+--transactions to check.
+
+    python -m benchmarks.exports --transactions 10000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._1_use_cases.export_service import ExportService, TRANSACTION_COLUMNS
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.transaction_store import TransactionStore
+from benchmarks.results import current_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "exports"
+
+
+def generate_chunks(args, rss_samples):
+    start = datetime(2023, 1, 1)
+    for chunk_start in range(0, args.transactions, args.chunk_size):
+        chunk_end = min(chunk_start + args.chunk_size, args.transactions)
+        yield [
+            (f"tr_{i}", "funding", f"mvp{i % 2000}", f"backer{i % 50_000}", f"creator{i % 700}",
+             100.0 + i % 400, 20.0 + i % 80, 80.0 + i % 320, start + timedelta(seconds=i))
+            for i in range(chunk_start, chunk_end)
+        ]
+        rss_samples.append(current_rss_mb())
+
+
+def run_benchmark(args) -> dict:
+    exporter = ExportService(TransactionStore(), MVPService(), HackathonService(),
+                             tempfile.mkdtemp(prefix="exports_"), chunk_size=args.chunk_size)
+    metrics = {"transactions": args.transactions}
+    for export_format in args.formats.split(","):
+        path = os.path.join(exporter.output_dir, f"transactions.{export_format}")
+        baseline = current_rss_mb()
+        rss_samples = []
+        start = time.perf_counter()
+        rows = exporter.write(path, export_format, TRANSACTION_COLUMNS, generate_chunks(args, rss_samples))
+        seconds = time.perf_counter() - start
+        metrics[f"{export_format}_rows_per_second"] = rows / seconds
+        metrics[f"{export_format}_file_mb"] = os.path.getsize(path) / (1024 * 1024)
+        metrics[f"{export_format}_rss_growth_mb"] = max(rss_samples) - baseline
+        os.remove(path)
+    return metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming export benchmark")
+    parser.add_argument("--transactions", type=int, default=10_000_000)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--formats", default="csv,parquet")
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["csv_rows_per_second", "parquet_rows_per_second",
+                                          "csv_rss_growth_mb", "parquet_rss_growth_mb"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>26}: {value:,.3f}" if isinstance(value, float) else f"{key:>26}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
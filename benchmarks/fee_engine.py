@@ -0,0 +1,93 @@
+"""Batch fee computation over integer cents.
+
+Splits N random transaction amounts into platform fee and creator share with
+the vectorized engine, checks the totals against the scalar path and that
+repeated runs give identical results. Euro amounts ending in half a cent
+must also convert to the same cents in both paths.
+
+    python -m benchmarks.fee_engine --transactions 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._0_domain.money import to_cents
+from src._1_use_cases.fee_engine import FeeEngine, to_cents_array
+from benchmarks.results import peak_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "fee_engine"
+
+
+def run_benchmark(args) -> dict:
+    rng = np.random.default_rng(args.seed)
+    # Amounts between €1 and €5,000 in cents
+    amounts = rng.integers(100, 500_000, size=args.transactions, dtype=np.int64)
+    engine = FeeEngine()
+
+    timings = []
+    totals = None
+    reproducible = True
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = engine.batch_totals(amounts)
+        timings.append(time.perf_counter() - start)
+        reproducible = reproducible and (totals is None or result == totals)
+        totals = result
+
+    # The scalar path used for single payments must agree cent for cent
+    sample = amounts[:args.scalar_sample]
+    start = time.perf_counter()
+    scalar_fees = sum(engine.fee_cents(int(amount)) for amount in sample)
+    scalar_seconds = time.perf_counter() - start
+    batch_fees, _ = engine.split_batch(sample)
+
+    # Half cents, where binary floats like 1.005 sit just below the decimal
+    half_cents = (sample * 10 + 5) / 1000
+    batch_cents = to_cents_array(half_cents)
+    scalar_cents = [to_cents(float(amount)) for amount in half_cents]
+
+    best = min(timings)
+    return {
+        "transactions": args.transactions,
+        "batch_ms": best * 1000,
+        "transactions_per_second": args.transactions / best,
+        "scalar_us_per_transaction": scalar_seconds / len(sample) * 1e6,
+        "platform_fee_cents": totals["platform_fee_cents"],
+        "parts_add_up": totals["platform_fee_cents"] + totals["creator_amount_cents"] == totals["amount_cents"],
+        "matches_scalar": scalar_fees == int(batch_fees.sum()),
+        "cents_match_scalar": batch_cents.tolist() == scalar_cents,
+        "reproducible": reproducible,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fee engine benchmark")
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scalar-sample", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["batch_ms", "transactions_per_second", "reproducible"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>26}: {value:,.3f}" if isinstance(value, float) else f"{key:>26}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
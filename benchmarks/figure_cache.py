@@ -0,0 +1,104 @@
+"""Admin chart render cost with and without the shared figure cache.
+
+Builds the Funding Trends figure over a year of daily rollups the way the
+Admin Dashboard does (DataFrame, px.line, JSON), then times the cached path
+of a repeat render: cache lookup plus loading the stored JSON into a
+figure without re-validating it.
+
+    python -m benchmarks.figure_cache --transactions 200000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from src._0_domain.transaction import Transaction
+from src._1_use_cases.figure_cache import FigureCache
+from src._1_use_cases.funding_rollups import FundingRollups
+from benchmarks.results import percentile, record_result, print_comparison
+
+BENCHMARK_NAME = "figure_cache"
+
+
+def timed(fn, repeat: int) -> float:
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return percentile(latencies, 50)
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    end = datetime(2026, 1, 1)
+    rollups = FundingRollups()
+    rollups.add_transactions([
+        Transaction(
+            seq=i, payment_id=f"tr_{i}", mvp_id="mvp001", backer_id=f"b{i % 5000}", creator_id="c1",
+            amount=100.0, platform_fee=20.0, creator_amount=80.0, kind="funding",
+            created_at=end - timedelta(seconds=rng.uniform(0, 365 * 86400))
+        )
+        for i in range(args.transactions)
+    ])
+
+    def build_figure():
+        df = pd.DataFrame(rollups.get_series(end - timedelta(days=365), end, "day"))
+        df = df.rename(columns={"bucket": "Date", "cumulative": "Funding", "volume": "Volume", "backers": "Backers"})
+        fig = px.line(df, x="Date", y="Funding", hover_data=["Volume", "Backers"],
+                      title="Cumulative Funding Over Time", color_discrete_sequence=["#00FFE1"])
+        fig.update_layout(plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)", font_color="#FFFFFF")
+        return fig.to_json()
+
+    cache = FigureCache()
+    cached_render = lambda: go.Figure(
+        json.loads(cache.get("funding_trends", ("year",), (rollups.version,), build_figure)), _validate=False
+    )
+    cached_render()
+
+    uncached_ms = timed(build_figure, args.repeat)
+    cached_ms = timed(cached_render, args.repeat)
+    return {
+        "transactions": args.transactions,
+        "uncached_render_ms": uncached_ms,
+        "cached_render_ms": cached_ms,
+        "speedup": uncached_ms / cached_ms,
+        "figure_kb": cache.size_bytes / 1024,
+        "cache_hits": cache.stats["hits"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Figure cache benchmark")
+    parser.add_argument("--transactions", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["uncached_render_ms", "cached_render_ms"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>20}: {value:,.3f}" if isinstance(value, float) else f"{key:>20}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
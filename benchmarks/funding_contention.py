@@ -0,0 +1,101 @@
+"""Funding counter stress test under thread contention.
+
+Many threads back one hot MVP at once (optionally spread over several MVPs)
+through MVPService.add_funding, then the totals are checked for lost
+updates. `--unsafe` runs the old unlocked read-modify-write for comparison;
+on GIL builds its lost updates are rare, on free-threaded builds they are not.
+
+    python -m benchmarks.funding_contention --threads 32 --ops 20000
+    python -m benchmarks.funding_contention --threads 32 --ops 20000 --unsafe
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._0_domain.mvp import MVPStatus
+from src._1_use_cases.mvp_service import MVPService
+from benchmarks.results import peak_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "funding_contention"
+
+
+def unsafe_add_funding(service: MVPService, mvp_id: str, amount: float, backer_id: str) -> bool:
+    """The previous, unlocked implementation"""
+    mvp = service.get_mvp(mvp_id)
+    if mvp and mvp.status in [MVPStatus.SUBMITTED, MVPStatus.FUNDED]:
+        mvp.current_funding += amount
+        mvp.backers_count += 1
+        return True
+    return False
+
+
+def run_benchmark(args) -> dict:
+    service = MVPService()
+    mvps = [mvp for mvp in service.get_all_mvps()
+            if mvp.status in [MVPStatus.SUBMITTED, MVPStatus.FUNDED]][:args.mvps]
+    before = {mvp.id: (mvp.current_funding, mvp.backers_count) for mvp in mvps}
+    add_funding = (lambda *a: unsafe_add_funding(service, *a)) if args.unsafe else service.add_funding
+    # Tiny switch interval makes the interpreter interleave threads aggressively
+    sys.setswitchinterval(args.switch_interval)
+
+    barrier = threading.Barrier(args.threads + 1)
+
+    def backer(thread_index: int):
+        barrier.wait()
+        for i in range(args.ops):
+            mvp = mvps[(thread_index + i) % len(mvps)]
+            add_funding(mvp.id, 1.0, f"backer{thread_index}")
+
+    threads = [threading.Thread(target=backer, args=(t,)) for t in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    total_ops = args.threads * args.ops
+    funding_added = sum(mvp.current_funding - before[mvp.id][0] for mvp in mvps)
+    backers_added = sum(mvp.backers_count - before[mvp.id][1] for mvp in mvps)
+    return {
+        "operations": total_ops,
+        "elapsed_seconds": elapsed,
+        "operations_per_second": total_ops / elapsed,
+        "lost_funding_updates": int(round(total_ops - funding_added)),
+        "lost_backer_updates": total_ops - backers_added,
+        "exact_totals": funding_added == total_ops and backers_added == total_ops,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Funding counter contention stress test")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--ops", type=int, default=20000, help="Fundings per thread")
+    parser.add_argument("--mvps", type=int, default=1, help="Number of hot MVPs")
+    parser.add_argument("--switch-interval", type=float, default=1e-6)
+    parser.add_argument("--unsafe", action="store_true", help="Use the old unlocked update")
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["operations_per_second", "lost_funding_updates", "exact_totals"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>22}: {value:,.3f}" if isinstance(value, float) else f"{key:>22}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Funding rollup ingest rate and chart series latency.
+
+Feeds N transactions over two years into the rollups, then times a
+one-year daily series and a 7-day hourly series against a naive scan of
+every transaction.
+
+    python -m benchmarks.funding_rollups --transactions 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._0_domain.transaction import Transaction
+from src._1_use_cases.funding_rollups import FundingRollups
+from benchmarks.results import percentile, peak_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "funding_rollups"
+
+
+def timed(fn, repeat: int):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return result, percentile(latencies, 50)
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    end = datetime(2026, 1, 1)
+    span = timedelta(days=730).total_seconds()
+    transactions = []
+    for i in range(args.transactions):
+        amount = float(rng.randint(10, 500))
+        transactions.append(Transaction(
+            seq=i, payment_id=f"tr_{i}", mvp_id="mvp001", backer_id=f"b{i % 5000}", creator_id="c1",
+            amount=amount, platform_fee=amount * 0.2, creator_amount=amount * 0.8,
+            kind="refund" if rng.random() < 0.02 else "funding",
+            created_at=end - timedelta(seconds=span * (1 - i / args.transactions))
+        ))
+
+    rollups = FundingRollups()
+    start = time.perf_counter()
+    for chunk_start in range(0, len(transactions), 1000):
+        rollups.add_transactions(transactions[chunk_start:chunk_start + 1000])
+    ingest_seconds = time.perf_counter() - start
+
+    year_start = end - timedelta(days=365)
+    year, year_ms = timed(lambda: rollups.get_series(year_start, end, "day"), args.repeat)
+    _, week_ms = timed(lambda: rollups.get_series(end - timedelta(days=7), end, "hour"), args.repeat)
+
+    def naive_year():
+        daily = {}
+        for t in transactions:
+            if year_start <= t.created_at <= end:
+                day = t.created_at.date()
+                daily[day] = daily.get(day, 0.0) + (-t.amount if t.is_refund else t.amount)
+        return daily
+    _, naive_ms = timed(naive_year, 1)
+
+    expected_total = sum(-t.amount if t.is_refund else t.amount for t in transactions)
+    return {
+        "transactions": args.transactions,
+        "ingest_per_second": args.transactions / ingest_seconds,
+        "year_daily_series_ms": year_ms,
+        "week_hourly_series_ms": week_ms,
+        "naive_year_scan_ms": naive_ms,
+        "exact_totals": abs(year[-1]["cumulative"] - expected_total) < 0.005,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Funding rollups benchmark")
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["ingest_per_second", "year_daily_series_ms", "week_hourly_series_ms"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>22}: {value:,.3f}" if isinstance(value, float) else f"{key:>22}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
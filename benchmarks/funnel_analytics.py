@@ -0,0 +1,158 @@
+"""Funnel analytics rebuild, refresh and event cost.
+
+Registers H hackathons and N MVPs with T backings in the transaction store,
+then times the nightly rebuild, a report after a round of MVP events, and
+the same funnel computed with a plain Python loop over every MVP.
+
+    python -m benchmarks.funnel_analytics --mvps 500000 --transactions 2000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._0_domain.hackathon import Hackathon, HackathonStatus, Venue
+from src._0_domain.mvp import MVP, MVPStatus
+from src._1_use_cases.funnel_analytics import FunnelAnalytics
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.transaction_store import TransactionStore
+from benchmarks.results import current_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "funnel_analytics"
+THEMES = ["Climate", "FinTech", "Health", "Education", "Mobility", "Civic", ""]
+CITIES = ["Warsaw", "Krakow", "Gdansk", "Berlin", "Amsterdam", "Lisbon", "Prague"]
+
+
+def populate(args):
+    rng = random.Random(args.seed)
+    start = datetime(2024, 1, 1)
+    hackathons, mvps = HackathonService(), MVPService()
+    for i in range(args.hackathons):
+        opened = start + timedelta(days=rng.randrange(600))
+        hackathons._hackathons[f"bh{i}"] = Hackathon(
+            id=f"bh{i}", title=f"Hackathon {i}", description="",
+            venue=Venue("Venue", f"Street {i}, {rng.choice(CITIES)}", 0.0, 0.0, 100),
+            start_datetime=opened, end_datetime=opened + timedelta(days=2), max_participants=500,
+            current_participants=rng.randint(20, 400), status=HackathonStatus.COMPLETED, theme=rng.choice(THEMES)
+        )
+    for i in range(args.mvps):
+        status = rng.choice([MVPStatus.DRAFT, MVPStatus.SUBMITTED, MVPStatus.SUBMITTED, MVPStatus.FUNDED])
+        mvps._mvps[f"bm{i}"] = MVP(id=f"bm{i}", hackathon_id=f"bh{rng.randrange(args.hackathons)}",
+                                   creator_id=f"user{i % 5000}", title=f"MVP {i}", description="",
+                                   tech_stack=[], status=status)
+
+    store = TransactionStore()
+    store.add_many(
+        {"payment_id": f"tr_{i}", "mvp_id": f"bm{rng.randrange(args.mvps)}", "backer_id": f"backer{i % 20_000}",
+         "creator_id": "c1", "amount": 100.0, "platform_fee": 20.0, "creator_amount": 80.0, "kind": "funding",
+         "created_at": start + timedelta(seconds=rng.uniform(0, 700 * 86400))}
+        for i in range(args.transactions)
+    )
+    return hackathons, mvps, store
+
+
+def naive_funnel(hackathons: HackathonService, mvps: MVPService, store: TransactionStore) -> dict:
+    """Per-hackathon funnel the way a page would compute it without the module"""
+    first_funded = {}
+    for transactions in store.iter_chunks():
+        for transaction in transactions:
+            if transaction.mvp_id not in first_funded or transaction.created_at < first_funded[transaction.mvp_id]:
+                first_funded[transaction.mvp_id] = transaction.created_at
+    funnel = {}
+    for mvp in mvps.get_all_mvps():
+        row = funnel.setdefault(mvp.hackathon_id, {"mvps": 0, "submitted": 0, "funded": 0, "days": []})
+        row["mvps"] += 1
+        row["submitted"] += mvp.status != MVPStatus.DRAFT
+        if mvp.id in first_funded:
+            row["funded"] += 1
+            end = hackathons.get_hackathon(mvp.hackathon_id).end_datetime
+            row["days"].append(max((first_funded[mvp.id] - end).total_seconds(), 0) / 86400)
+    for row in funnel.values():
+        row["median_days"] = statistics.median(row["days"]) if row["days"] else None
+    return funnel
+
+
+def run_benchmark(args) -> dict:
+    hackathons, mvps, store = populate(args)
+    rss_before = current_rss_mb()
+
+    start = time.perf_counter()
+    funnel = FunnelAnalytics(hackathons, mvps, store)
+    rebuild_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report = funnel.get_report()
+    first_report_ms = (time.perf_counter() - start) * 1000
+
+    rng = random.Random(args.seed + 1)
+    targets = [f"bm{rng.randrange(args.mvps)}" for _ in range(args.events)]
+    start = time.perf_counter()
+    for mvp_id in targets:
+        mvps.update_mvp_status(mvp_id, MVPStatus.SUBMITTED)
+    events_per_second = args.events / (time.perf_counter() - start)
+
+    funnel.refresh_interval = timedelta(0)
+    start = time.perf_counter()
+    report = funnel.get_report()
+    refresh_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    funnel.get_report()
+    cached_report_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    expected = naive_funnel(hackathons, mvps, store)
+    naive_seconds = time.perf_counter() - start
+
+    by_hackathon = report["by_hackathon"].set_index("hackathon")
+    exact = all(
+        by_hackathon.loc[f"Hackathon {hackathon_id[2:]}", ["mvps", "submitted", "funded"]].tolist()
+        == [row["mvps"], row["submitted"], row["funded"]]
+        and abs(by_hackathon.loc[f"Hackathon {hackathon_id[2:]}", "median_days_to_funding"] - row["median_days"]) < 1e-6
+        for hackathon_id, row in expected.items() if row["median_days"] is not None
+    )
+    return {
+        "mvps": args.mvps,
+        "transactions": args.transactions,
+        "rebuild_seconds": rebuild_seconds,
+        "first_report_ms": first_report_ms,
+        "mvp_events_per_second": events_per_second,
+        "refresh_ms": refresh_ms,
+        "cached_report_ms": cached_report_ms,
+        "naive_seconds": naive_seconds,
+        "state_mb": current_rss_mb() - rss_before,
+        "exact": exact,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Funnel analytics benchmark")
+    parser.add_argument("--hackathons", type=int, default=2_000)
+    parser.add_argument("--mvps", type=int, default=500_000)
+    parser.add_argument("--transactions", type=int, default=2_000_000)
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["rebuild_seconds", "refresh_ms", "naive_seconds"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>22}: {value:,.3f}" if isinstance(value, float) else f"{key:>22}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Cost of the section timing hooks.
+
+Times a bare call through the timing wrapper (on and off) against a plain
+call, then a rerun-sized batch of service queries over N MVPs with the
+services plain and instrumented the way utils/shared_services.py does it.
+
+    python -m benchmarks.instrumentation --mvps 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._0_domain.mvp import MVP, MVPStatus
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.kpi_service import KPIService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.timing_registry import TimingRegistry
+from src._1_use_cases.transaction_store import TransactionStore
+from benchmarks.results import record_result, print_comparison
+
+BENCHMARK_NAME = "instrumentation"
+
+
+def per_call_ns(fn, calls: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter_ns() - start) / calls)
+    return best
+
+
+def build_services(args):
+    rng = random.Random(args.seed)
+    hackathons, mvps = HackathonService(), MVPService()
+    start = datetime(2024, 1, 1)
+    for i in range(args.mvps):
+        mvps._mvps[f"bench{i}"] = MVP(id=f"bench{i}", hackathon_id="hack001", creator_id=f"user{i % 5000}",
+                                      title=f"MVP {i}", description="", tech_stack=["Python"],
+                                      current_funding=float(rng.randint(0, 50_000)),
+                                      status=MVPStatus.SUBMITTED, submission_datetime=start + timedelta(minutes=i))
+    store = TransactionStore()
+    store.add_many(
+        {"payment_id": f"tr_{i}", "mvp_id": f"bench{rng.randrange(args.mvps)}", "backer_id": f"backer{i % 2000}",
+         "creator_id": "c1", "amount": 100.0, "platform_fee": 20.0, "creator_amount": 80.0, "kind": "funding",
+         "created_at": start + timedelta(seconds=i * 30)}
+        for i in range(args.mvps)
+    )
+    return hackathons, mvps, KPIService(hackathons, mvps), store
+
+
+def rerun(hackathons, mvps, kpis, store):
+    """The service calls of one Admin Dashboard rerun"""
+    hackathons.get_all_hackathons()
+    mvps.get_all_mvps()
+    kpis.get_metrics()
+    kpis.get_deltas()
+    hackathons.query_hackathons()
+    mvps.query_mvps()
+    mvps.query_mvps(sort_by="funding", page=3)
+    store.get_latest(20)
+    store.get_by_investor("backer7", 20)
+
+
+def instrument(registry: TimingRegistry, hackathons, mvps, kpis, store):
+    registry.instrument(hackathons, "hackathon_service", ["get_all_hackathons", "query_hackathons"])
+    registry.instrument(mvps, "mvp_service", ["get_all_mvps", "query_mvps"])
+    registry.instrument(kpis, "kpi_service", ["get_metrics", "get_deltas"])
+    registry.instrument(store, "transaction_store", ["get_latest", "get_by_investor"])
+
+
+def run_benchmark(args) -> dict:
+    registry = TimingRegistry()
+    noop = lambda: None
+    wrapped = registry.wrap("noop", noop)
+    plain_ns = per_call_ns(noop, args.calls)
+    enabled_ns = per_call_ns(wrapped, args.calls)
+    registry.enabled = False
+    disabled_ns = per_call_ns(wrapped, args.calls)
+    registry.enabled = True
+    registry.reset()
+
+    services = build_services(args)
+    rerun(*services)  # Build the catalog views once
+    plain_runs, timed_runs = [], []
+    for _ in range(args.reruns):
+        start = time.perf_counter()
+        rerun(*services)
+        plain_runs.append(time.perf_counter() - start)
+    instrument(registry, *services)
+    for _ in range(args.reruns):
+        start = time.perf_counter()
+        rerun(*services)
+        timed_runs.append(time.perf_counter() - start)
+    plain_runs.sort()
+    timed_runs.sort()
+    plain_median, timed_median = plain_runs[len(plain_runs) // 2], timed_runs[len(timed_runs) // 2]
+
+    hooks_per_rerun = sum(section["calls"] for section in registry.snapshot()) / args.reruns
+    return {
+        "mvps": args.mvps,
+        "plain_call_ns": plain_ns,
+        "timed_call_overhead_ns": enabled_ns - plain_ns,
+        "disabled_call_overhead_ns": disabled_ns - plain_ns,
+        "rerun_ms": plain_median * 1000,
+        "timed_rerun_ms": timed_median * 1000,
+        "hooks_per_rerun": hooks_per_rerun,
+        # Hook cost over rerun time is steadier than the difference of two noisy medians
+        "overhead_pct": hooks_per_rerun * (enabled_ns - plain_ns) / (plain_median * 1e9) * 100,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Section timing overhead benchmark")
+    parser.add_argument("--mvps", type=int, default=100_000)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--reruns", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["timed_call_overhead_ns", "overhead_pct"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>26}: {value:,.3f}" if isinstance(value, float) else f"{key:>26}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
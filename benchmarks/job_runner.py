@@ -0,0 +1,111 @@
+"""Background job throughput on one worker versus the full process pool.
+
+Writes a transactions export of N rows once, then submits K transaction
+audits and times until all finish, first with a single worker process and
+then with one per core. Also reports the cost of polling job status.
+
+    python -m benchmarks.job_runner --transactions 1000000 --jobs 4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._1_use_cases import admin_jobs
+from src._1_use_cases.export_service import ExportService, TRANSACTION_COLUMNS
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.job_runner import JobRunner
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.transaction_store import TransactionStore
+from benchmarks.results import percentile, record_result, print_comparison
+
+BENCHMARK_NAME = "job_runner"
+
+
+def write_export(args, output_dir: str) -> dict:
+    exporter = ExportService(TransactionStore(), MVPService(), HackathonService(), output_dir)
+    start = datetime(2023, 1, 1)
+
+    def chunks():
+        for chunk_start in range(0, args.transactions, 50_000):
+            yield [
+                (f"tr_{i}", "funding", f"mvp{i % 2000}", f"backer{i % 50_000}", f"creator{i % 700}",
+                 100.0 + i % 400, 20.0 + i % 80, 80.0 + i % 320, start + timedelta(seconds=i))
+                for i in range(chunk_start, min(chunk_start + 50_000, args.transactions))
+            ]
+    path = os.path.join(output_dir, "transactions.csv")
+    rows = exporter.write(path, "csv", TRANSACTION_COLUMNS, chunks())
+    return {"path": path, "filename": "transactions.csv", "rows": rows}
+
+
+def run_jobs(args, workers: int, export: dict, jobs_dir: str):
+    runner = JobRunner(jobs_dir, max_workers=workers)
+    runner.register("export_ready", lambda context: export, in_process=True)
+    runner.register("transaction_audit", admin_jobs.audit_transactions)
+    # Warm the pool so process start-up is not timed
+    ready = runner.submit("export_ready")
+    while not runner.get_job(ready.id).is_finished:
+        time.sleep(0.01)
+
+    start = time.perf_counter()
+    jobs = [runner.submit("transaction_audit", after=ready.id) for _ in range(args.jobs)]
+    poll_latencies = []
+    while True:
+        poll_start = time.perf_counter()
+        finished = all(job.is_finished for job in runner.list_jobs(limit=args.jobs + 1))
+        poll_latencies.append((time.perf_counter() - poll_start) * 1000)
+        if finished:
+            break
+        time.sleep(0.05)
+    seconds = time.perf_counter() - start
+    runner.shutdown()
+    failed = [job for job in jobs if runner.get_job(job.id).status.value != "succeeded"]
+    poll_latencies.sort()
+    return seconds, percentile(poll_latencies, 99), len(failed)
+
+
+def run_benchmark(args) -> dict:
+    work_dir = tempfile.mkdtemp(prefix="jobs_")
+    export = write_export(args, work_dir)
+    cores = os.cpu_count() or 1
+    single_seconds, _, single_failed = run_jobs(args, 1, export, os.path.join(work_dir, "single"))
+    pool_seconds, poll_p99_ms, pool_failed = run_jobs(args, cores, export, os.path.join(work_dir, "pool"))
+    return {
+        "transactions": args.transactions,
+        "jobs": args.jobs,
+        "cores": cores,
+        "one_worker_seconds": single_seconds,
+        "pool_seconds": pool_seconds,
+        "speedup": single_seconds / pool_seconds,
+        "status_poll_p99_ms": poll_p99_ms,
+        "failed_jobs": single_failed + pool_failed,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Background job runner benchmark")
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["one_worker_seconds", "pool_seconds", "status_poll_p99_ms"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>20}: {value:,.3f}" if isinstance(value, float) else f"{key:>20}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
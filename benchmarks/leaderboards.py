@@ -0,0 +1,111 @@
+"""Leaderboard update rate and top-k read latency.
+
+Registers N MVPs, applies funding events to random MVPs and feeds matching
+transactions to the investor rankings, then times top-k reads against
+sorting every MVP as the Investor Feed used to.
+
+    python -m benchmarks.leaderboards --mvps 100000 --events 200000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._0_domain.mvp import MVP, MVPStatus
+from src._0_domain.transaction import Transaction
+from src._1_use_cases.leaderboard_service import LeaderboardService
+from src._1_use_cases.mvp_service import MVPService
+from benchmarks.results import percentile, record_result, print_comparison
+
+BENCHMARK_NAME = "leaderboards"
+
+
+def timed(fn, repeat: int):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return percentile(latencies, 50), percentile(latencies, 99)
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    now = datetime(2026, 3, 15, 12)
+    service = MVPService()
+    for i in range(args.mvps):
+        service._mvps[f"bench{i}"] = MVP(id=f"bench{i}", hackathon_id="hack001", creator_id=f"user{i % 5000}",
+                                         title=f"MVP {i}", description="", tech_stack=[],
+                                         status=MVPStatus.SUBMITTED)
+    leaderboards = LeaderboardService(service, clock=lambda: now)
+
+    events = [(f"bench{rng.randrange(args.mvps)}", float(rng.randint(10, 500))) for _ in range(args.events)]
+    start = time.perf_counter()
+    for mvp_id, amount in events:
+        service.add_funding(mvp_id, amount, "bench")
+    mvp_events_per_second = args.events / (time.perf_counter() - start)
+
+    transactions = [
+        Transaction(seq=i, payment_id=f"tr_{i}", mvp_id=mvp_id, backer_id=f"backer{rng.randrange(args.investors)}",
+                    creator_id="c1", amount=amount, platform_fee=amount * 0.2, creator_amount=amount * 0.8,
+                    kind="funding", created_at=now - timedelta(seconds=rng.uniform(0, 60 * 86400)))
+        for i, (mvp_id, amount) in enumerate(events)
+    ]
+    start = time.perf_counter()
+    for chunk_start in range(0, len(transactions), 1000):
+        leaderboards.add_transactions(transactions[chunk_start:chunk_start + 1000])
+    transactions_per_second = len(transactions) / (time.perf_counter() - start)
+
+    metrics = {
+        "mvps": args.mvps,
+        "mvp_events_per_second": mvp_events_per_second,
+        "transactions_per_second": transactions_per_second,
+    }
+    reads = {
+        "top_mvps": lambda: leaderboards.top_mvps_by_funding(args.k),
+        "top_investors_month": lambda: leaderboards.top_investors(args.k),
+        "top_investors_rolling": lambda: leaderboards.top_investors_rolling(args.k),
+        "naive_sort": lambda: sorted(service.get_all_mvps(), key=lambda mvp: mvp.current_funding, reverse=True)[:args.k],
+    }
+    for name, read in reads.items():
+        p50, p99 = timed(read, args.repeat)
+        metrics[f"{name}_p50_ms"] = p50
+        metrics[f"{name}_p99_ms"] = p99
+
+    expected = sorted(service.get_all_mvps(), key=lambda mvp: (-mvp.current_funding, mvp.id))[:args.k]
+    metrics["exact"] = [mvp.id for mvp in expected] == [mvp.id for mvp in leaderboards.top_mvps_by_funding(args.k)]
+    return metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Leaderboard benchmark")
+    parser.add_argument("--mvps", type=int, default=100_000)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--investors", type=int, default=20_000)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["mvp_events_per_second", "top_mvps_p99_ms", "top_investors_month_p99_ms"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>28}: {value:,.3f}" if isinstance(value, float) else f"{key:>28}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Mollie client throughput and latency against the local stub server.
+
+Compares the pooled keep-alive client with one connection per request.
+
+    python -m benchmarks.mollie_client --requests 5000 --concurrency 50
+    python -m benchmarks.mollie_client --compare
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Dict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._2_adapters.mollie_client import AsyncMollieClient
+from src._2_adapters.mollie_stub_server import MollieStubServer
+from benchmarks.results import percentile, peak_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "mollie_client"
+
+
+async def drive(client: AsyncMollieClient, requests: int, concurrency: int) -> Dict:
+    """Create payments and poll their status, half and half"""
+    latencies_ms = []
+    payment_ids = []
+    queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(i)
+
+    async def worker():
+        while not queue.empty():
+            i = queue.get_nowait()
+            start = time.perf_counter()
+            if i % 2 == 0 or not payment_ids:
+                payment = await client.create_payment({
+                    "amount": 25.0, "description": "Benchmark", "mvp_id": "mvp001", "backer_id": f"b{i}"
+                })
+                payment_ids.append(payment["id"])
+            else:
+                await client.get_payment(payment_ids[i % len(payment_ids)])
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies_ms.sort()
+    return {
+        "elapsed_seconds": elapsed,
+        "requests_per_second": requests / elapsed,
+        "p50_ms": percentile(latencies_ms, 50),
+        "p99_ms": percentile(latencies_ms, 99),
+        "p999_ms": percentile(latencies_ms, 99.9),
+    }
+
+
+async def run_benchmark(args) -> Dict:
+    server = MollieStubServer(latency_ms=args.latency_ms)
+    await server.start()
+    metrics = {}
+    try:
+        for mode, keep_alive in (("pooled", True), ("per_request", False)):
+            if mode == "per_request" and args.pooled_only:
+                continue
+            connections_before = server.connection_count
+            client = AsyncMollieClient(
+                api_key="test_benchmark", base_url=server.base_url,
+                max_connections=args.connections, max_concurrency=args.concurrency,
+                timeout=args.timeout, keep_alive=keep_alive
+            )
+            result = await drive(client, args.requests, args.concurrency)
+            await client.close()
+            result["connections_opened"] = server.connection_count - connections_before
+            metrics.update({f"{mode}_{key}": value for key, value in result.items()})
+    finally:
+        await server.stop()
+
+    metrics["peak_rss_mb"] = peak_rss_mb()
+    return metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mollie client benchmark against the stub server")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--connections", type=int, default=20, help="Pool size")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Stub server latency")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--pooled-only", action="store_true")
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, [
+            "pooled_requests_per_second", "pooled_p99_ms",
+            "per_request_requests_per_second", "per_request_p99_ms"
+        ])
+        return
+
+    metrics = asyncio.run(run_benchmark(args))
+    for key, value in metrics.items():
+        print(f"{key:>36}: {value:,.3f}" if isinstance(value, float) else f"{key:>36}: {value:,}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Bulk reconciliation of open payments against the local Mollie stub.
+
+Seeds the stub with open payments, settles a share of them behind the
+platform's back (as if their webhooks were lost), then reconciles. The run is
+interrupted part-way, the payment service and webhook processor are rebuilt
+from their databases as after a restart, and the run resumes from its
+checkpoint to show nothing is fetched twice or applied twice.
+
+    python -m benchmarks.reconciliation --payments 100000 --concurrency 32
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._1_use_cases.payment_service import PaymentService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.funding_ledger import FundingLedger
+from src._1_use_cases.webhook_processor import WebhookProcessor
+from src._1_use_cases.payment_reconciler import PaymentReconciler
+from src._2_adapters.mollie_client import MollieClient
+from src._2_adapters.mollie_stub_server import MollieStubServer
+from src._2_adapters.payment_registry import PaymentRegistry
+from src._2_adapters.webhook_queue import WebhookQueue
+from benchmarks.results import peak_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "reconciliation"
+
+# Share of open payments that settled while their webhooks were lost
+SETTLED_STATUSES = (("paid", 0.4), ("failed", 0.1), ("expired", 0.1))
+
+
+def seed(server: MollieStubServer, payment_service: PaymentService, mvp_ids, args, rng) -> dict:
+    """Create open payments directly in the stub and the payment registry"""
+    expected = {mvp_id: 0.0 for mvp_id in mvp_ids}
+    paid = 0
+    now = datetime.now().isoformat()
+    for i in range(args.payments):
+        payment_id = f"tr_rec{i:010d}"
+        mvp_id = rng.choice(mvp_ids)
+        amount = float(rng.randint(10, 500))
+
+        status, roll = "open", rng.random()
+        for settled_status, share in SETTLED_STATUSES:
+            if roll < share:
+                status = settled_status
+                break
+            roll -= share
+
+        server.payments[payment_id] = {
+            "resource": "payment",
+            "id": payment_id,
+            "status": status,
+            "amount": {"currency": "EUR", "value": f"{amount:.2f}"},
+            "description": "Benchmark",
+            "metadata": {"mvp_id": mvp_id, "backer_id": f"backer{i % 1000}"},
+            "createdAt": now,
+        }
+        payment_service.register_payment(payment_id, amount, mvp_id, f"backer{i % 1000}")
+        if status == "paid":
+            expected[mvp_id] += amount
+            paid += 1
+    return {"expected": expected, "paid": paid}
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    server = MollieStubServer(latency_ms=args.latency_ms)
+    base_url = server.serve_in_thread()
+    client = MollieClient(api_key="test_benchmark", base_url=base_url,
+                          max_connections=args.connections, max_concurrency=args.concurrency)
+
+    mvp_service = MVPService()
+    ledger = FundingLedger()
+    mvp_ids = [mvp.id for mvp in mvp_service.get_all_mvps()]
+    funding_before = {mvp.id: mvp.current_funding for mvp in mvp_service.get_all_mvps()}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "webhooks.db")
+        checkpoint_path = os.path.join(tmp, "reconcile.json")
+        payment_service = PaymentService(mollie_adapter=client, registry=PaymentRegistry(db_path))
+        seeded = seed(server, payment_service, mvp_ids, args, rng)
+
+        def reconciler():
+            # Reopens the registry and queue from disk, as a restarted process does
+            payment_service = PaymentService(mollie_adapter=client, registry=PaymentRegistry(db_path))
+            processor = WebhookProcessor(payment_service, mvp_service, ledger, WebhookQueue(db_path))
+            return PaymentReconciler(payment_service, processor, checkpoint_path=checkpoint_path,
+                                     concurrency=args.concurrency, rate_limit=args.rate_limit,
+                                     batch_size=args.batch_size)
+
+        start = time.perf_counter()
+        # First run stops part-way, as if the process died; a new one resumes
+        first = reconciler().run(max_payments=int(args.payments * args.interrupt_at))
+        requests_before_resume = server.request_count
+        resuming = reconciler()
+        resumed = resuming.run()
+        elapsed = time.perf_counter() - start
+        still_open = resuming.payment_service.open_payment_count()
+
+    client.close()
+    exact = all(
+        abs(mvp_service.get_mvp(mvp_id).current_funding - funding_before[mvp_id] - seeded["expected"][mvp_id]) < 1e-6
+        for mvp_id in mvp_ids
+    )
+    return {
+        "payments": args.payments,
+        "elapsed_seconds": elapsed,
+        "payments_per_second": args.payments / elapsed,
+        "interrupted_after": first["checked"],
+        "resumed_from_seq": resumed["resumed_from"],
+        "status_requests": server.request_count,
+        "refetched_after_resume": server.request_count - requests_before_resume - (args.payments - first["checked"]),
+        "changed": resumed["changed"],
+        "ledger_entries": len(ledger),
+        "still_open": still_open,
+        "exact_totals": exact and len(ledger) == seeded["paid"] and resumed["completed"],
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Open payment reconciliation benchmark")
+    parser.add_argument("--payments", type=int, default=100000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--connections", type=int, default=32, help="Mollie client pool size")
+    parser.add_argument("--rate-limit", type=float, default=50000.0, help="Status lookups per second")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--interrupt-at", type=float, default=0.3, help="Fraction checked before the simulated crash")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Stub server latency")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["payments_per_second", "status_requests", "exact_totals"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>24}: {value:,.3f}" if isinstance(value, float) else f"{key:>24}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import json
+import math
+import os
+import platform
+import subprocess
+from datetime import datetime
+from typing import Dict, List
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def _git_revision() -> str:
+    """Short commit hash of the working tree, if available"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(RESULTS_DIR),
+            stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB (Linux)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        return 0.0
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def record_result(benchmark: str, params: Dict, metrics: Dict) -> Dict:
+    """Append a benchmark run to results/<benchmark>.jsonl"""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    run = {
+        "benchmark": benchmark,
+        "timestamp": datetime.now().isoformat(),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "params": params,
+        "metrics": metrics,
+    }
+    with open(os.path.join(RESULTS_DIR, f"{benchmark}.jsonl"), "a") as results_file:
+        results_file.write(json.dumps(run) + "\n")
+    return run
+
+
+def load_results(benchmark: str) -> List[Dict]:
+    """Load all recorded runs of a benchmark, oldest first"""
+    path = os.path.join(RESULTS_DIR, f"{benchmark}.jsonl")
+    if not os.path.exists(path):
+        return []
+    with open(path) as results_file:
+        return [json.loads(line) for line in results_file if line.strip()]
+
+
+def print_comparison(benchmark: str, metric_keys: List[str], last: int = 10):
+    """Print the most recent runs of a benchmark side by side"""
+    runs = load_results(benchmark)[-last:]
+    if not runs:
+        print(f"No recorded runs for {benchmark}")
+        return
+
+    header = ["timestamp", "revision"] + metric_keys
+    rows = []
+    for run in runs:
+        row = [run["timestamp"][:19], run["revision"]]
+        for key in metric_keys:
+            value = run["metrics"].get(key, "")
+            row.append(f"{value:.3f}" if isinstance(value, float) else str(value))
+        rows.append(row)
+
+    widths = [max(len(str(r[i])) for r in rows + [header]) for i in range(len(header))]
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)))
+    for row in rows:
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths)))
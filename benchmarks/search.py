@@ -0,0 +1,117 @@
+"""Full-text search indexing rate and query latency.
+
+Indexes N synthetic hackathons and MVPs whose words follow a Zipf-like
+distribution, then times one-, two- and three-word queries, a query
+restricted to one kind, and edits of already indexed documents.
+
+    python -m benchmarks.search --docs 1000000
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._1_use_cases.search_service import SearchIndex, SearchService
+from benchmarks.results import percentile, record_result, print_comparison, current_rss_mb
+
+BENCHMARK_NAME = "search"
+TECH = ["python", "react", "node.js", "rust", "go", "c++", "solidity", "pytorch", "fastapi", "postgres",
+        "kotlin", "swift", "flutter", "django", "tensorflow", "web3", "iot", "ai", "ml", "arduino"]
+
+
+def document(rng: random.Random, words: list, cum_weights: list, kind: str) -> dict:
+    fields = {
+        "title": " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(2, 5))),
+        "description": " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(15, 40))),
+    }
+    if kind == "mvp":
+        fields["tech_stack"] = rng.sample(TECH, rng.randint(1, 4))
+    else:
+        fields["tags"] = rng.sample(TECH, rng.randint(1, 3))
+        fields["theme"] = rng.choice(words[:50])
+    return fields
+
+
+def latencies_ms(index: SearchIndex, queries: list, kind=None):
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, 20, kind)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return percentile(latencies, 50), percentile(latencies, 99)
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    words = [f"w{i}" for i in range(args.vocabulary)]
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(args.vocabulary)))
+    index = SearchIndex(SearchService.FIELD_BOOSTS)
+
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    for i in range(args.docs):
+        kind = "hackathon" if i % 20 == 0 else "mvp"
+        index.add(kind, f"{kind}{i}", document(rng, words, cum_weights, kind))
+    index_seconds = time.perf_counter() - start
+    rss_after = current_rss_mb()
+
+    # Frequent, mid-frequency and rare words, alone and combined
+    common, middle, rare = words[:20], words[100:2000], words[5000:]
+    one_word = [rng.choice(common + middle + rare) for _ in range(args.queries)]
+    two_words = [f"{rng.choice(middle)} {rng.choice(common + TECH)}" for _ in range(args.queries)]
+    three_words = [f"{rng.choice(rare)} {rng.choice(middle)} {rng.choice(TECH)}" for _ in range(args.queries)]
+    frequent = [rng.choice(common) for _ in range(args.queries)]
+    results = {}
+    for name, queries, kind in (("one_word", one_word, None), ("two_words", two_words, None),
+                                ("three_words", three_words, None), ("frequent_word", frequent, None),
+                                ("hackathons_only", two_words, "hackathon")):
+        results[f"{name}_p50_ms"], results[f"{name}_p99_ms"] = latencies_ms(index, queries, kind)
+
+    start = time.perf_counter()
+    for _ in range(args.edits):
+        i = rng.randrange(args.docs)
+        kind = "hackathon" if i % 20 == 0 else "mvp"
+        index.add(kind, f"{kind}{i}", document(rng, words, cum_weights, kind))
+    edit_seconds = time.perf_counter() - start
+
+    return {
+        "docs": args.docs,
+        "terms": len(index._postings),
+        "docs_indexed_per_second": args.docs / index_seconds,
+        "index_rss_mb": rss_after - rss_before,
+        **results,
+        "edits_per_second": args.edits / edit_seconds,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full-text search benchmark")
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--vocabulary", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--edits", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["two_words_p50_ms", "two_words_p99_ms", "docs_indexed_per_second"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>26}: {value:,.3f}" if isinstance(value, float) else f"{key:>26}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Creator payout settlement throughput, memory and resume check.
+
+Fills a funding ledger with N entries (a share of them refunds) spread over
+creators and months, settles part of it, then resumes with a fresh service
+and checks the payout files add up to the ledger exactly.
+
+    python -m benchmarks.settlement --entries 2000000 --creators 5000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._0_domain.funding import FundingEntry, FundingEntryType
+from src._1_use_cases.fee_engine import FeeEngine
+from src._1_use_cases.funding_ledger import FundingLedger
+from src._1_use_cases.settlement_service import SettlementService
+from benchmarks.results import current_rss_mb, peak_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "settlement"
+
+
+def fill_ledger(ledger: FundingLedger, args, rng) -> int:
+    """Append entries in chunks; returns the expected sum of creator cents"""
+    engine = FeeEngine()
+    start = datetime(2025, 1, 1)
+    expected = 0
+    for chunk_start in range(0, args.entries, 10_000):
+        chunk = []
+        for i in range(chunk_start, min(chunk_start + 10_000, args.entries)):
+            amount = float(rng.randint(10, 500))
+            platform_fee, creator_amount = engine.split(amount)
+            refund = rng.random() < args.refund_share
+            chunk.append(FundingEntry(
+                payment_id=f"tr_{i}",
+                mvp_id=f"mvp{i % 500}",
+                backer_id=f"backer{i % 10_000}",
+                amount=amount,
+                platform_fee=platform_fee.amount,
+                creator_amount=creator_amount.amount,
+                entry_type=FundingEntryType.REFUND if refund else FundingEntryType.FUNDING,
+                creator_id=f"creator{rng.randrange(args.creators)}",
+                created_at=start + timedelta(minutes=i * 525_600 // args.entries)
+            ))
+            expected += -creator_amount.cents if refund else creator_amount.cents
+        ledger.append(chunk)
+    return expected
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    ledger = FundingLedger()
+    expected_cents = fill_ledger(ledger, args, rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rss_before = current_rss_mb()
+        start = time.perf_counter()
+        # Settle a few batches, then resume with a new service as after a restart
+        first = SettlementService(ledger, tmp, batch_size=args.batch_size).settle(max_batches=args.interrupt_after)
+        service = SettlementService(ledger, tmp, batch_size=args.batch_size)
+        rest = service.settle()
+        elapsed = time.perf_counter() - start
+        rss_growth = current_rss_mb() - rss_before
+
+        batches = list(service.iter_batches())
+        payout_cents = sum(
+            payout.amount_cents for batch in batches for payout in service.read_payouts(batch)
+        )
+        contiguous = all(a.to_offset == b.from_offset for a, b in zip(batches, batches[1:]))
+        # The state kept in memory across settle() must match a fresh read of the manifest
+        reread = SettlementService(ledger, tmp, batch_size=args.batch_size)
+        cached_state_exact = (service.get_state() == reread.get_state()
+                              and service.get_recent_batches() == reread.get_recent_batches() == batches[::-1][:10])
+
+    return {
+        "entries": args.entries,
+        "elapsed_seconds": elapsed,
+        "entries_per_second": args.entries / elapsed,
+        "batches": len(first) + len(rest),
+        "resumed_at_offset": rest[0].from_offset if rest else args.entries,
+        "rss_growth_mb": rss_growth,
+        "exact_totals": payout_cents == expected_cents and contiguous and batches[-1].to_offset == args.entries,
+        "cached_state_exact": cached_state_exact,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Payout settlement benchmark")
+    parser.add_argument("--entries", type=int, default=2_000_000)
+    parser.add_argument("--creators", type=int, default=5000)
+    parser.add_argument("--refund-share", type=float, default=0.05)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--interrupt-after", type=int, default=3, help="Batches settled before the simulated restart")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["entries_per_second", "rss_growth_mb", "exact_totals", "cached_state_exact"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>20}: {value:,.3f}" if isinstance(value, float) else f"{key:>20}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Transaction store ingest rate and paginated query latency.
+
+Loads N transactions spread over several years into the month-partitioned
+store, then times "latest", "by investor" and "by date range" page reads,
+following cursors a few pages deep.
+
+    python -m benchmarks.transaction_store --rows 5000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._1_use_cases.transaction_store import TransactionStore
+from benchmarks.results import percentile, peak_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "transaction_store"
+
+
+def generate(args, rng):
+    start = datetime(2022, 1, 1)
+    span_seconds = args.years * 365 * 86400
+    step = span_seconds / args.rows
+    for i in range(args.rows):
+        amount = float(rng.randint(10, 500))
+        yield {
+            "payment_id": f"tr_{i}",
+            "mvp_id": f"mvp{rng.randrange(args.mvps)}",
+            "backer_id": f"backer{rng.randrange(args.investors)}",
+            "creator_id": f"creator{rng.randrange(args.mvps // 3 + 1)}",
+            "amount": amount,
+            "platform_fee": amount * 0.2,
+            "creator_amount": amount * 0.8,
+            "kind": "funding",
+            "created_at": start + timedelta(seconds=i * step)
+        }
+
+
+def time_pages(query, pages: int, samples: int):
+    """Latency in ms of reading `pages` consecutive pages, per page"""
+    latencies = []
+    for sample in range(samples):
+        cursor = None
+        for _ in range(pages):
+            start = time.perf_counter()
+            page = query(sample, cursor)
+            latencies.append((time.perf_counter() - start) * 1000)
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+    latencies.sort()
+    return percentile(latencies, 50), percentile(latencies, 99)
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    store = TransactionStore()
+    start = time.perf_counter()
+    store.add_many(generate(args, rng))
+    ingest_seconds = time.perf_counter() - start
+
+    range_start = datetime(2022, 1, 1) + timedelta(days=args.years * 365 // 2)
+    queries = {
+        "latest": lambda i, cursor: store.get_latest(args.page_size, cursor),
+        "by_investor": lambda i, cursor: store.get_by_investor(f"backer{i % args.investors}", args.page_size, cursor),
+        "by_date_range": lambda i, cursor: store.get_by_date_range(
+            range_start + timedelta(days=i), range_start + timedelta(days=i + 45), args.page_size, cursor
+        ),
+    }
+    metrics = {
+        "rows": len(store),
+        "ingest_rows_per_second": args.rows / ingest_seconds,
+    }
+    for name, query in queries.items():
+        p50, p99 = time_pages(query, args.pages, args.samples)
+        metrics[f"{name}_p50_ms"] = p50
+        metrics[f"{name}_p99_ms"] = p99
+    metrics["peak_rss_mb"] = peak_rss_mb()
+    return metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transaction store benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--mvps", type=int, default=2000)
+    parser.add_argument("--investors", type=int, default=50_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=5, help="Pages followed per query")
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["ingest_rows_per_second", "latest_p99_ms", "by_investor_p99_ms",
+                                          "by_date_range_p99_ms"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>24}: {value:,.3f}" if isinstance(value, float) else f"{key:>24}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
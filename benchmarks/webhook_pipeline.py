@@ -0,0 +1,106 @@
+"""Webhook pipeline throughput and exactly-once check.
+
+Creates paid mock payments, delivers each webhook several times in random
+order and verifies that MVP funding and the ledger count every payment once.
+
+    python -m benchmarks.webhook_pipeline --payments 20000 --duplicates 3 --workers 4
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._1_use_cases.payment_service import PaymentService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.funding_ledger import FundingLedger
+from src._1_use_cases.webhook_processor import WebhookProcessor
+from src._2_adapters.webhook_queue import WebhookQueue
+from benchmarks.results import peak_rss_mb, record_result, print_comparison
+
+BENCHMARK_NAME = "webhook_pipeline"
+
+
+def run_benchmark(args) -> dict:
+    rng = random.Random(args.seed)
+    payment_service = PaymentService()
+    mvp_service = MVPService()
+    ledger = FundingLedger()
+    mvp_ids = [mvp.id for mvp in mvp_service.get_all_mvps()]
+    funding_before = {mvp.id: mvp.current_funding for mvp in mvp_service.get_all_mvps()}
+
+    expected = {mvp_id: 0.0 for mvp_id in mvp_ids}
+    payment_ids = []
+    for i in range(args.payments):
+        mvp_id = rng.choice(mvp_ids)
+        amount = float(rng.randint(10, 500))
+        payment = payment_service.create_payment(amount, "Benchmark", mvp_id, f"backer{i % 1000}")
+        payment_service.simulate_payment_completion(payment["payment_id"])
+        payment_ids.append(payment["payment_id"])
+        expected[mvp_id] += amount
+
+    deliveries = payment_ids * args.duplicates
+    rng.shuffle(deliveries)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = WebhookQueue(os.path.join(tmp, "webhooks.db"))
+        processor = WebhookProcessor(payment_service, mvp_service, ledger, queue, batch_size=args.batch_size)
+
+        start = time.perf_counter()
+        for payment_id in deliveries:
+            processor.acknowledge(payment_id)
+        ack_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        processor.start(workers=args.workers)
+        while queue.pending_count():
+            time.sleep(0.01)
+        processor.stop()
+        process_seconds = time.perf_counter() - start
+        queue.close()
+
+    exact = all(
+        abs(mvp_service.get_mvp(mvp_id).current_funding - funding_before[mvp_id] - expected[mvp_id]) < 1e-6
+        for mvp_id in mvp_ids
+    )
+    return {
+        "webhooks": len(deliveries),
+        "acknowledge_per_second": len(deliveries) / ack_seconds,
+        "acknowledge_us": ack_seconds / len(deliveries) * 1e6,
+        "processed_per_second": len(deliveries) / process_seconds,
+        "ledger_entries": len(ledger),
+        "duplicates_skipped": processor.stats["duplicates"],
+        "exact_totals": exact and len(ledger) == args.payments,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Webhook pipeline benchmark")
+    parser.add_argument("--payments", type=int, default=20000)
+    parser.add_argument("--duplicates", type=int, default=3, help="Deliveries per payment")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, ["acknowledge_per_second", "processed_per_second", "exact_totals"])
+        return
+
+    metrics = run_benchmark(args)
+    for key, value in metrics.items():
+        print(f"{key:>24}: {value:,.3f}" if isinstance(value, float) else f"{key:>24}: {value}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""WebSocket fan-out load test.
+
+Connects thousands of in-memory fake clients to WebSocketAdapter, subscribes
+them to channels following a configurable distribution and drives broadcasts
+at a fixed rate. Runs entirely in-process, no network needed.
+
+    python -m benchmarks.websocket_fanout --clients 5000 --channels 100 --rate 200
+    python -m benchmarks.websocket_fanout --compare
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src._2_adapters.websocket_adapter import WebSocketAdapter
+from benchmarks.results import (
+    percentile, current_rss_mb, peak_rss_mb, record_result, print_comparison
+)
+
+BENCHMARK_NAME = "websocket_fanout"
+DISTRIBUTIONS = ["uniform", "zipf", "single"]
+
+
+class LatencyRecorder:
+    """Collects delivery latencies (ns) keyed by broadcast sequence number"""
+
+    def __init__(self):
+        self.scheduled_ns: Dict[int, int] = {}
+        self.latencies_ns = array("q")
+        self.deliveries = 0
+
+    def record(self, seq: int):
+        self.latencies_ns.append(time.perf_counter_ns() - self.scheduled_ns[seq])
+        self.deliveries += 1
+
+
+class FakeWebSocket:
+    """In-memory stand-in for a websocket connection"""
+
+    __slots__ = ("recorder", "received")
+
+    def __init__(self, recorder: LatencyRecorder):
+        self.recorder = recorder
+        self.received = 0
+
+    async def send(self, data: str):
+        self.received += 1
+        # Benchmark messages end with "bench_seq": <n>}
+        marker = data.rfind('"bench_seq": ')
+        if marker != -1:
+            self.recorder.record(int(data[marker + 13:-1]))
+
+
+def channel_weights(distribution: str, channels: int, zipf_s: float) -> List[float]:
+    """Relative popularity of each channel under a distribution"""
+    if distribution == "uniform":
+        return [1.0] * channels
+    if distribution == "zipf":
+        return [1.0 / (rank ** zipf_s) for rank in range(1, channels + 1)]
+    if distribution == "single":
+        return [1.0] + [0.0] * (channels - 1)
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def pick_channels(rng: random.Random, names: List[str], weights: List[float], count: int) -> List[str]:
+    """Pick up to `count` distinct channels according to weights"""
+    available = sum(1 for w in weights if w > 0)
+    count = min(count, available)
+    picked = set()
+    while len(picked) < count:
+        picked.update(rng.choices(names, weights=weights, k=count - len(picked)))
+    return list(picked)
+
+
+async def run_benchmark(args) -> Dict:
+    """Connect clients, drive broadcasts and collect metrics"""
+    rng = random.Random(args.seed)
+    adapter = WebSocketAdapter()
+    recorder = LatencyRecorder()
+    channel_names = [f"channel_{i}" for i in range(args.channels)]
+    sub_weights = channel_weights(args.distribution, args.channels, args.zipf_s)
+    pub_weights = channel_weights(args.publish_distribution, args.channels, args.zipf_s)
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    rss_before = current_rss_mb()
+
+    # Connect and subscribe
+    connect_start = time.perf_counter()
+    for i in range(args.clients):
+        client_id = f"client_{i}"
+        await adapter.connect(client_id, FakeWebSocket(recorder))
+        for channel in pick_channels(rng, channel_names, sub_weights, args.subscriptions):
+            await adapter.join_channel(client_id, channel)
+    connect_seconds = time.perf_counter() - connect_start
+    rss_connected = current_rss_mb()
+
+    # Drive broadcasts at the configured rate. Latency is measured from the
+    # scheduled send time so a backlog shows up as latency, not lower load.
+    total_broadcasts = int(args.rate * args.duration) if args.rate > 0 else args.broadcasts
+    interval_ns = int(1e9 / args.rate) if args.rate > 0 else 0
+    payload = "x" * args.payload_bytes
+    drive_start_ns = time.perf_counter_ns()
+
+    for seq in range(total_broadcasts):
+        scheduled = drive_start_ns + seq * interval_ns
+        now = time.perf_counter_ns()
+        if scheduled > now:
+            await asyncio.sleep((scheduled - now) / 1e9)
+        else:
+            scheduled = scheduled if interval_ns else now
+        recorder.scheduled_ns[seq] = scheduled
+
+        channel = rng.choices(channel_names, weights=pub_weights)[0]
+        await adapter.broadcast_to_channel(channel, {
+            "type": "funding_received",
+            "channel": channel,
+            "payload": payload,
+            "bench_seq": seq
+        })
+
+    elapsed = (time.perf_counter_ns() - drive_start_ns) / 1e9
+    latencies_us = sorted(ns / 1000 for ns in recorder.latencies_ns)
+
+    metrics = {
+        "connect_seconds": connect_seconds,
+        "broadcasts": total_broadcasts,
+        "deliveries": recorder.deliveries,
+        "elapsed_seconds": elapsed,
+        "broadcasts_per_second": total_broadcasts / elapsed if elapsed else 0.0,
+        "deliveries_per_second": recorder.deliveries / elapsed if elapsed else 0.0,
+        "p50_us": percentile(latencies_us, 50),
+        "p99_us": percentile(latencies_us, 99),
+        "p999_us": percentile(latencies_us, 99.9),
+        "max_us": latencies_us[-1] if latencies_us else 0.0,
+        "rss_connections_mb": rss_connected - rss_before,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+    if args.tracemalloc:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        metrics["tracemalloc_peak_mb"] = peak / (1024 * 1024)
+
+    return metrics
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="WebSocketAdapter fan-out benchmark")
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--channels", type=int, default=100)
+    parser.add_argument("--subscriptions", type=int, default=3, help="Channels joined per client")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="zipf",
+                        help="How clients pick channels to join")
+    parser.add_argument("--publish-distribution", choices=DISTRIBUTIONS, default="uniform",
+                        help="How broadcasts pick a target channel")
+    parser.add_argument("--zipf-s", type=float, default=1.1)
+    parser.add_argument("--rate", type=float, default=200.0,
+                        help="Broadcasts per second (0 = as fast as possible)")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds to drive broadcasts")
+    parser.add_argument("--broadcasts", type=int, default=1000, help="Broadcast count when --rate 0")
+    parser.add_argument("--payload-bytes", type=int, default=128)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tracemalloc", action="store_true", help="Track Python heap peak (slower)")
+    parser.add_argument("--no-record", action="store_true", help="Do not store the result")
+    parser.add_argument("--compare", action="store_true", help="Show previous runs and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.compare:
+        print_comparison(BENCHMARK_NAME, [
+            "deliveries_per_second", "p50_us", "p99_us", "p999_us", "peak_rss_mb"
+        ])
+        return
+
+    metrics = asyncio.run(run_benchmark(args))
+    for key, value in metrics.items():
+        print(f"{key:>24}: {value:,.3f}" if isinstance(value, float) else f"{key:>24}: {value:,}")
+
+    if not args.no_record:
+        params = {k: v for k, v in vars(args).items() if k not in ("compare", "no_record")}
+        record_result(BENCHMARK_NAME, params, metrics)
+
+
+if __name__ == "__main__":
+    main()
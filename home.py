@@ -0,0 +1,22 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.styling import apply_custom_styling, load_css
+from utils.state_management import initialize_session_state
+from utils.shared_services import get_timing_registry
+from src._3_frameworks.streamlit_app import VibratonicApp
+
+# Initialize session state
+initialize_session_state()
+
+# Apply custom styling
+apply_custom_styling()
+load_css("static/custom.css")
+
+# Initialize and run the main app, timing every renderer and the whole run
+app = VibratonicApp()
+get_timing_registry().instrument(
+    app, "app", ["run"] + [name for name in vars(VibratonicApp) if name.startswith("_render_")]
+)
+app.run()
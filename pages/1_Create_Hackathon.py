@@ -6,7 +6,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.styling import apply_custom_styling, load_css
 from utils.state_management import initialize_session_state
-from src._1_use_cases.hackathon_service import HackathonService
+from utils.shared_services import get_hackathon_service, get_vocabulary_service
+from src._1_use_cases.vocabulary_service import TAGS
 from src._0_domain.hackathon import Venue
 
 # Configure page
@@ -23,7 +24,8 @@ apply_custom_styling()
 load_css("static/custom.css")
 
 # Initialize services
-hackathon_service = HackathonService()
+hackathon_service = get_hackathon_service()
+vocabulary_service = get_vocabulary_service()
 
 st.markdown("# 🎯 Create Hackathon")
 
@@ -64,9 +66,9 @@ if st.session_state.wizard_step == 1:
         with col2:
             prize_pool = st.number_input("Prize Pool (€)", min_value=0, max_value=100000, value=5000)
         
-        # Tags
-        st.markdown("**Tags** (comma-separated)")
-        tags_input = st.text_input("Tags", placeholder="AI, Climate, Sustainability, Machine Learning")
+        # Tags: pick from the ones other hackathons use most, or type new ones
+        tags_input = st.multiselect("Tags", vocabulary_service.popular(TAGS, 100), accept_new_options=True,
+                                    placeholder="AI, Climate, Sustainability, Machine Learning")
         
         submitted = st.form_submit_button("Next Step ➡️", use_container_width=True)
         
@@ -77,7 +79,7 @@ if st.session_state.wizard_step == 1:
                 "theme": theme,
                 "max_participants": max_participants,
                 "prize_pool": prize_pool,
-                "tags": [tag.strip() for tag in tags_input.split(",") if tag.strip()]
+                "tags": vocabulary_service.canonicalize(TAGS, tags_input)
             }
             st.session_state.wizard_step = 2
             st.rerun()
@@ -300,7 +302,7 @@ st.markdown("---")
 col1, col2, col3 = st.columns(3)
 with col1:
     if st.button("🏠 Home", use_container_width=True):
-        st.switch_page("app.py")
+        st.switch_page("home.py")
 with col2:
     if st.button("🗺️ Map View", use_container_width=True):
         st.switch_page("pages/2_Map_View.py")
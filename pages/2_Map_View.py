@@ -7,7 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.styling import apply_custom_styling, load_css
 from utils.state_management import initialize_session_state
-from src._1_use_cases.hackathon_service import HackathonService
+from utils.shared_services import get_hackathon_service, get_search_service
 
 # Configure page
 st.set_page_config(
@@ -23,14 +23,16 @@ apply_custom_styling()
 load_css("static/custom.css")
 
 # Initialize services
-hackathon_service = HackathonService()
+hackathon_service = get_hackathon_service()
 
 st.markdown("# 🗺️ Hackathon Map")
 
 # Get all hackathons
 hackathons = hackathon_service.get_all_hackathons()
 
-# Filter controls
+# Search and filter controls
+search_query = st.text_input("🔍 Search hackathons", placeholder="Title, theme, tags, description or venue").strip()
+
 col1, col2, col3 = st.columns(3)
 
 with col1:
@@ -42,8 +44,11 @@ with col2:
 with col3:
     city_filter = st.selectbox("City", ["All"] + list(set([h.venue.address.split(',')[-1].strip() for h in hackathons])))
 
-# Apply filters
-filtered_hackathons = hackathons
+# Apply search and filters; searching keeps the best matches, most relevant first
+if search_query:
+    filtered_hackathons = get_search_service().search_hackathons(search_query, limit=100)
+else:
+    filtered_hackathons = hackathons
 
 if status_filter != "All":
     filtered_hackathons = [h for h in filtered_hackathons if h.status.value == status_filter.lower().replace(" ", "_")]
@@ -227,7 +232,7 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     if st.button("🏠 Home", use_container_width=True):
-        st.switch_page("app.py")
+        st.switch_page("home.py")
 
 with col2:
     if st.button("🎯 Create Hackathon", use_container_width=True):
@@ -5,9 +5,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.styling import apply_custom_styling, load_css
 from utils.state_management import initialize_session_state
-from src._1_use_cases.mvp_service import MVPService
-from src._1_use_cases.hackathon_service import HackathonService
-from src._1_use_cases.payment_service import PaymentService
+from utils.shared_services import get_mvp_service, get_hackathon_service, get_payment_service, get_webhook_processor, get_kpi_service, get_search_service, get_vocabulary_service
+from src._1_use_cases.vocabulary_service import TECH_STACK, normalize_term
 
 # Configure page
 st.set_page_config(
@@ -23,13 +22,16 @@ apply_custom_styling()
 load_css("static/custom.css")
 
 # Initialize services
-mvp_service = MVPService()
-hackathon_service = HackathonService()
-payment_service = PaymentService()
+mvp_service = get_mvp_service()
+hackathon_service = get_hackathon_service()
+payment_service = get_payment_service()
+webhook_processor = get_webhook_processor()
 
 st.markdown("# 🚀 MVP Showcase")
 
-# Filter controls
+# Search and filter controls
+search_query = st.text_input("🔍 Search MVPs", placeholder="Title, description or tech stack, e.g. \"react payments\"").strip()
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
@@ -42,14 +44,20 @@ with col2:
 
 with col3:
     sort_options = ["Recent", "Funding Amount", "Backers Count", "Title"]
+    if search_query:
+        sort_options.insert(0, "Relevance")
     sort_by = st.selectbox("Sort by", sort_options)
 
 with col4:
-    tech_stack_options = ["All", "Python", "JavaScript", "React", "Node.js", "AI/ML", "Blockchain", "IoT"]
+    # The most used tech across all MVPs
+    tech_stack_options = ["All"] + get_vocabulary_service().popular(TECH_STACK, 50)
     tech_filter = st.selectbox("Tech Stack", tech_stack_options)
 
-# Get MVPs
-mvps = mvp_service.get_all_mvps()
+# Get MVPs, best search matches first when searching
+if search_query:
+    mvps = get_search_service().search_mvps(search_query, limit=200)
+else:
+    mvps = mvp_service.get_all_mvps()
 
 # Apply filters
 if status_filter != "All":
@@ -61,7 +69,8 @@ if hackathon_filter != "All":
         mvps = [mvp for mvp in mvps if mvp.hackathon_id == selected_hackathon.id]
 
 if tech_filter != "All":
-    mvps = [mvp for mvp in mvps if tech_filter in mvp.tech_stack]
+    tech_key = normalize_term(tech_filter)
+    mvps = [mvp for mvp in mvps if any(normalize_term(tech) == tech_key for tech in mvp.tech_stack)]
 
 # Sort MVPs
 if sort_by == "Funding Amount":
@@ -77,19 +86,29 @@ elif sort_by == "Recent":
 st.markdown("### 📊 Showcase Stats")
 col1, col2, col3, col4 = st.columns(4)
 
+if not search_query and status_filter == hackathon_filter == tech_filter == "All":
+    # Unfiltered totals come straight from the platform KPIs
+    kpis = get_kpi_service().get_metrics()
+    stats = (kpis["total_mvps"], kpis["funded_mvps"], kpis["total_funding"], kpis["total_backers"])
+else:
+    stats = (
+        len(mvps),
+        len([mvp for mvp in mvps if mvp.status.value == "funded"]),
+        sum([mvp.current_funding for mvp in mvps]),
+        sum([mvp.backers_count for mvp in mvps])
+    )
+total_mvps, funded_count, total_funding, total_backers = stats
+
 with col1:
-    st.metric("Total MVPs", len(mvps))
+    st.metric("Total MVPs", total_mvps)
 
 with col2:
-    funded_mvps = [mvp for mvp in mvps if mvp.status.value == "funded"]
-    st.metric("Funded Projects", len(funded_mvps))
+    st.metric("Funded Projects", funded_count)
 
 with col3:
-    total_funding = sum([mvp.current_funding for mvp in mvps])
     st.metric("Total Funding", f"€{total_funding:,.0f}")
 
 with col4:
-    total_backers = sum([mvp.backers_count for mvp in mvps])
     st.metric("Total Backers", total_backers)
 
 st.markdown("---")
@@ -272,9 +291,11 @@ if "funding_modal_mvp" in st.session_state:
                         st.markdown(f"**Payment ID:** `{payment['payment_id']}`")
                         st.markdown(f"**Status:** {payment['status']}")
                         
-                        # Simulate successful payment for demo
-                        if mvp_service.add_funding(mvp.id, funding_amount, st.session_state.current_user.id):
-                            st.success(f"✅ Successfully funded {mvp.title} with €{funding_amount}!")
+                        # Simulate a completed checkout for demo; funding is applied
+                        # by the webhook workers exactly as for a real Mollie payment
+                        if payment_service.simulate_payment_completion(payment['payment_id']):
+                            webhook_processor.acknowledge(payment['payment_id'])
+                            st.success(f"✅ Payment confirmed! €{funding_amount} to {mvp.title} is being applied.")
                             st.balloons()
                         
                         # In production, redirect to Mollie checkout
@@ -345,7 +366,7 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     if st.button("🏠 Home", use_container_width=True):
-        st.switch_page("app.py")
+        st.switch_page("home.py")
 
 with col2:
     if st.button("🗺️ Map View", use_container_width=True):
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+import html
 from datetime import datetime, timedelta
 import sys
 import os
@@ -7,8 +8,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.styling import apply_custom_styling, load_css
 from utils.state_management import initialize_session_state
-from src._1_use_cases.mvp_service import MVPService
-from src._1_use_cases.hackathon_service import HackathonService
+from utils.shared_services import get_mvp_service, get_hackathon_service, get_activity_feed_service, get_chat_service, get_kpi_service, get_leaderboards, get_transaction_store
 
 # Configure page
 st.set_page_config(
@@ -24,100 +24,51 @@ apply_custom_styling()
 load_css("static/custom.css")
 
 # Initialize services
-mvp_service = MVPService()
-hackathon_service = HackathonService()
+mvp_service = get_mvp_service()
+hackathon_service = get_hackathon_service()
 
 st.markdown("# 💰 Investor Feed")
 
-# Real-time activity simulation
-if "last_activity_update" not in st.session_state:
-    st.session_state.last_activity_update = datetime.now()
-
-if "activity_feed" not in st.session_state:
-    # Initialize with some activities
-    st.session_state.activity_feed = [
-        {
-            "type": "funding",
-            "message": "💰 **EcoTrack AI** received €500 from **GreenTech Ventures**",
-            "timestamp": datetime.now() - timedelta(minutes=2),
-            "amount": 500,
-            "mvp": "EcoTrack AI",
-            "investor": "GreenTech Ventures"
-        },
-        {
-            "type": "milestone",
-            "message": "🎯 **CryptoLend** reached 75% funding goal!",
-            "timestamp": datetime.now() - timedelta(minutes=5),
-            "mvp": "CryptoLend",
-            "milestone": "75% funding goal"
-        },
-        {
-            "type": "new_mvp",
-            "message": "🚀 New MVP submitted: **HealthSync IoT Platform**",
-            "timestamp": datetime.now() - timedelta(minutes=8),
-            "mvp": "HealthSync IoT Platform"
-        },
-        {
-            "type": "investor_joined",
-            "message": "👥 **Alice Chen** joined **AI for Climate Change** hackathon",
-            "timestamp": datetime.now() - timedelta(minutes=12),
-            "investor": "Alice Chen",
-            "hackathon": "AI for Climate Change"
-        }
-    ]
+# Shared activity feed
+activity_feed = get_activity_feed_service()
+mvps = mvp_service.get_all_mvps()
 
-# Auto-refresh every 10 seconds (simulate real-time)
-if datetime.now() - st.session_state.last_activity_update > timedelta(seconds=10):
-    # Add new activity
+# Simulate real-time activity every 10 seconds
+if datetime.now() - activity_feed.last_updated > timedelta(seconds=10):
+    mvp = random.choice(mvps)
+    investor = random.choice(['TechFund', 'Innovation Capital', 'Startup Boost', 'Digital Ventures'])
+    amount = random.randint(100, 1000)
     activities = [
-        {
-            "type": "funding",
-            "message": f"💰 **{random.choice(['EcoTrack AI', 'CryptoLend', 'HealthSync'])}** received €{random.randint(100, 1000)} from **{random.choice(['TechFund', 'Innovation Capital', 'Startup Boost', 'Digital Ventures'])}**",
-            "timestamp": datetime.now(),
-            "amount": random.randint(100, 1000)
-        },
-        {
-            "type": "milestone",
-            "message": f"🎯 **{random.choice(['EcoTrack AI', 'CryptoLend', 'HealthSync'])}** reached {random.choice(['25%', '50%', '75%', '100%'])} funding goal!",
-            "timestamp": datetime.now()
-        },
-        {
-            "type": "investor_joined",
-            "message": f"👥 **{random.choice(['Bob Smith', 'Carol Davis', 'David Kumar', 'Eva Wilson'])}** joined **{random.choice(['AI for Climate Change', 'FinTech Revolution', 'Health Tech Innovation'])}** hackathon",
-            "timestamp": datetime.now()
-        },
-        {
-            "type": "chat",
-            "message": f"💬 **{random.choice(['Mike Johnson', 'Sarah Lee', 'Tom Brown'])}**: \"{random.choice(['Great project!', 'Very promising idea!', 'Love the tech stack!', 'When is the demo?'])}\"",
-            "timestamp": datetime.now()
-        }
+        ("funding", f"💰 **{html.escape(mvp.title)}** received €{amount} from **{investor}**",
+         {"mvp_id": mvp.id, "mvp": mvp.title, "amount": amount, "investor": investor}),
+        ("milestone", f"🎯 **{html.escape(mvp.title)}** reached {random.choice(['25%', '50%', '75%', '100%'])} funding goal!",
+         {"mvp_id": mvp.id, "mvp": mvp.title}),
+        ("investor_joined", f"👥 **{random.choice(['Bob Smith', 'Carol Davis', 'David Kumar', 'Eva Wilson'])}** joined **{random.choice(['AI for Climate Change', 'FinTech Revolution', 'Health Tech Innovation'])}** hackathon",
+         {}),
+        ("chat", f"💬 **{random.choice(['Mike Johnson', 'Sarah Lee', 'Tom Brown'])}**: \"{random.choice(['Great project!', 'Very promising idea!', 'Love the tech stack!', 'When is the demo?'])}\"",
+         {"mvp_id": mvp.id, "mvp": mvp.title})
     ]
     
-    new_activity = random.choice(activities)
-    st.session_state.activity_feed.insert(0, new_activity)
-    st.session_state.last_activity_update = datetime.now()
-    
-    # Keep only last 20 activities
-    st.session_state.activity_feed = st.session_state.activity_feed[:20]
+    activity_type, message, details = random.choice(activities)
+    activity_feed.publish(activity_type, message, **details)
 
 # Live stats
 col1, col2, col3, col4 = st.columns(4)
 
-mvps = mvp_service.get_all_mvps()
 hackathons = hackathon_service.get_all_hackathons()
-total_funding = sum([mvp.current_funding for mvp in mvps])
+kpi_service = get_kpi_service()
+kpis = kpi_service.get_metrics()
+kpi_deltas = kpi_service.get_deltas(timedelta(days=1))
 active_investors = 47  # Mock number
 
 with col1:
-    st.metric("💰 Total Funding", f"€{total_funding:,.0f}", delta="€1,250")
+    st.metric("💰 Total Funding", f"€{kpis['total_funding']:,.0f}", delta=f"€{kpi_deltas['total_funding']:+,.0f}")
 
 with col2:
-    funded_mvps = len([mvp for mvp in mvps if mvp.status.value == "funded"])
-    st.metric("🚀 Funded MVPs", funded_mvps, delta="+2")
+    st.metric("🚀 Funded MVPs", kpis["funded_mvps"], delta=f"{kpi_deltas['funded_mvps']:+,}")
 
 with col3:
-    total_backers = sum([mvp.backers_count for mvp in mvps])
-    st.metric("👥 Active Backers", total_backers, delta="+5")
+    st.metric("👥 Active Backers", kpis["total_backers"], delta=f"{kpi_deltas['total_backers']:+,}")
 
 with col4:
     st.metric("🔥 Live Investors", active_investors, delta="+3")
@@ -130,9 +81,46 @@ with col2:
     if st.button("🔄 Refresh", help="Auto-refreshes every 10 seconds"):
         st.rerun()
 
+# Feed filters
+activity_types = {
+    "All": None,
+    "💰 Funding": "funding",
+    "🎯 Milestones": "milestone",
+    "🚀 New MVPs": "new_mvp",
+    "👥 Investors": "investor_joined",
+    "↩️ Refunds": "refund",
+    "💬 Chat": "chat"
+}
+mvp_options = {"All MVPs": None}
+mvp_options.update({mvp.title: mvp.id for mvp in mvps})
+
+col1, col2 = st.columns(2)
+with col1:
+    type_filter = st.selectbox("Activity type", list(activity_types.keys()), key="feed_type_filter")
+with col2:
+    mvp_filter = st.selectbox("MVP", list(mvp_options.keys()), key="feed_mvp_filter")
+
+# Number of pages loaded; each older page is fetched from the previous page's cursor
+if "activity_feed_pages" not in st.session_state:
+    st.session_state.activity_feed_pages = 1
+
+feed_items = []
+cursor = None
+for _ in range(st.session_state.activity_feed_pages):
+    page = activity_feed.get_page(
+        limit=20,
+        cursor=cursor,
+        activity_type=activity_types[type_filter],
+        mvp_id=mvp_options[mvp_filter]
+    )
+    feed_items.extend(page["items"])
+    cursor = page["next_cursor"]
+    if cursor is None:
+        break
+
 # Activity feed
 with st.container():
-    for i, activity in enumerate(st.session_state.activity_feed):
+    for activity in feed_items:
         time_ago = datetime.now() - activity["timestamp"]
         
         if time_ago.total_seconds() < 60:
@@ -168,14 +156,26 @@ with st.container():
             </div>
         </div>
         """, unsafe_allow_html=True)
+    
+    if not feed_items:
+        st.info("No activity matches these filters yet.")
+    
+    if cursor is not None:
+        if st.button("⬇️ Load older", use_container_width=True):
+            st.session_state.activity_feed_pages += 1
+            st.rerun()
 
 st.markdown("---")
 
 # Top Performers
 st.markdown("### 🏆 Top Performing MVPs")
 
-# Sort MVPs by funding
-top_mvps = sorted(mvps, key=lambda x: x.current_funding, reverse=True)[:5]
+leaderboards = get_leaderboards()
+top_by = st.radio("Rank by", ["Funding", "Backers"], horizontal=True, key="top_mvps_by")
+if top_by == "Funding":
+    top_mvps = leaderboards.top_mvps_by_funding(5)
+else:
+    top_mvps = leaderboards.top_mvps_by_backers(5)
 
 for i, mvp in enumerate(top_mvps, 1):
     col1, col2, col3, col4, col5 = st.columns([0.5, 3, 1.5, 1, 1])
@@ -242,14 +242,16 @@ if funding_mvps:
 st.markdown("---")
 st.markdown("### 👑 Top Investors This Month")
 
-# Mock investor data
-top_investors = [
-    {"name": "GreenTech Ventures", "invested": 5000, "projects": 8, "avatar": "🌱"},
-    {"name": "Innovation Capital", "invested": 4200, "projects": 6, "avatar": "💡"},
-    {"name": "TechFund", "invested": 3800, "projects": 5, "avatar": "🚀"},
-    {"name": "Digital Boost", "invested": 3200, "projects": 4, "avatar": "💻"},
-    {"name": "Startup Angels", "invested": 2900, "projects": 7, "avatar": "😇"}
-]
+# Syncing the store folds new backings into the leaderboards
+get_transaction_store().sync()
+investor_window = st.radio("Window", ["This month", "Last 30 days"], horizontal=True, key="top_investors_window")
+if investor_window == "This month":
+    top_investors = leaderboards.top_investors(5)
+else:
+    top_investors = leaderboards.top_investors_rolling(5)
+
+if not top_investors:
+    st.info("No backings in this period yet")
 
 for i, investor in enumerate(top_investors, 1):
     col1, col2, col3, col4, col5 = st.columns([0.5, 0.5, 2.5, 1.5, 1])
@@ -261,44 +263,68 @@ for i, investor in enumerate(top_investors, 1):
             st.markdown(f"#{i}")
     
     with col2:
-        st.markdown(investor["avatar"])
+        st.markdown("💼")
     
     with col3:
-        st.markdown(f"**{investor['name']}**")
+        st.markdown(f"**{investor['backer_id']}**")
     
     with col4:
-        st.markdown(f"€{investor['invested']:,} invested")
+        st.markdown(f"€{investor['invested']:,.0f} invested")
     
     with col5:
-        st.markdown(f"{investor['projects']} projects")
+        if "projects" in investor:
+            st.markdown(f"{investor['projects']} projects")
 
 # Chat/Comments Section
 st.markdown("---")
 st.markdown("### 💬 Community Chat")
 
-# Mock chat messages
-if "chat_messages" not in st.session_state:
-    st.session_state.chat_messages = [
-        {"user": "Alice Chen", "message": "Great to see so many innovative projects!", "time": "2m ago", "avatar": "👩‍💼"},
-        {"user": "Bob Wilson", "message": "EcoTrack AI looks very promising. When is the demo?", "time": "5m ago", "avatar": "👨‍💻"},
-        {"user": "Carol Davis", "message": "Just funded CryptoLend! Excited to see where it goes.", "time": "8m ago", "avatar": "👩‍🚀"},
-        {"user": "David Kumar", "message": "Love the diversity of projects this month.", "time": "12m ago", "avatar": "👨‍🔬"}
-    ]
-
-# Display chat messages
-for msg in st.session_state.chat_messages:
-    st.markdown(f"""
+chat_service = get_chat_service()
+chat_room = "community"
+
+# Number of pages loaded; rendering is bounded by page size, not history length
+if "chat_pages" not in st.session_state:
+    st.session_state.chat_pages = 1
+
+chat_messages = []
+before_id = None
+for _ in range(st.session_state.chat_pages):
+    page = chat_service.get_recent_messages(chat_room, limit=10, before_id=before_id)
+    chat_messages.extend(page["messages"])
+    before_id = page["next_before_id"]
+    if before_id is None:
+        break
+
+# Display chat messages as a single block
+chat_html = []
+for msg in chat_messages:
+    seconds_ago = (datetime.now() - msg["timestamp"]).total_seconds()
+    if seconds_ago < 60:
+        time_str = "now"
+    elif seconds_ago < 3600:
+        time_str = f"{int(seconds_ago / 60)}m ago"
+    else:
+        time_str = f"{int(seconds_ago / 3600)}h ago"
+    
+    chat_html.append(f"""
     <div class="chat-message">
         <span class="chat-avatar">{msg['avatar']}</span>
-        <strong>{msg['user']}</strong>
-        <span class="chat-time">({msg['time']})</span>
+        <strong>{msg['user_html']}</strong>
+        <span class="chat-time">({time_str})</span>
         <br>
-        <span class="chat-text">{msg['message']}</span>
+        <span class="chat-text">{msg['message_html']}</span>
     </div>
-    """, unsafe_allow_html=True)
+    """)
+
+st.markdown("".join(chat_html), unsafe_allow_html=True)
+
+if before_id is not None:
+    if st.button("⬆️ Load earlier messages", use_container_width=True):
+        st.session_state.chat_pages += 1
+        st.rerun()
 
 # Chat input
-with st.form("chat_form"):
+with st.form("chat_form", clear_on_submit=True):
     col1, col2 = st.columns([4, 1])
     with col1:
         new_message = st.text_input("Share your thoughts...", placeholder="What do you think about these projects?")
@@ -306,12 +332,7 @@ with st.form("chat_form"):
         send_button = st.form_submit_button("💬 Send", use_container_width=True)
     
     if send_button and new_message:
-        st.session_state.chat_messages.insert(0, {
-            "user": st.session_state.current_user.full_name,
-            "message": new_message,
-            "time": "now",
-            "avatar": "👤"
-        })
+        chat_service.post_message(chat_room, st.session_state.current_user.full_name, new_message)
         st.rerun()
 
 # Navigation
@@ -320,7 +341,7 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     if st.button("🏠 Home", use_container_width=True):
-        st.switch_page("app.py")
+        st.switch_page("home.py")
 
 with col2:
     if st.button("🚀 Browse MVPs", use_container_width=True):
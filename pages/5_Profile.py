@@ -5,8 +5,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.styling import apply_custom_styling, load_css
 from utils.state_management import initialize_session_state
-from src._1_use_cases.mvp_service import MVPService
-from src._1_use_cases.hackathon_service import HackathonService
+from utils.shared_services import get_mvp_service, get_hackathon_service, get_transaction_store, get_vocabulary_service
+from src._1_use_cases.vocabulary_service import SKILLS, TECH_STACK, normalize_term
 from src._0_domain.user import UserRole
 
 # Configure page
@@ -23,12 +23,14 @@ apply_custom_styling()
 load_css("static/custom.css")
 
 # Initialize services
-mvp_service = MVPService()
-hackathon_service = HackathonService()
+mvp_service = get_mvp_service()
+hackathon_service = get_hackathon_service()
+vocabulary_service = get_vocabulary_service()
 
 st.markdown("# 👤 Profile")
 
 user = st.session_state.current_user
+vocabulary_service.set_terms(SKILLS, user.id, user.skills)
 
 # Profile Header
 col1, col2 = st.columns([1, 3])
@@ -195,40 +197,56 @@ with tab2:
 with tab3:
     st.markdown("### 💰 Investment History")
     
-    # Mock investment data for demonstration
-    investments = [
-        {"mvp": "EcoTrack AI", "amount": 500, "date": "2025-07-28", "status": "Active"},
-        {"mvp": "CryptoLend", "amount": 1000, "date": "2025-07-25", "status": "Active"},
-        {"mvp": "HealthSync", "amount": 250, "date": "2025-07-20", "status": "Completed"}
-    ]
+    transaction_store = get_transaction_store()
+    transaction_store.sync()
     
     if user.role in [UserRole.INVESTOR, UserRole.ORGANIZER, UserRole.ADMIN]:
-        total_invested = sum([inv["amount"] for inv in investments])
-        active_investments = len([inv for inv in investments if inv["status"] == "Active"])
+        summary = transaction_store.get_investor_summary(user.id)
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("💰 Total Invested", f"€{total_invested:,}")
+            st.metric("💰 Total Invested", f"€{summary['invested']:,.0f}")
         with col2:
-            st.metric("📈 Active Investments", active_investments)
+            st.metric("📈 Investments", summary["count"])
         with col3:
-            st.metric("🎯 Projects Funded", len(investments))
+            st.metric("🎯 Projects Funded", summary["projects"])
+        
+        # Number of pages loaded; each page continues from the previous page's cursor
+        if "investment_pages" not in st.session_state:
+            st.session_state.investment_pages = 1
+        
+        investments = []
+        cursor = None
+        for _ in range(st.session_state.investment_pages):
+            page = transaction_store.get_by_investor(user.id, limit=10, cursor=cursor)
+            investments.extend(page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
         
         st.markdown("#### Investment Details")
+        if not investments:
+            st.info("💰 No investments yet. Back an MVP from the showcase to get started!")
         for inv in investments:
-            status_color = "#00FFE1" if inv["status"] == "Active" else "#FFD700"
+            mvp = mvp_service.get_mvp(inv.mvp_id)
+            status = "Refunded" if inv.is_refund else "Active"
+            status_color = "#FFD700" if inv.is_refund else "#00FFE1"
             st.markdown(f"""
             <div class="investment-item">
                 <div class="investment-header">
-                    <strong>{inv['mvp']}</strong>
-                    <span style="color: {status_color};">{inv['status']}</span>
+                    <strong>{mvp.title if mvp else inv.mvp_id}</strong>
+                    <span style="color: {status_color};">{status}</span>
                 </div>
                 <div class="investment-details">
-                    <span>💰 €{inv['amount']}</span>
-                    <span>📅 {inv['date']}</span>
+                    <span>💰 €{inv.amount:,.2f}</span>
+                    <span>📅 {inv.created_at.strftime("%Y-%m-%d")}</span>
                 </div>
             </div>
             """, unsafe_allow_html=True)
+        
+        if cursor and st.button("⬇️ Load more investments"):
+            st.session_state.investment_pages += 1
+            st.rerun()
     else:
         st.info("💰 Investment features are available for Investors, Organizers, and Admins.")
         st.markdown("Upgrade your account to start investing in innovative projects!")
@@ -255,8 +273,12 @@ with tab4:
             new_linkedin = st.text_input("LinkedIn URL", value=user.linkedin_url)
         
         st.markdown("#### Skills")
-        skills_text = ", ".join(user.skills)
-        new_skills = st.text_input("Skills (comma-separated)", value=skills_text)
+        # The user's skills as spelled, then skills other users list and tech that MVPs are built with
+        skill_options = {}
+        for skill in [*user.skills, *vocabulary_service.popular(SKILLS, 100), *vocabulary_service.popular(TECH_STACK, 100)]:
+            skill_options.setdefault(normalize_term(skill), skill)
+        skill_options = list(skill_options.values())
+        new_skills = st.multiselect("Skills", skill_options, default=user.skills, accept_new_options=True)
         
         st.markdown("#### Account Settings")
         role_options = [role.value for role in UserRole if role != UserRole.GUEST]
@@ -283,7 +305,8 @@ with tab4:
             st.session_state.current_user.bio = new_bio
             st.session_state.current_user.github_username = new_github
             st.session_state.current_user.linkedin_url = new_linkedin
-            st.session_state.current_user.skills = [skill.strip() for skill in new_skills.split(",") if skill.strip()]
+            st.session_state.current_user.skills = vocabulary_service.canonicalize(SKILLS, new_skills)
+            vocabulary_service.set_terms(SKILLS, user.id, st.session_state.current_user.skills)
             st.session_state.current_user.role = UserRole(new_role)
             
             st.success("✅ Profile updated successfully!")
@@ -295,7 +318,7 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     if st.button("🏠 Home", use_container_width=True):
-        st.switch_page("app.py")
+        st.switch_page("home.py")
 
 with col2:
     if st.button("🚀 Browse MVPs", use_container_width=True):
@@ -2,6 +2,7 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import json
 from datetime import datetime, timedelta
 import sys
 import os
@@ -9,11 +10,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.styling import apply_custom_styling, load_css
 from utils.state_management import initialize_session_state
-from src._1_use_cases.mvp_service import MVPService
-from src._1_use_cases.hackathon_service import HackathonService
+from utils.shared_services import get_mvp_service, get_hackathon_service, get_settlement_service, get_refund_service, get_transaction_store, get_funding_rollups, get_kpi_service, get_funnel_analytics, get_figure_cache, get_job_runner, get_health_monitor, get_timing_registry, get_webhook_processor
 from src._0_domain.user import UserRole
 from src._0_domain.hackathon import HackathonStatus
 from src._0_domain.mvp import MVPStatus
+from src._0_domain.job import Job, JobStatus
+from src._1_use_cases.downsampling import lttb_indices
 
 # Configure page
 st.set_page_config(
@@ -35,8 +37,163 @@ if not st.session_state.current_user.can_admin():
     st.stop()
 
 # Initialize services
-mvp_service = MVPService()
-hackathon_service = HackathonService()
+mvp_service = get_mvp_service()
+hackathon_service = get_hackathon_service()
+kpi_service = get_kpi_service()
+figure_cache = get_figure_cache()
+
+def show_cached_chart(chart: str, params, versions: tuple, build_figure):
+    """Render a chart from the shared figure cache, building it only when its data changed"""
+    figure_json = figure_cache.get(chart, params, versions, lambda: build_figure().to_json())
+    # The cached JSON came from a validated figure, so skip validating it again
+    st.plotly_chart(go.Figure(json.loads(figure_json), _validate=False), use_container_width=True)
+
+def export_button(label: str, dataset: str):
+    """Button that queues a background export of `dataset`"""
+    export_format = st.radio(
+        "Format", ["csv", "parquet"], key=f"export_format_{dataset}", horizontal=True, label_visibility="collapsed"
+    )
+    if st.button(label, use_container_width=True):
+        get_job_runner().submit("export", {"dataset": dataset, "export_format": export_format})
+        st.toast(f"📄 {dataset.title()} export queued — see Background Jobs below")
+
+def submit_transactions_job(job_name: str):
+    """Queue a process-pool job over a fresh transactions export"""
+    job_runner = get_job_runner()
+    export = job_runner.submit("export", {"dataset": "transactions", "export_format": "csv"})
+    job_runner.submit(job_name, after=export.id)
+
+JOB_STATUS_ICONS = {
+    JobStatus.QUEUED: "⏳", JobStatus.RUNNING: "🔄", JobStatus.SUCCEEDED: "✅",
+    JobStatus.FAILED: "❌", JobStatus.CANCELLED: "🚫",
+}
+
+def show_job(job: Job):
+    """One job's status, progress, cancel and download controls"""
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        label = job.params.get("dataset", "") if job.name == "export" else ""
+        st.markdown(f"{JOB_STATUS_ICONS[job.status]} **{job.name.replace('_', ' ').title()}** {label} "
+                    f"<small>({job.status.value}, {job.created_at.strftime('%H:%M:%S')})</small>",
+                    unsafe_allow_html=True)
+        if job.status == JobStatus.RUNNING:
+            st.progress(job.progress, text=job.message)
+        elif job.error:
+            st.caption(job.error)
+        elif job.result and "error" in job.result:
+            st.caption(job.result["error"])
+    with col2:
+        if not job.is_finished:
+            if st.button("Cancel", key=f"cancel_job_{job.id}", use_container_width=True):
+                get_job_runner().cancel(job.id)
+                st.rerun(scope="fragment")
+        elif job.status == JobStatus.SUCCEEDED and job.result and os.path.exists(job.result.get("path", "")):
+            with open(job.result["path"], "rb") as f:
+                st.download_button(
+                    f"⬇️ {job.result['rows']:,} rows",
+                    f,
+                    file_name=job.result["filename"],
+                    key=f"download_job_{job.id}",
+                    use_container_width=True
+                )
+
+@st.fragment(run_every=2)
+def show_background_jobs():
+    """Recent jobs, re-polled every two seconds without rerunning the page"""
+    jobs = get_job_runner().list_jobs(limit=10)
+    if not jobs:
+        st.info("No background jobs yet")
+    for job in jobs:
+        show_job(job)
+
+HEALTH_ICONS = {"healthy": "🟢", "degraded": "🟡", "down": "🔴"}
+HEALTH_PROBES = {
+    "storage": "💾 Storage",
+    "database": "🗄️ Database",
+    "payment_gateway": "💳 Payment Gateway",
+    "websocket": "📡 WebSocket",
+    "event_loops": "⏱️ Event Loops",
+}
+
+@st.fragment(run_every=10)
+def show_system_health():
+    """Live probe results with their latency trend, re-checked as their TTLs expire"""
+    health_monitor = get_health_monitor()
+    results = health_monitor.check_all()
+    
+    for col, (name, label) in zip(st.columns(len(HEALTH_PROBES)), HEALTH_PROBES.items()):
+        result = results[name]
+        history = health_monitor.get_history(name)
+        with col:
+            if name == "websocket":
+                value = f"{result['metrics'].get('connections', 0):,} clients"
+            else:
+                value = f"{result['latency_ms']:.1f} ms"
+            previous = [entry["latency_ms"] for entry in history[:-1]]
+            delta = None
+            if previous and name != "websocket":
+                delta = f"{result['latency_ms'] - sum(previous) / len(previous):+.1f} ms vs avg"
+            st.metric(f"{HEALTH_ICONS[result['status']]} {label}", value, delta=delta, delta_color="inverse")
+            st.caption(f"{result['detail']} · {health_monitor.availability(name):.0%} up")
+    
+    trend = pd.DataFrame([
+        {"Checked": entry["checked_at"], "Latency (ms)": entry["latency_ms"], "Probe": HEALTH_PROBES[name]}
+        for name in HEALTH_PROBES if name != "websocket"
+        for entry in health_monitor.get_history(name)
+    ])
+    # A trend needs at least two checks
+    if not trend.empty and trend["Checked"].nunique() > 1:
+        fig_health = px.line(trend, x="Checked", y="Latency (ms)", color="Probe", markers=True,
+                             color_discrete_sequence=["#00FFE1", "#FF00A8", "#FFD700", "#00C2FF"])
+        fig_health.update_layout(
+            plot_bgcolor="rgba(0,0,0,0)",
+            paper_bgcolor="rgba(0,0,0,0)",
+            font_color="#FFFFFF",
+            height=260,
+            margin={"t": 10, "b": 10}
+        )
+        st.plotly_chart(fig_health, use_container_width=True)
+
+def list_controls(key: str, sort_options: dict, statuses) -> dict:
+    """Search, status, sort and page-size inputs for a paged admin list"""
+    def reset_page():
+        st.session_state[f"{key}_page"] = 1
+    
+    col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+    with col1:
+        search = st.text_input("Search", key=f"{key}_search", on_change=reset_page)
+    with col2:
+        status = st.selectbox("Status", ["All"] + [status.value for status in statuses],
+                              key=f"{key}_status", on_change=reset_page)
+    with col3:
+        sort_label = st.selectbox("Sort by", list(sort_options), key=f"{key}_sort", on_change=reset_page)
+    with col4:
+        page_size = st.selectbox("Per page", [10, 25, 50], key=f"{key}_page_size", on_change=reset_page)
+    
+    sort_by, descending = sort_options[sort_label]
+    return {
+        "search": search,
+        "status": None if status == "All" else statuses(status),
+        "sort_by": sort_by,
+        "descending": descending,
+        "page": st.session_state.get(f"{key}_page", 1),
+        "page_size": page_size,
+    }
+
+def pager(key: str, result: dict):
+    """Previous / next buttons for a paged query result"""
+    col1, col2, col3 = st.columns([1, 3, 1])
+    with col1:
+        if st.button("← Previous", key=f"{key}_previous", disabled=result["page"] <= 1, use_container_width=True):
+            st.session_state[f"{key}_page"] = result["page"] - 1
+            st.rerun()
+    with col2:
+        st.caption(f"Page {result['page']} of {result['pages']} · {result['total']:,} matching")
+    with col3:
+        if st.button("Next →", key=f"{key}_next", disabled=result["page"] >= result["pages"],
+                     use_container_width=True):
+            st.session_state[f"{key}_page"] = result["page"] + 1
+            st.rerun()
 
 st.markdown("# ⚙️ Admin Dashboard")
 st.markdown("*Platform management and analytics*")
@@ -45,11 +202,11 @@ st.markdown("*Platform management and analytics*")
 hackathons = hackathon_service.get_all_hackathons()
 mvps = mvp_service.get_all_mvps()
 
-# Key metrics
-total_funding = sum([mvp.current_funding for mvp in mvps])
-platform_revenue = total_funding * 0.20  # 20% platform fee
-total_participants = sum([h.current_participants for h in hackathons])
-active_hackathons = len([h for h in hackathons if h.status == HackathonStatus.OPEN])
+# Key metrics, maintained by the KPI service; deltas are against one day ago
+kpis = kpi_service.get_metrics()
+kpi_deltas = kpi_service.get_deltas(timedelta(days=1))
+total_funding = kpis["total_funding"]
+platform_revenue = kpis["platform_revenue"]  # 20% platform fee
 
 # Dashboard metrics
 st.markdown("### 📊 Platform Overview")
@@ -59,36 +216,36 @@ col1, col2, col3, col4, col5 = st.columns(5)
 with col1:
     st.metric(
         "🎯 Total Hackathons", 
-        len(hackathons),
-        delta=f"+{len([h for h in hackathons if h.status == HackathonStatus.OPEN])}"
+        kpis["total_hackathons"],
+        delta=f"{kpi_deltas['total_hackathons']:+,}"
     )
 
 with col2:
     st.metric(
         "🚀 Total MVPs", 
-        len(mvps),
-        delta=f"+{len([mvp for mvp in mvps if mvp.status == MVPStatus.SUBMITTED])}"
+        kpis["total_mvps"],
+        delta=f"{kpi_deltas['total_mvps']:+,}"
     )
 
 with col3:
     st.metric(
         "💰 Total Funding", 
         f"€{total_funding:,.0f}",
-        delta="€2,150"
+        delta=f"€{kpi_deltas['total_funding']:+,.0f}"
     )
 
 with col4:
     st.metric(
         "💵 Platform Revenue", 
         f"€{platform_revenue:,.0f}",
-        delta="€430"
+        delta=f"€{kpi_deltas['platform_revenue']:+,.0f}"
     )
 
 with col5:
     st.metric(
         "👥 Total Participants", 
-        total_participants,
-        delta="+23"
+        kpis["total_participants"],
+        delta=f"{kpi_deltas['total_participants']:+,}"
     )
 
 st.markdown("---")
@@ -105,70 +262,93 @@ with tab1:
     with col1:
         st.markdown("#### 💰 Funding Trends")
         
-        # Create sample data for funding over time
-        dates = [datetime.now() - timedelta(days=x) for x in range(30, 0, -1)]
-        funding_data = []
-        cumulative_funding = 0
+        trend_ranges = {
+            "Last 7 days (hourly)": (timedelta(days=7), "hour"),
+            "Last 30 days": (timedelta(days=30), "day"),
+            "Last 90 days (hourly)": (timedelta(days=90), "hour"),
+            "Last 90 days": (timedelta(days=90), "day"),
+            "Last year": (timedelta(days=365), "day"),
+            "Last 3 years": (timedelta(days=3 * 365), "day"),
+        }
+        trend_range = st.selectbox("Range", list(trend_ranges.keys()), index=1, key="funding_trend_range")
+        trend_span, trend_resolution = trend_ranges[trend_range]
         
-        for date in dates:
-            daily_funding = sum([mvp.current_funding for mvp in mvps if mvp.submission_datetime and mvp.submission_datetime.date() <= date.date()]) / len(dates)
-            cumulative_funding += daily_funding
-            funding_data.append({"Date": date, "Funding": cumulative_funding})
+        # Read pre-aggregated buckets; syncing the store folds in new funding
+        get_transaction_store().sync()
+        funding_rollups = get_funding_rollups()
+        now = datetime.now()
+        if trend_resolution == "hour":
+            current_bucket = now.replace(minute=0, second=0, microsecond=0)
+        else:
+            current_bucket = now.replace(hour=0, minute=0, second=0, microsecond=0)
         
-        df_funding = pd.DataFrame(funding_data)
+        def build_funding_figure():
+            df_funding = pd.DataFrame(funding_rollups.get_series(now - trend_span, now, trend_resolution))
+            df_funding = df_funding.rename(columns={
+                "bucket": "Date", "cumulative": "Funding", "volume": "Volume", "backers": "Backers"
+            })
+            # Long ranges have more buckets than the chart has pixels; keep the shape, drop the rest
+            keep = lttb_indices(df_funding["Date"].to_numpy(dtype="datetime64[ns]").astype("int64"),
+                                df_funding["Funding"].to_numpy())
+            df_funding = df_funding.iloc[keep]
+            
+            fig_funding = px.line(
+                df_funding, 
+                x="Date", 
+                y="Funding",
+                hover_data=["Volume", "Backers"],
+                title="Cumulative Funding Over Time",
+                color_discrete_sequence=["#00FFE1"]
+            )
+            fig_funding.update_layout(
+                plot_bgcolor="rgba(0,0,0,0)",
+                paper_bgcolor="rgba(0,0,0,0)",
+                font_color="#FFFFFF"
+            )
+            return fig_funding
         
-        fig_funding = px.line(
-            df_funding, 
-            x="Date", 
-            y="Funding",
-            title="Cumulative Funding Over Time",
-            color_discrete_sequence=["#00FFE1"]
-        )
-        fig_funding.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font_color="#FFFFFF"
-        )
-        st.plotly_chart(fig_funding, use_container_width=True)
+        show_cached_chart("funding_trends", (trend_range, current_bucket), (funding_rollups.version,),
+                          build_funding_figure)
     
     with col2:
         st.markdown("#### 🎯 Hackathon Status Distribution")
         
-        status_counts = {}
-        for status in HackathonStatus:
-            status_counts[status.value] = len([h for h in hackathons if h.status == status])
+        def build_status_figure():
+            status_counts = {}
+            for status in HackathonStatus:
+                status_counts[status.value] = len([h for h in hackathons if h.status == status])
+            
+            fig_status = px.pie(
+                values=list(status_counts.values()),
+                names=list(status_counts.keys()),
+                title="Hackathon Status Distribution",
+                color_discrete_sequence=["#00FFE1", "#FF00A8", "#FFD700", "#666666"]
+            )
+            fig_status.update_layout(
+                plot_bgcolor="rgba(0,0,0,0)",
+                paper_bgcolor="rgba(0,0,0,0)",
+                font_color="#FFFFFF"
+            )
+            return fig_status
         
-        fig_status = px.pie(
-            values=list(status_counts.values()),
-            names=list(status_counts.keys()),
-            title="Hackathon Status Distribution",
-            color_discrete_sequence=["#00FFE1", "#FF00A8", "#FFD700", "#666666"]
-        )
-        fig_status.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font_color="#FFFFFF"
-        )
-        st.plotly_chart(fig_status, use_container_width=True)
+        show_cached_chart("hackathon_status", (), (hackathon_service.version,), build_status_figure)
     
     # MVP performance
     st.markdown("#### 🚀 MVP Performance")
     
-    mvp_data = []
-    for mvp in mvps:
-        mvp_data.append({
-            "Title": mvp.title,
-            "Funding": mvp.current_funding,
-            "Backers": mvp.backers_count,
-            "Status": mvp.status.value,
-            "Tech Stack": len(mvp.tech_stack)
-        })
-    
-    df_mvps = pd.DataFrame(mvp_data)
-    
-    if not df_mvps.empty:
+    def build_mvp_figure():
+        mvp_data = []
+        for mvp in mvps:
+            mvp_data.append({
+                "Title": mvp.title,
+                "Funding": mvp.current_funding,
+                "Backers": mvp.backers_count,
+                "Status": mvp.status.value,
+                "Tech Stack": len(mvp.tech_stack)
+            })
+        
         fig_mvp = px.scatter(
-            df_mvps,
+            pd.DataFrame(mvp_data),
             x="Backers",
             y="Funding",
             size="Tech Stack",
@@ -182,7 +362,64 @@ with tab1:
             paper_bgcolor="rgba(0,0,0,0)",
             font_color="#FFFFFF"
         )
-        st.plotly_chart(fig_mvp, use_container_width=True)
+        return fig_mvp
+    
+    if mvps:
+        show_cached_chart("mvp_performance", (), (mvp_service.version,), build_mvp_figure)
+    
+    # Conversion funnel, precomputed by the funnel analytics and refreshed as data changes
+    st.markdown("#### 🔻 Conversion Funnel")
+    
+    funnel_report = get_funnel_analytics().get_report()
+    overall = funnel_report["overall"]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("MVPs per Participant", f"{overall['mvps_per_participant']:.2f}")
+    with col2:
+        st.metric("Submission Rate", f"{overall['submission_rate']:.0%}")
+    with col3:
+        st.metric("Funding Rate", f"{overall['funding_rate']:.0%}")
+    with col4:
+        median_days = overall["median_days_to_funding"]
+        st.metric("Median Time to Funding", f"{median_days:.1f} days" if median_days is not None else "—")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        def build_funnel_figure():
+            fig_funnel = go.Figure(go.Funnel(
+                y=["Participants", "MVPs", "Submitted", "Funded"],
+                x=[overall[stage] for stage in ["participants", "mvps", "submitted", "funded"]],
+                textinfo="value+percent initial",
+                marker={"color": ["#00FFE1", "#00C2FF", "#FF00A8", "#FFD700"]}
+            ))
+            fig_funnel.update_layout(
+                title="Platform Funnel",
+                plot_bgcolor="rgba(0,0,0,0)",
+                paper_bgcolor="rgba(0,0,0,0)",
+                font_color="#FFFFFF"
+            )
+            return fig_funnel
+        
+        show_cached_chart("conversion_funnel", (), (funnel_report["computed_at"],), build_funnel_figure)
+    
+    with col2:
+        breakdown = st.radio("Break down by", ["Hackathon", "Theme", "City"], horizontal=True, key="funnel_breakdown")
+        st.dataframe(
+            funnel_report[f"by_{breakdown.lower()}"],
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "funding": st.column_config.NumberColumn("Funding", format="€%.0f"),
+                "median_days_to_funding": st.column_config.NumberColumn("Median Days to Funding", format="%.1f"),
+                "mvps_per_participant": st.column_config.NumberColumn("MVPs per Participant", format="%.2f"),
+                "submission_rate": st.column_config.ProgressColumn("Submission Rate", min_value=0, max_value=1, format="%.2f"),
+                "funding_rate": st.column_config.ProgressColumn("Funding Rate", min_value=0, max_value=1, format="%.2f"),
+            }
+        )
+        st.caption(f"Rebuilt nightly, last at {funnel_report['rebuilt_at']:%Y-%m-%d %H:%M} · "
+                   f"updated {funnel_report['computed_at']:%H:%M:%S}")
 
 with tab2:
     st.markdown("### 🎯 Hackathon Management")
@@ -195,17 +432,28 @@ with tab2:
             st.switch_page("pages/1_Create_Hackathon.py")
     
     with col2:
-        if st.button("📊 Export Hackathon Data", use_container_width=True):
-            st.success("📄 Export functionality would be implemented here")
+        export_button("📊 Export Hackathon Data", "hackathons")
     
     with col3:
         if st.button("📧 Send Notifications", use_container_width=True):
             st.success("📧 Notification system would be implemented here")
     
-    # Hackathon list with management options
+    # Hackathon list with management options, one page at a time
     st.markdown("#### Active Hackathons")
     
-    for hackathon in hackathons:
+    hackathon_query = list_controls("admin_hackathons", {
+        "Start date (newest)": ("start", True),
+        "Start date (oldest)": ("start", False),
+        "Title": ("title", False),
+        "Participants": ("participants", True),
+        "Prize pool": ("prize_pool", True),
+    }, HackathonStatus)
+    hackathon_page = hackathon_service.query_hackathons(**hackathon_query)
+    
+    if not hackathon_page["items"]:
+        st.info("No hackathons match these filters")
+    
+    for hackathon in hackathon_page["items"]:
         with st.expander(f"{hackathon.title} ({hackathon.status.value})"):
             col1, col2 = st.columns([2, 1])
             
@@ -232,6 +480,8 @@ with tab2:
                 
                 if st.button(f"View Details", key=f"view_{hackathon.id}"):
                     st.info(f"Detailed view for {hackathon.title}")
+    
+    pager("admin_hackathons", hackathon_page)
 
 with tab3:
     st.markdown("### 🚀 MVP Management")
@@ -240,8 +490,7 @@ with tab3:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("📊 Generate MVP Report", use_container_width=True):
-            st.success("📊 MVP analytics report would be generated here")
+        export_button("📊 Generate MVP Report", "mvps")
     
     with col2:
         if st.button("🏆 Feature MVP", use_container_width=True):
@@ -251,11 +500,19 @@ with tab3:
         if st.button("📧 Contact Creators", use_container_width=True):
             st.success("📧 Creator communication system would be implemented here")
     
-    # MVP performance table
+    # MVP performance table and management, one page at a time
     st.markdown("#### MVP Performance Overview")
     
+    mvp_query = list_controls("admin_mvps", {
+        "Most recent": ("recent", True),
+        "Funding": ("funding", True),
+        "Backers": ("backers", True),
+        "Title": ("title", False),
+    }, MVPStatus)
+    mvp_page = mvp_service.query_mvps(**mvp_query)
+    
     mvp_performance = []
-    for mvp in mvps:
+    for mvp in mvp_page["items"]:
         hackathon = hackathon_service.get_hackathon(mvp.hackathon_id)
         mvp_performance.append({
             "Title": mvp.title,
@@ -272,11 +529,13 @@ with tab3:
     
     if not df_performance.empty:
         st.dataframe(df_performance, use_container_width=True)
+    else:
+        st.info("No MVPs match these filters")
     
     # Individual MVP management
     st.markdown("#### Individual MVP Management")
     
-    for mvp in mvps[:5]:  # Show first 5 for management
+    for mvp in mvp_page["items"]:
         with st.expander(f"{mvp.title} - {mvp.status.value}"):
             col1, col2 = st.columns([2, 1])
             
@@ -298,6 +557,8 @@ with tab3:
                     mvp_service.update_mvp_status(mvp.id, MVPStatus(new_mvp_status))
                     st.success(f"MVP status updated to {new_mvp_status}")
                     st.rerun()
+    
+    pager("admin_mvps", mvp_page)
 
 with tab4:
     st.markdown("### 👥 User Management")
@@ -331,8 +592,7 @@ with tab4:
             st.success("📧 Platform update notifications sent")
     
     with col2:
-        if st.button("📊 Export User Data", use_container_width=True):
-            st.success("📊 User data export initiated")
+        export_button("📊 Export User Data", "users")
     
     with col3:
         if st.button("🔒 Manage Permissions", use_container_width=True):
@@ -370,66 +630,238 @@ with tab5:
         st.metric("💵 Platform Revenue", f"€{platform_revenue:,.0f}")
     
     with col3:
-        monthly_revenue = platform_revenue * 0.3  # Mock monthly revenue
+        get_transaction_store().sync()
+        now = datetime.now()
+        monthly_revenue = sum(
+            bucket["platform_fees"] for bucket in get_funding_rollups().get_series(now - timedelta(days=29), now)
+        )
         st.metric("📅 Monthly Revenue", f"€{monthly_revenue:,.0f}")
     
     with col4:
-        avg_transaction = total_funding / max(len(mvps), 1)
+        avg_transaction = total_funding / max(kpis["total_backers"], 1)
         st.metric("📊 Avg Transaction", f"€{avg_transaction:,.0f}")
     
     # Payment management tools
     st.markdown("#### Payment Management")
     
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         if st.button("📊 Generate Revenue Report", use_container_width=True):
-            st.success("📊 Revenue report generated")
+            submit_transactions_job("revenue_report")
+            st.toast("📊 Revenue report queued — see Background Jobs below")
     
     with col2:
         if st.button("💳 Process Refunds", use_container_width=True):
-            st.success("💳 Refund processing panel would open here")
+            st.session_state.show_refund_panel = not st.session_state.get("show_refund_panel", False)
     
     with col3:
         if st.button("🔍 Audit Transactions", use_container_width=True):
-            st.success("🔍 Transaction audit initiated")
+            submit_transactions_job("transaction_audit")
+            st.toast("🔍 Transaction audit queued — see Background Jobs below")
+    
+    with col4:
+        if st.button("🔄 Reconcile Payments", use_container_width=True):
+            get_job_runner().submit("reconcile_payments")
+            st.toast("🔄 Reconciliation of open payments queued — see Background Jobs below")
+    
+    if st.session_state.get("show_refund_panel"):
+        st.markdown("#### 💳 Process Refunds")
+        refund_service = get_refund_service()
+        
+        refund_by = st.radio("Refund", ["Hackathon backers", "Payment IDs"], horizontal=True)
+        refund_result = None
+        if refund_by == "Hackathon backers":
+            # Cancelled hackathons first, they are the usual reason for bulk refunds
+            refund_options = sorted(hackathons, key=lambda h: h.status != HackathonStatus.CANCELLED)
+            refund_hackathon = st.selectbox(
+                "Hackathon", refund_options,
+                format_func=lambda h: f"{h.title} ({h.status.value})"
+            )
+            if refund_hackathon and st.button("↩️ Refund All Backers", type="primary"):
+                with st.spinner("Processing refunds..."):
+                    refund_result = refund_service.refund_hackathon_backers(refund_hackathon.id)
+        else:
+            payment_ids_text = st.text_area("Payment IDs", placeholder="One payment ID per line")
+            if st.button("↩️ Refund Payments", type="primary"):
+                payment_ids = [line.strip() for line in payment_ids_text.splitlines() if line.strip()]
+                with st.spinner("Processing refunds..."):
+                    refund_result = refund_service.refund_payments(payment_ids)
+        
+        if refund_result:
+            st.success(
+                f"↩️ Refunded {refund_result['refunded']:,} of {refund_result['requested']:,} payments "
+                f"(€{refund_result['amount_refunded']:,.2f}); "
+                f"{refund_result['skipped']:,} skipped, {refund_result['failed']:,} failed"
+            )
+            if refund_result["errors"]:
+                st.dataframe(pd.DataFrame(
+                    [{"Payment": payment_id, "Error": error} for payment_id, error in refund_result["errors"].items()]
+                ), use_container_width=True, hide_index=True)
+    
+    # Paid payments whose MVP would not take them; the backer's money must go back
+    webhook_processor = get_webhook_processor()
+    rejected_count = webhook_processor.queue.rejected_count()
+    if rejected_count:
+        st.warning(f"⚠️ {rejected_count:,} paid payment(s) were rejected by their MVP and need a refund")
+        rejected_payments = webhook_processor.queue.rejected_payments(limit=100)
+        st.dataframe(pd.DataFrame([
+            {"Payment": payment["payment_id"], "MVP": payment["mvp_id"], "Backer": payment["backer_id"],
+             "Amount": f"€{payment['amount']:,.2f}", "Rejected": payment["rejected_at"][:16]}
+            for payment in rejected_payments
+        ]), use_container_width=True, hide_index=True)
+        if st.button("↩️ Refund Rejected Payments", type="primary"):
+            with st.spinner("Processing refunds..."):
+                rejected_result = webhook_processor.refund_rejected()
+            st.success(
+                f"↩️ Refunded {rejected_result['refunded']:,} of {rejected_result['requested']:,} rejected payments "
+                f"(€{rejected_result['amount_refunded']:,.2f}); {rejected_result['failed']:,} failed"
+            )
+            if rejected_result["errors"]:
+                st.dataframe(pd.DataFrame(
+                    [{"Payment": payment_id, "Error": error} for payment_id, error in rejected_result["errors"].items()]
+                ), use_container_width=True, hide_index=True)
     
     # Recent transactions
     st.markdown("#### Recent Transactions")
     
-    transactions = []
-    for mvp in mvps:
-        if mvp.current_funding > 0:
-            transactions.append({
-                "MVP": mvp.title,
-                "Amount": f"€{mvp.current_funding:,.0f}",
-                "Platform Fee": f"€{mvp.current_funding * 0.20:,.0f}",
-                "Creator Amount": f"€{mvp.current_funding * 0.80:,.0f}",
-                "Status": "Completed",
-                "Date": "2025-07-28"  # Mock date
-            })
+    transaction_store = get_transaction_store()
+    transaction_store.sync()
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        date_range = st.date_input("Date range", value=(), key="transactions_date_range")
+    with col2:
+        transaction_investor = st.text_input("Investor ID", key="transactions_investor").strip()
+    
+    # Number of pages loaded; each page continues from the previous page's cursor
+    if "transaction_pages" not in st.session_state:
+        st.session_state.transaction_pages = 1
+    
+    page_transactions = []
+    cursor = None
+    for _ in range(st.session_state.transaction_pages):
+        if len(date_range) == 2:
+            page = transaction_store.get_by_date_range(
+                datetime.combine(date_range[0], datetime.min.time()),
+                datetime.combine(date_range[1], datetime.max.time()),
+                limit=20, cursor=cursor, backer_id=transaction_investor or None
+            )
+        elif transaction_investor:
+            page = transaction_store.get_by_investor(transaction_investor, limit=20, cursor=cursor)
+        else:
+            page = transaction_store.get_latest(limit=20, cursor=cursor)
+        page_transactions.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    
+    mvp_titles = {mvp.id: mvp.title for mvp in mvps}
+    transactions = [{
+        "MVP": mvp_titles.get(transaction.mvp_id, transaction.mvp_id),
+        "Investor": transaction.backer_id,
+        "Amount": f"{'-' if transaction.is_refund else ''}€{transaction.amount:,.2f}",
+        "Platform Fee": f"€{transaction.platform_fee:,.2f}",
+        "Creator Amount": f"€{transaction.creator_amount:,.2f}",
+        "Status": "Refunded" if transaction.is_refund else "Completed",
+        "Date": transaction.created_at.strftime("%Y-%m-%d %H:%M")
+    } for transaction in page_transactions]
     
     if transactions:
         df_transactions = pd.DataFrame(transactions)
-        st.dataframe(df_transactions, use_container_width=True)
+        st.dataframe(df_transactions, use_container_width=True, hide_index=True)
+        if cursor and st.button("⬇️ Load more transactions"):
+            st.session_state.transaction_pages += 1
+            st.rerun()
+    else:
+        st.info("No transactions found")
+    
+    # Creator payouts
+    st.markdown("#### Creator Payouts")
+    
+    settlement_service = get_settlement_service()
+    col1, col2 = st.columns([1, 3])
+    
+    with col1:
+        st.metric("⏳ Unsettled Entries", f"{settlement_service.pending_entries():,}")
+        if st.button("🧾 Run Settlement", use_container_width=True):
+            settled = settlement_service.settle()
+            st.success(f"🧾 Settled {len(settled)} batch(es)" if settled else "🧾 Nothing to settle")
+    
+    with col2:
+        batches = settlement_service.get_recent_batches()
+        if batches:
+            st.dataframe(pd.DataFrame([{
+                "Batch": batch.batch_id,
+                "Ledger Offsets": f"{batch.from_offset:,}–{batch.to_offset:,}",
+                "Payouts": batch.payout_count,
+                "Total": f"€{batch.total_cents / 100:,.2f}",
+                "File": batch.payout_file,
+                "Settled": batch.created_at.strftime("%Y-%m-%d %H:%M")
+            } for batch in batches]), use_container_width=True, hide_index=True)
+        else:
+            st.info("No settlements yet")
+
+# Background jobs
+st.markdown("---")
+st.markdown("### ⚙️ Background Jobs")
+show_background_jobs()
 
-# System health
+# Section timings
 st.markdown("---")
-st.markdown("### ⚡ System Health")
+st.markdown("### ⏱️ Slowest Sections")
 
-col1, col2, col3, col4 = st.columns(4)
+def set_timings_enabled():
+    # The registry is shared by every session, so only an actual toggle writes to it
+    get_timing_registry().enabled = st.session_state.timings_enabled
 
+timing_registry = get_timing_registry()
+# Seeded on every run, so the toggle shows changes made from other sessions
+st.session_state.timings_enabled = timing_registry.enabled
+col1, col2, col3 = st.columns([2, 2, 1])
 with col1:
-    st.metric("🟢 API Status", "Online", delta="99.9% uptime")
-
+    st.toggle("Collect timings", key="timings_enabled", on_change=set_timings_enabled)
 with col2:
-    st.metric("💾 Database", "Healthy", delta="Low latency")
-
+    rank_labels = {"p95": "p95_ms", "p99": "p99_ms", "Mean": "mean_ms", "Total time": "total_ms"}
+    rank_by = st.radio("Rank by", list(rank_labels), horizontal=True, key="timings_rank_by")
 with col3:
-    st.metric("💳 Payment Gateway", "Connected", delta="Mollie API")
+    if st.button("Reset timings", use_container_width=True):
+        timing_registry.reset()
 
-with col4:
-    st.metric("📡 WebSocket", "Active", delta="Real-time updates")
+slowest_sections = timing_registry.slowest(15, by=rank_labels[rank_by])
+if slowest_sections:
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        st.dataframe(
+            pd.DataFrame(slowest_sections),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                column: st.column_config.NumberColumn(column.replace("_ms", " (ms)"), format="%.2f")
+                for column in ["total_ms", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+            }
+        )
+    with col2:
+        section = st.selectbox("Latency histogram", [row["section"] for row in slowest_sections], key="timings_section")
+        df_histogram = pd.DataFrame(timing_registry.histogram(section))
+        df_histogram["Latency"] = [f"{row.lower_ms:.3g}–{row.upper_ms:.3g} ms" for row in df_histogram.itertuples()]
+        fig_histogram = px.bar(df_histogram, x="Latency", y="calls", color_discrete_sequence=["#00FFE1"])
+        fig_histogram.update_layout(
+            plot_bgcolor="rgba(0,0,0,0)",
+            paper_bgcolor="rgba(0,0,0,0)",
+            font_color="#FFFFFF",
+            margin={"t": 10}
+        )
+        st.plotly_chart(fig_histogram, use_container_width=True)
+elif timing_registry.enabled:
+    st.info("No timings yet — they appear as pages are used")
+else:
+    st.info("Timing collection is off")
+
+# System health
+st.markdown("---")
+st.markdown("### ⚡ System Health")
+show_system_health()
 
 # Navigation
 st.markdown("---")
@@ -437,7 +869,7 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     if st.button("🏠 Home", use_container_width=True):
-        st.switch_page("app.py")
+        st.switch_page("home.py")
 
 with col2:
     if st.button("📊 Platform Analytics", use_container_width=True):
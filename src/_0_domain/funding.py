@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+from enum import Enum
+
+class FundingEntryType(Enum):
+    FUNDING = "funding"
+    REFUND = "refund"
+
+@dataclass
+class FundingEntry:
+    payment_id: str
+    mvp_id: str
+    backer_id: str
+    amount: float
+    platform_fee: float
+    creator_amount: float
+    entry_type: FundingEntryType = FundingEntryType.FUNDING
+    creator_id: str = ""
+    created_at: Optional[datetime] = None
+    offset: int = -1  # Position in the ledger, assigned on append
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+
+    def signed_amount(self) -> float:
+        return -self.amount if self.entry_type == FundingEntryType.REFUND else self.amount
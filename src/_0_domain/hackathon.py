@@ -17,7 +17,12 @@ class Venue:
     latitude: float
     longitude: float
     capacity: int
-    
+
+    @property
+    def city(self) -> str:
+        """City of the venue: the last part of a "street, city" address"""
+        return self.address.rsplit(",", 1)[-1].strip() if "," in self.address else ""
+
 @dataclass
 class Hackathon:
     id: str
@@ -0,0 +1,50 @@
+from dataclasses import dataclass, asdict, field
+from typing import Dict, Optional
+from datetime import datetime
+from enum import Enum
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+FINISHED_JOB_STATUSES = {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+@dataclass
+class Job:
+    id: str
+    name: str
+    status: JobStatus = JobStatus.QUEUED
+    params: Dict = field(default_factory=dict)
+    after: Optional[str] = None  # Job whose result this one takes as input
+    progress: float = 0.0  # 0..1
+    message: str = ""
+    result: Optional[Dict] = None
+    error: str = ""
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_JOB_STATUSES
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["status"] = self.status.value
+        for key in ("created_at", "started_at", "finished_at"):
+            data[key] = data[key].isoformat() if data[key] else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Job":
+        data = dict(data, status=JobStatus(data["status"]))
+        for key in ("created_at", "started_at", "finished_at"):
+            data[key] = datetime.fromisoformat(data[key]) if data[key] else None
+        return cls(**data)
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Union
+
+# Platform fee in basis points (1/100 of a percent): 2000 = 20%
+PLATFORM_FEE_BPS = 2000
+BPS_DENOMINATOR = 10_000
+
+def to_cents(amount: Union[int, float, str, Decimal]) -> int:
+    """Convert a euro amount to whole cents, rounding half up"""
+    return int(Decimal(str(amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) * 100)
+
+def fee_cents(amount_cents: int, fee_bps: int = PLATFORM_FEE_BPS) -> int:
+    """Fee on an amount in cents, rounded half up to a whole cent"""
+    return (amount_cents * fee_bps + BPS_DENOMINATOR // 2) // BPS_DENOMINATOR
+
+@dataclass(frozen=True, order=True)
+class Money:
+    """An exact amount of money in integer cents"""
+    cents: int
+    currency: str = "EUR"
+
+    @classmethod
+    def from_amount(cls, amount: Union[int, float, str, Decimal], currency: str = "EUR") -> "Money":
+        return cls(to_cents(amount), currency)
+
+    @property
+    def amount(self) -> float:
+        return self.cents / 100
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.cents) / 100
+
+    def split_fee(self, fee_bps: int = PLATFORM_FEE_BPS) -> "tuple[Money, Money]":
+        """Split into (platform fee, creator share); the parts always add up"""
+        fee = fee_cents(self.cents, fee_bps)
+        return Money(fee, self.currency), Money(self.cents - fee, self.currency)
+
+    def __add__(self, other: "Money") -> "Money":
+        self._check_currency(other)
+        return Money(self.cents + other.cents, self.currency)
+
+    def __sub__(self, other: "Money") -> "Money":
+        self._check_currency(other)
+        return Money(self.cents - other.cents, self.currency)
+
+    def _check_currency(self, other: "Money"):
+        if self.currency != other.currency:
+            raise ValueError(f"Cannot combine {self.currency} and {other.currency}")
+
+    def __str__(self) -> str:
+        return f"{self.to_decimal():.2f} {self.currency}"
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime
 from enum import Enum
+from src._0_domain.money import Money
 
 class MVPStatus(Enum):
     DRAFT = "draft"
@@ -60,7 +61,9 @@ class MVP:
         return min((self.current_funding / total_goal) * 100, 100.0)
     
     def get_platform_fee(self, amount: float) -> float:
-        return amount * 0.20  # 20% platform fee
+        platform_fee, _ = Money.from_amount(amount).split_fee()  # 20% platform fee
+        return platform_fee.amount
     
     def get_creator_amount(self, amount: float) -> float:
-        return amount - self.get_platform_fee(amount)
+        _, creator_amount = Money.from_amount(amount).split_fee()
+        return creator_amount.amount
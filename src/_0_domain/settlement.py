@@ -0,0 +1,34 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+from datetime import datetime
+
+@dataclass
+class Payout:
+    creator_id: str
+    period: str  # e.g. "2025-07" for monthly settlement
+    amount_cents: int
+    entry_count: int
+
+@dataclass
+class SettlementBatch:
+    batch_id: int
+    from_offset: int  # First ledger offset included
+    to_offset: int  # Ledger offset after the last one included
+    payout_count: int
+    total_cents: int
+    payout_file: str
+    created_at: Optional[datetime] = None
+    ledger_epoch: str = ""  # FundingLedger.epoch the offsets refer to; empty in old manifests
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SettlementBatch":
+        return cls(**{**data, "created_at": datetime.fromisoformat(data["created_at"])})
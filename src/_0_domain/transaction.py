@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from datetime import datetime
+from src._0_domain.funding import FundingEntry, FundingEntryType
+
+@dataclass(slots=True)
+class Transaction:
+    seq: int  # Unique, increasing in insertion order; breaks timestamp ties
+    payment_id: str
+    mvp_id: str
+    backer_id: str
+    creator_id: str
+    amount: float
+    platform_fee: float
+    creator_amount: float
+    kind: str  # "funding" or "refund"
+    created_at: datetime
+
+    @classmethod
+    def from_funding_entry(cls, seq: int, entry: FundingEntry) -> "Transaction":
+        return cls(
+            seq=seq,
+            payment_id=entry.payment_id,
+            mvp_id=entry.mvp_id,
+            backer_id=entry.backer_id,
+            creator_id=entry.creator_id,
+            amount=entry.amount,
+            platform_fee=entry.platform_fee,
+            creator_amount=entry.creator_amount,
+            kind=entry.entry_type.value,
+            created_at=entry.created_at
+        )
+
+    @property
+    def is_refund(self) -> bool:
+        return self.kind == FundingEntryType.REFUND.value
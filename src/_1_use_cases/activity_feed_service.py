@@ -0,0 +1,100 @@
+import base64
+import threading
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+
+class ActivityFeedService:
+    """Process-wide activity feed backed by a fixed-size ring buffer.
+
+    Every activity gets a monotonically increasing sequence number and is
+    stored at ``seq % capacity``, so appends are O(1), the oldest entries
+    are overwritten in place and any page can be located without scanning.
+    """
+
+    def __init__(self, capacity: int = 500):
+        self.capacity = capacity
+        self._buffer: List[Optional[Dict]] = [None] * capacity
+        self._next_seq = 0
+        self._lock = threading.Lock()
+        self.last_updated = datetime.now()
+        self._initialize_sample_data()
+
+    def _initialize_sample_data(self):
+        """Initialize with sample activities for demonstration"""
+        now = datetime.now()
+        sample_activities = [
+            ("investor_joined", "👥 **Alice Chen** joined **AI for Climate Change** hackathon",
+             now - timedelta(minutes=12), {"investor": "Alice Chen", "hackathon": "AI for Climate Change"}),
+            ("new_mvp", "🚀 New MVP submitted: **HealthSync IoT Platform**",
+             now - timedelta(minutes=8), {"mvp_id": "mvp003", "mvp": "HealthSync"}),
+            ("milestone", "🎯 **CryptoLend** reached 75% funding goal!",
+             now - timedelta(minutes=5), {"mvp_id": "mvp002", "mvp": "CryptoLend", "milestone": "75% funding goal"}),
+            ("funding", "💰 **EcoTrack AI** received €500 from **GreenTech Ventures**",
+             now - timedelta(minutes=2), {"mvp_id": "mvp001", "mvp": "EcoTrack AI", "amount": 500, "investor": "GreenTech Ventures"}),
+        ]
+
+        for activity_type, message, timestamp, details in sample_activities:
+            self.publish(activity_type, message, timestamp=timestamp, **details)
+
+    def publish(self, activity_type: str, message: str, timestamp: Optional[datetime] = None, **details) -> Dict:
+        """Append an activity to the feed in O(1)"""
+        with self._lock:
+            activity = {
+                "id": self._next_seq,
+                "type": activity_type,
+                "message": message,
+                "timestamp": timestamp or datetime.now(),
+                **details
+            }
+            self._buffer[self._next_seq % self.capacity] = activity
+            self._next_seq += 1
+            self.last_updated = datetime.now()
+        return activity
+
+    def __len__(self) -> int:
+        return min(self._next_seq, self.capacity)
+
+    def get_page(self, limit: int = 20, cursor: Optional[str] = None,
+                 activity_type: Optional[str] = None, mvp_id: Optional[str] = None) -> Dict:
+        """Get newest-first activities older than `cursor`.
+
+        Returns the matching items and an opaque `next_cursor` for loading the
+        next (older) page, or None once the retained history is exhausted.
+        """
+        with self._lock:
+            newest = self._next_seq - 1
+            oldest = max(self._next_seq - self.capacity, 0)
+            buffer = self._buffer
+
+        start = newest if cursor is None else min(self._decode_cursor(cursor) - 1, newest)
+        items = []
+        seq = start
+        while seq >= oldest and len(items) < limit:
+            activity = buffer[seq % self.capacity]
+            # Skip slots overwritten by a writer since the bounds were taken
+            if activity is not None and activity["id"] == seq:
+                if (activity_type is None or activity["type"] == activity_type) and \
+                        (mvp_id is None or activity.get("mvp_id") == mvp_id):
+                    items.append(activity)
+            seq -= 1
+
+        next_cursor = self._encode_cursor(seq + 1) if seq >= oldest else None
+        return {"items": items, "next_cursor": next_cursor}
+
+    def get_latest(self, limit: int = 20) -> List[Dict]:
+        """Get the newest activities"""
+        return self.get_page(limit=limit)["items"]
+
+    @staticmethod
+    def _encode_cursor(seq: int) -> str:
+        return base64.urlsafe_b64encode(f"af:{seq}".encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> int:
+        try:
+            prefix, seq = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+            if prefix != "af":
+                raise ValueError(cursor)
+            return int(seq)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid activity feed cursor: {cursor}") from e
@@ -0,0 +1,113 @@
+import csv
+import os
+from typing import Callable, Dict
+import numpy as np
+import pandas as pd
+from src._1_use_cases.export_service import ExportService
+from src._1_use_cases.fee_engine import FeeEngine, to_cents_array
+from src._1_use_cases.payment_reconciler import PaymentReconciler
+from src._1_use_cases.job_runner import JobContext
+
+# Background jobs behind the Admin Dashboard's report and audit buttons.
+# The report and audit run on the job runner's process pool and read a
+# transactions export, which the live in-memory store is first streamed
+# to by an in-process export job. Exports are job result files, so they are
+# deleted with the job's record when the runner prunes its history.
+
+REPORT_CHUNK_ROWS = 200_000
+MAX_AUDIT_FINDINGS = 10_000
+
+def export_job(export_service: ExportService) -> Callable[..., Dict]:
+    """Job streaming a dataset export, for the runner's in-process pool"""
+    def run(context: JobContext, dataset: str, export_format: str = "csv") -> Dict:
+        total = max(export_service.count_rows(dataset), 1)
+        return export_service.export(
+            dataset, export_format,
+            progress=lambda rows: context.report(rows / total, f"{rows:,} of ~{total:,} rows"),
+            path=context.output_path(f"{dataset}.{export_format}")
+        )
+    return run
+
+def reconcile_job(reconciler: PaymentReconciler) -> Callable[..., Dict]:
+    """Job catching up on open payments with lost webhooks, for the runner's in-process pool"""
+    def run(context: JobContext) -> Dict:
+        # Cancelling raises out of the progress callback after a checkpoint, so the next run resumes
+        open_payments = max(reconciler.payment_service.open_payment_count(), 1)
+        return reconciler.run(progress=lambda stats: context.report(
+            stats["checked"] / open_payments,
+            f"Checked {stats['checked']:,} of ~{open_payments:,} open payments, {stats['applied']:,} applied"
+        ))
+    return run
+
+def _read_transactions(context: JobContext, export: Dict, action: str):
+    """Stream a CSV transactions export in DataFrame chunks, reporting progress"""
+    if not export or "error" in export:
+        raise ValueError((export or {}).get("error", "No transactions export to read"))
+    total = max(export["rows"], 1)
+    done = 0
+    for chunk in pd.read_csv(export["path"], chunksize=REPORT_CHUNK_ROWS, parse_dates=["created_at"]):
+        yield chunk
+        done += len(chunk)
+        context.report(done / total, f"{action} {done:,} of {total:,} transactions")
+
+def build_revenue_report(context: JobContext, input: Dict) -> Dict:
+    """Monthly volume, platform fees and refunds from a transactions export"""
+    months: Dict[str, np.ndarray] = {}
+    for chunk in _read_transactions(context, input, "Aggregated"):
+        refund = (chunk["kind"] == "refund").to_numpy()
+        amount_cents = to_cents_array(chunk["amount"])
+        fee_cents = to_cents_array(chunk["platform_fee"])
+        grouped = pd.DataFrame({
+            "month": chunk["created_at"].dt.strftime("%Y-%m"),
+            "backings": ~refund,
+            "volume_cents": np.where(refund, 0, amount_cents),
+            "fee_cents": np.where(refund, -fee_cents, fee_cents),
+            "refunds": refund,
+            "refunded_cents": np.where(refund, amount_cents, 0),
+        }).groupby("month").sum()
+        for month, row in zip(grouped.index, grouped.to_numpy(dtype=np.int64)):
+            months[month] = months[month] + row if month in months else row
+
+    path = context.output_path("revenue_report.csv")
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["month", "backings", "volume", "platform_fees", "refunds", "refunded", "net_volume"])
+        for month in sorted(months):
+            backings, volume, fees, refunds, refunded = (int(value) for value in months[month])
+            writer.writerow([month, backings, f"{volume / 100:.2f}", f"{fees / 100:.2f}", refunds,
+                             f"{refunded / 100:.2f}", f"{(volume - refunded) / 100:.2f}"])
+    return {"filename": os.path.basename(path), "path": path, "rows": len(months)}
+
+def audit_transactions(context: JobContext, input: Dict) -> Dict:
+    """Check every exported transaction's fee split and flag duplicate fundings"""
+    fee_engine = FeeEngine()
+    seen_fundings = set()
+    findings = []
+    counts = {"checked": 0, "fee_mismatches": 0, "split_mismatches": 0, "duplicate_fundings": 0}
+    for chunk in _read_transactions(context, input, "Audited"):
+        amount_cents = to_cents_array(chunk["amount"])
+        fee_cents = to_cents_array(chunk["platform_fee"])
+        creator_cents = to_cents_array(chunk["creator_amount"])
+        expected_fees, _ = fee_engine.split_batch(amount_cents)
+        checks = {
+            "fee_mismatches": fee_cents != expected_fees,
+            "split_mismatches": fee_cents + creator_cents != amount_cents,
+        }
+        payment_ids = chunk["payment_id"].to_numpy()
+        for issue, flagged in checks.items():
+            counts[issue] += int(flagged.sum())
+            findings.extend((payment_id, issue) for payment_id in payment_ids[flagged][:MAX_AUDIT_FINDINGS])
+        for payment_id in payment_ids[(chunk["kind"] == "funding").to_numpy()]:
+            if payment_id in seen_fundings:
+                counts["duplicate_fundings"] += 1
+                findings.append((payment_id, "duplicate_fundings"))
+            seen_fundings.add(payment_id)
+        counts["checked"] += len(chunk)
+        del findings[MAX_AUDIT_FINDINGS:]
+
+    path = context.output_path("transaction_audit.csv")
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["payment_id", "issue"])
+        writer.writerows(findings)
+    return {"filename": os.path.basename(path), "path": path, "rows": len(findings), **counts}
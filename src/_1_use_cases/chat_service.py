@@ -0,0 +1,102 @@
+import html
+import threading
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from src._2_adapters.websocket_adapter import WebSocketAdapter
+
+class ChatService:
+    """Process-wide chat rooms with bounded history.
+
+    Each room keeps at most `history_size` messages in a deque, so memory and
+    the cost of reading a page stay constant however long a conversation runs.
+    New messages are pushed to the room's WebSocket channel.
+    """
+
+    def __init__(self, websocket_adapter: Optional[WebSocketAdapter] = None, history_size: int = 200):
+        self.websocket_adapter = websocket_adapter
+        self.history_size = history_size
+        self._rooms: Dict[str, deque] = {}
+        self._next_ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._initialize_sample_data()
+
+    def _initialize_sample_data(self):
+        """Initialize with sample messages for demonstration"""
+        now = datetime.now()
+        sample_messages = [
+            ("David Kumar", "Love the diversity of projects this month.", "👨‍🔬", now - timedelta(minutes=12)),
+            ("Carol Davis", "Just funded CryptoLend! Excited to see where it goes.", "👩‍🚀", now - timedelta(minutes=8)),
+            ("Bob Wilson", "EcoTrack AI looks very promising. When is the demo?", "👨‍💻", now - timedelta(minutes=5)),
+            ("Alice Chen", "Great to see so many innovative projects!", "👩‍💼", now - timedelta(minutes=2))
+        ]
+
+        for user, message, avatar, timestamp in sample_messages:
+            self.post_message("community", user, message, avatar=avatar, timestamp=timestamp)
+
+    @staticmethod
+    def channel_for(room: str) -> str:
+        """WebSocket channel that receives a room's messages"""
+        return f"chat:{room}"
+
+    def post_message(self, room: str, user: str, message: str, avatar: str = "👤",
+                     timestamp: Optional[datetime] = None) -> Dict:
+        """Post a message to a room and deliver it to subscribers"""
+        with self._lock:
+            if room not in self._rooms:
+                self._rooms[room] = deque(maxlen=self.history_size)
+                self._next_ids[room] = 0
+
+            chat_message = {
+                "id": self._next_ids[room],
+                "room": room,
+                "user": user,
+                "message": message,
+                "avatar": avatar,
+                "timestamp": timestamp or datetime.now(),
+                # Escaped once here so rendering never re-processes history
+                "user_html": html.escape(user),
+                "message_html": html.escape(message)
+            }
+            self._rooms[room].append(chat_message)
+            self._next_ids[room] += 1
+
+        if self.websocket_adapter:
+            self.websocket_adapter.publish(self.channel_for(room), {
+                "type": "chat_message",
+                "room": room,
+                "id": chat_message["id"],
+                "user": user,
+                "message": message,
+                "avatar": avatar,
+                "timestamp": chat_message["timestamp"].isoformat()
+            })
+
+        return chat_message
+
+    def get_recent_messages(self, room: str, limit: int = 20, before_id: Optional[int] = None) -> Dict:
+        """Get a newest-first page of messages older than `before_id`.
+
+        Returns the messages and `next_before_id` for fetching the previous
+        page, or None when the retained history is exhausted.
+        """
+        with self._lock:
+            history = self._rooms.get(room)
+            if not history:
+                return {"messages": [], "next_before_id": None}
+
+            newest_id = history[-1]["id"]
+            oldest_id = history[0]["id"]
+            skip = 0 if before_id is None else max(newest_id - before_id + 1, 0)
+            messages = list(islice(reversed(history), skip, skip + limit))
+
+        has_older = bool(messages) and messages[-1]["id"] > oldest_id
+        return {
+            "messages": messages,
+            "next_before_id": messages[-1]["id"] if has_older else None
+        }
+
+    def get_rooms(self) -> List[str]:
+        """Get all rooms with history"""
+        return list(self._rooms.keys())
@@ -0,0 +1,73 @@
+import numpy as np
+
+# About the pixel width of a chart in a half-width dashboard column; more
+# points than pixels only add payload without changing what is drawn
+DEFAULT_MAX_POINTS = 800
+
+def lttb_indices(x, y, max_points: int = DEFAULT_MAX_POINTS) -> np.ndarray:
+    """Indices of the points Largest-Triangle-Three-Buckets keeps.
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the average of the next bucket, which preserves the
+    visual shape. The global maximum and minimum always replace their
+    bucket's choice so the peaks are exact; when both fall in one bucket
+    both are kept, returning `max_points + 1` indices. `x` must be ascending
+    and numeric (convert datetimes to integers first).
+    """
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # max_points - 2 buckets over the interior points, each at least one wide
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    # Average point of each bucket, plus the last point as the final "next bucket"
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    widths = np.diff(edges)
+    avg_x = np.append(sums_x / widths, x[-1])
+    avg_y = np.append(sums_y / widths, y[-1])
+
+    kept = np.empty(max_points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_x, next_y = avg_x[bucket + 1], avg_y[bucket + 1]
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        kept[bucket + 1] = a
+
+    extremes = sorted({int(np.argmax(y)), int(np.argmin(y))} - {0, n - 1})
+    slots = np.searchsorted(edges, extremes, side="right")
+    kept[slots] = extremes
+    if len(extremes) == 2 and slots[0] == slots[1]:
+        # The bucket's slot holds the later extreme; the earlier one goes just before it
+        kept = np.insert(kept, slots[0], extremes[0])
+    return kept
+
+def minmax_indices(y, max_points: int = DEFAULT_MAX_POINTS) -> np.ndarray:
+    """Indices of each bucket's minimum and maximum, plus both end points.
+
+    Cheaper than LTTB and fully vectorized; every local extreme a bucket
+    contains survives, which suits spiky series such as per-bucket volume.
+    """
+    n = len(y)
+    if max_points >= n or max_points < 4:
+        return np.arange(n)
+    y = np.asarray(y, dtype=np.float64)
+
+    buckets = (max_points - 2) // 2
+    edges = np.linspace(0, n, buckets + 1).astype(np.int64)
+    bucket_ids = np.repeat(np.arange(buckets), np.diff(edges))
+    kept = [np.array([0, n - 1])]
+    for reduce in (np.minimum, np.maximum):
+        extremes = reduce.reduceat(y, edges[:-1])
+        # First position in each bucket holding its extreme
+        candidates = np.flatnonzero(y == extremes[bucket_ids])
+        _, first = np.unique(bucket_ids[candidates], return_index=True)
+        kept.append(candidates[first])
+    return np.unique(np.concatenate(kept))
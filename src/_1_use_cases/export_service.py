@@ -0,0 +1,188 @@
+import csv
+import os
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.transaction_store import TransactionStore
+
+EXPORT_FORMATS = ("csv", "parquet")
+
+# Column name and type; types map to Parquet column types
+Columns = Sequence[Tuple[str, str]]
+
+TRANSACTION_COLUMNS: Columns = (
+    ("payment_id", "string"), ("kind", "string"), ("mvp_id", "string"), ("backer_id", "string"),
+    ("creator_id", "string"), ("amount", "float"), ("platform_fee", "float"),
+    ("creator_amount", "float"), ("created_at", "timestamp"),
+)
+USER_COLUMNS: Columns = (
+    ("user_id", "string"), ("invested", "float"), ("backings", "int"), ("projects", "int"),
+)
+MVP_COLUMNS: Columns = (
+    ("mvp_id", "string"), ("title", "string"), ("hackathon_id", "string"), ("creator_id", "string"),
+    ("status", "string"), ("current_funding", "float"), ("funding_goal", "float"),
+    ("backers", "int"), ("tech_stack", "string"), ("submitted_at", "timestamp"),
+)
+HACKATHON_COLUMNS: Columns = (
+    ("hackathon_id", "string"), ("title", "string"), ("status", "string"), ("theme", "string"),
+    ("venue", "string"), ("start", "timestamp"), ("end", "timestamp"),
+    ("participants", "int"), ("max_participants", "int"), ("prize_pool", "float"),
+)
+
+def _chunked(items: List, chunk_size: int) -> Iterator[List]:
+    for start in range(0, len(items), chunk_size):
+        yield items[start:start + chunk_size]
+
+class ExportService:
+    """Streams platform datasets to CSV or Parquet files for download.
+
+    Each dataset is read from its store in chunks by a generator, and every
+    chunk is written (as one Parquet row group) before the next is read, so
+    memory depends on `chunk_size` and not on how many rows are exported.
+    Files are written under a temporary name and renamed when complete; both
+    names are unique, so concurrent exports of one dataset never collide.
+    """
+
+    def __init__(self, transaction_store: TransactionStore, mvp_service: MVPService,
+                 hackathon_service: HackathonService, output_dir: str, chunk_size: int = 50_000):
+        self.transaction_store = transaction_store
+        self.mvp_service = mvp_service
+        self.hackathon_service = hackathon_service
+        self.output_dir = output_dir
+        self.chunk_size = chunk_size
+        os.makedirs(output_dir, exist_ok=True)
+
+        self.datasets: Dict[str, Tuple[Columns, Callable[[], Iterator[List[Tuple]]]]] = {
+            "transactions": (TRANSACTION_COLUMNS, self._transaction_rows),
+            "users": (USER_COLUMNS, self._user_rows),
+            "mvps": (MVP_COLUMNS, self._mvp_rows),
+            "hackathons": (HACKATHON_COLUMNS, self._hackathon_rows),
+        }
+
+    def export(self, dataset: str, export_format: str = "csv",
+               progress: Optional[Callable[[int], None]] = None, path: Optional[str] = None) -> Dict:
+        """Write a dataset to a new file and describe it.
+
+        `progress` is called with the rows written so far after every chunk.
+        The file goes to `output_dir` unless a `path` is given, e.g. a job's
+        result file.
+        """
+        if dataset not in self.datasets:
+            return {"error": f"Unknown export dataset: {dataset}"}
+        if export_format not in EXPORT_FORMATS:
+            return {"error": f"Unknown export format: {export_format}"}
+
+        columns, rows = self.datasets[dataset]
+        if path is None:
+            filename = f"{dataset}_{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}.{export_format}"
+            path = os.path.join(self.output_dir, filename)
+        filename = os.path.basename(path)
+        if dataset == "transactions":
+            self.transaction_store.sync()
+        try:
+            row_count = self.write(path, export_format, columns, rows(), progress)
+        except ImportError:
+            return {"error": "Parquet export needs pyarrow installed"}
+        return {
+            "dataset": dataset,
+            "filename": filename,
+            "path": path,
+            "rows": row_count,
+            "bytes": os.path.getsize(path),
+        }
+
+    def count_rows(self, dataset: str) -> int:
+        """Rows an export of `dataset` would currently write"""
+        if dataset == "transactions":
+            return len(self.transaction_store)
+        if dataset == "users":
+            return self.transaction_store.investor_count()
+        if dataset == "mvps":
+            return len(self.mvp_service.get_all_mvps())
+        return len(self.hackathon_service.get_all_hackathons())
+
+    def write(self, path: str, export_format: str, columns: Columns, chunks: Iterable[List[Tuple]],
+              progress: Optional[Callable[[int], None]] = None) -> int:
+        """Write row chunks to `path` as they arrive; returns the row count"""
+        tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.part"
+        if progress is not None:
+            chunks = _reporting(chunks, progress)
+        try:
+            if export_format == "parquet":
+                row_count = _write_parquet(tmp_path, columns, chunks)
+            else:
+                row_count = _write_csv(tmp_path, columns, chunks)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+        return row_count
+
+    # Row sources
+
+    def _transaction_rows(self) -> Iterator[List[Tuple]]:
+        for chunk in self.transaction_store.iter_chunks(self.chunk_size):
+            yield [
+                (t.payment_id, t.kind, t.mvp_id, t.backer_id, t.creator_id,
+                 t.amount, t.platform_fee, t.creator_amount, t.created_at)
+                for t in chunk
+            ]
+
+    def _user_rows(self) -> Iterator[List[Tuple]]:
+        # Users known to the platform's data are the backers in the transaction store
+        for chunk in self.transaction_store.iter_investor_summaries(self.chunk_size):
+            yield [(s["backer_id"], s["invested"], s["count"], s["projects"]) for s in chunk]
+
+    def _mvp_rows(self) -> Iterator[List[Tuple]]:
+        for chunk in _chunked(self.mvp_service.get_all_mvps(), self.chunk_size):
+            yield [
+                (mvp.id, mvp.title, mvp.hackathon_id, mvp.creator_id, mvp.status.value,
+                 mvp.current_funding, sum(goal.amount for goal in mvp.funding_goals),
+                 mvp.backers_count, ", ".join(mvp.tech_stack), mvp.submission_datetime)
+                for mvp in chunk
+            ]
+
+    def _hackathon_rows(self) -> Iterator[List[Tuple]]:
+        for chunk in _chunked(self.hackathon_service.get_all_hackathons(), self.chunk_size):
+            yield [
+                (h.id, h.title, h.status.value, h.theme, h.venue.name, h.start_datetime, h.end_datetime,
+                 h.current_participants, h.max_participants, h.prize_pool)
+                for h in chunk
+            ]
+
+def _reporting(chunks: Iterable[List[Tuple]], progress: Callable[[int], None]) -> Iterator[List[Tuple]]:
+    written = 0
+    for rows in chunks:
+        yield rows
+        written += len(rows)
+        progress(written)
+
+def _write_csv(path: str, columns: Columns, chunks: Iterable[List[Tuple]]) -> int:
+    row_count = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([name for name, _ in columns])
+        for rows in chunks:
+            writer.writerows(rows)
+            row_count += len(rows)
+    return row_count
+
+def _write_parquet(path: str, columns: Columns, chunks: Iterable[List[Tuple]]) -> int:
+    # Optional dependency, only needed for Parquet exports
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = {"string": pa.string(), "float": pa.float64(), "int": pa.int64(), "timestamp": pa.timestamp("us")}
+    schema = pa.schema([(name, types[kind]) for name, kind in columns])
+    row_count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in chunks:
+            if not rows:
+                continue
+            arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            row_count += len(rows)
+    return row_count
@@ -0,0 +1,58 @@
+from typing import Dict, Sequence, Tuple, Union
+import numpy as np
+from src._0_domain.money import Money, PLATFORM_FEE_BPS, BPS_DENOMINATOR, fee_cents, to_cents
+
+class FeeEngine:
+    """Platform fee calculation on integer cents.
+
+    Every place that splits money between the platform and creators goes
+    through here, one amount at a time or as whole arrays. Fees are rounded
+    half up per transaction and the creator gets the remainder, so fee and
+    creator share always add up to the amount and totals are reproducible.
+    """
+
+    def __init__(self, fee_bps: int = PLATFORM_FEE_BPS):
+        self.fee_bps = fee_bps
+
+    @property
+    def fee_rate(self) -> float:
+        return self.fee_bps / BPS_DENOMINATOR
+
+    def split(self, amount: Union[Money, float]) -> Tuple[Money, Money]:
+        """Split one amount into (platform fee, creator share)"""
+        money = amount if isinstance(amount, Money) else Money.from_amount(amount)
+        return money.split_fee(self.fee_bps)
+
+    def fee_cents(self, amount_cents: int) -> int:
+        return fee_cents(amount_cents, self.fee_bps)
+
+    def split_batch(self, amount_cents: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Split an array of amounts in cents into (fees, creator shares)"""
+        amounts = np.asarray(amount_cents, dtype=np.int64)
+        fees = (amounts * self.fee_bps + BPS_DENOMINATOR // 2) // BPS_DENOMINATOR
+        return fees, amounts - fees
+
+    def batch_totals(self, amount_cents: np.ndarray) -> Dict[str, int]:
+        """Total amount, fees and creator shares of an array of amounts in cents"""
+        amounts = np.asarray(amount_cents, dtype=np.int64)
+        fees, _ = self.split_batch(amounts)
+        total = int(amounts.sum())
+        total_fees = int(fees.sum())
+        return {
+            "count": int(amounts.size),
+            "amount_cents": total,
+            "platform_fee_cents": total_fees,
+            "creator_amount_cents": total - total_fees
+        }
+
+def to_cents_array(amounts: Sequence[float]) -> np.ndarray:
+    """Convert euro amounts to an int64 array of cents, rounding half up like `to_cents`"""
+    values = np.asarray(amounts, dtype=np.float64)
+    scaled = np.abs(values) * 100
+    cents = np.floor(scaled + 0.5)
+    # A float only approximates its decimal, so amounts this close to half a
+    # cent, like 1.005, are rounded from their decimal string one by one
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-9 * np.maximum(scaled, 1.0))
+    for i in ties:
+        cents[i] = abs(to_cents(float(values[i])))
+    return (np.sign(values) * cents).astype(np.int64)
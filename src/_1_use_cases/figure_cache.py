@@ -0,0 +1,77 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple
+
+class FigureCache:
+    """Serialized chart figures shared by every session.
+
+    Entries are keyed by chart name and parameters and remember the data
+    versions they were built from; a read with newer versions rebuilds the
+    figure and replaces the entry, so a data change invalidates exactly the
+    charts that depend on it. Total size is bounded by `max_bytes`, evicting
+    the least recently used figures first. Concurrent misses for the same
+    chart wait for a single build.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[Tuple, str]]" = OrderedDict()
+        self._bytes = 0
+        self._build_locks: Dict[Tuple[str, Hashable], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, chart: str, params: Hashable, versions: Tuple, build: Callable[[], str]) -> str:
+        """Get a chart's figure JSON, calling `build` only if the data changed"""
+        key = (chart, params)
+        cached = self._lookup(key, versions)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            # Another session may have built it while we waited
+            cached = self._lookup(key, versions)
+            if cached is not None:
+                return cached
+            figure_json = build()
+            with self._lock:
+                self.stats["misses"] += 1
+                self._store(key, versions, figure_json)
+        return figure_json
+
+    def _lookup(self, key: Tuple[str, Hashable], versions: Tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != versions:
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def _store(self, key: Tuple[str, Hashable], versions: Tuple, figure_json: str):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[1])
+        self._entries[key] = (versions, figure_json)
+        self._bytes += len(figure_json)
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            evicted_key, (_, evicted_json) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted_json)
+            self._build_locks.pop(evicted_key, None)
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        """Drop every cached figure"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
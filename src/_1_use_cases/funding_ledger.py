@@ -0,0 +1,64 @@
+import threading
+import uuid
+from typing import Dict, Iterator, List, Optional
+from src._0_domain.funding import FundingEntry, FundingEntryType
+
+class FundingLedger:
+    """Append-only record of every funding and refund applied to MVPs.
+
+    Entries are never modified; each gets a sequential offset so consumers
+    can stream everything after the last offset they processed. The ledger
+    lives in memory and its offsets restart at 0 with the process, so it
+    carries a random `epoch`; an offset stored on disk is only meaningful
+    for the epoch it was recorded with.
+    """
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex
+        self._entries: List[FundingEntry] = []
+        self._by_payment: Dict[str, List[int]] = {}
+        self._by_mvp: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def append(self, entries: List[FundingEntry]) -> List[FundingEntry]:
+        """Append a batch of entries, assigning their offsets"""
+        with self._lock:
+            for entry in entries:
+                entry.offset = len(self._entries)
+                self._entries.append(entry)
+                self._by_payment.setdefault(entry.payment_id, []).append(entry.offset)
+                self._by_mvp.setdefault(entry.mvp_id, []).append(entry.offset)
+        return entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def next_offset(self) -> int:
+        return len(self._entries)
+
+    def entries_since(self, offset: int = 0, batch_size: int = 1000) -> Iterator[List[FundingEntry]]:
+        """Stream entries from `offset` onwards in batches"""
+        end = len(self._entries)
+        for start in range(offset, end, batch_size):
+            yield self._entries[start:min(start + batch_size, end)]
+
+    def get_entries_for_payment(self, payment_id: str) -> List[FundingEntry]:
+        """Get all entries recorded for a payment"""
+        return [self._entries[offset] for offset in self._by_payment.get(payment_id, [])]
+
+    def get_payment_ids_for_mvp(self, mvp_id: str) -> List[str]:
+        """Get the IDs of payments with entries for an MVP, oldest first"""
+        return list(dict.fromkeys(self._entries[offset].payment_id for offset in self._by_mvp.get(mvp_id, [])))
+    
+    def is_refunded(self, payment_id: str) -> bool:
+        """Whether a refund entry was recorded for a payment"""
+        return any(entry.entry_type == FundingEntryType.REFUND
+                   for entry in self.get_entries_for_payment(payment_id))
+    
+    def get_funded_entry(self, payment_id: str) -> Optional[FundingEntry]:
+        """Get the funding entry for a payment, if it was applied"""
+        for entry in self.get_entries_for_payment(payment_id):
+            if entry.entry_type == FundingEntryType.FUNDING:
+                return entry
+        return None
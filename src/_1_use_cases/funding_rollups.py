@@ -0,0 +1,122 @@
+import threading
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from src._0_domain.money import to_cents
+from src._0_domain.transaction import Transaction
+
+RESOLUTIONS = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+# Bucket fields: funded cents, platform fee cents, backings, refunded cents, refunds
+_VOLUME, _FEES, _BACKERS, _REFUNDED, _REFUNDS = range(5)
+
+def _bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    if resolution == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+class FundingRollups:
+    """Hourly and daily funding totals, maintained as transactions arrive.
+
+    Each transaction adds its volume, fee and backer count to one hourly and
+    one daily bucket, so a chart over any range reads one bucket per point
+    instead of scanning transactions; the cumulative line starts from the sum
+    of the daily buckets before the range. Hourly buckets older than
+    `hourly_retention` are dropped; daily buckets are kept.
+    """
+
+    def __init__(self, hourly_retention: timedelta = timedelta(days=90)):
+        self.hourly_retention = hourly_retention
+        self._buckets: Dict[str, Dict[datetime, List[int]]] = {resolution: {} for resolution in RESOLUTIONS}
+        self._net_total_cents = 0
+        self._latest: Optional[datetime] = None
+        self.version = 0  # Bumped on every batch, for caches of derived data
+        self._lock = threading.Lock()
+
+    def add_transactions(self, transactions: List[Transaction]):
+        """Fold a batch of transactions into the buckets"""
+        with self._lock:
+            for transaction in transactions:
+                amount_cents = to_cents(transaction.amount)
+                for resolution, buckets in self._buckets.items():
+                    start = _bucket_start(transaction.created_at, resolution)
+                    bucket = buckets.get(start)
+                    if bucket is None:
+                        bucket = buckets[start] = [0, 0, 0, 0, 0]
+                    if transaction.is_refund:
+                        bucket[_REFUNDED] += amount_cents
+                        bucket[_REFUNDS] += 1
+                    else:
+                        bucket[_VOLUME] += amount_cents
+                        bucket[_FEES] += to_cents(transaction.platform_fee)
+                        bucket[_BACKERS] += 1
+                self._net_total_cents += -amount_cents if transaction.is_refund else amount_cents
+                if self._latest is None or transaction.created_at > self._latest:
+                    self._latest = transaction.created_at
+            self._prune_hourly()
+            self.version += 1
+
+    def _prune_hourly(self):
+        if self._latest is None:
+            return
+        hourly = self._buckets["hour"]
+        cutoff = self._latest - self.hourly_retention
+        if len(hourly) > self.hourly_retention / RESOLUTIONS["hour"] * 1.1:
+            for start in [start for start in hourly if start < cutoff]:
+                del hourly[start]
+
+    def get_series(self, start: datetime, end: datetime, resolution: str = "day") -> List[Dict]:
+        """Per-bucket totals from `start` to `end`, with empty buckets filled in.
+
+        `cumulative` is the all-time net funding (volume minus refunds) up to
+        the end of each bucket.
+        """
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown rollup resolution: {resolution}")
+        step = RESOLUTIONS[resolution]
+        first = _bucket_start(start, resolution)
+        last = _bucket_start(end, resolution)
+
+        with self._lock:
+            buckets = self._buckets[resolution]
+            rows = []
+            bucket_start = first
+            while bucket_start <= last:
+                rows.append((bucket_start, buckets.get(bucket_start)))
+                bucket_start += step
+            cumulative_cents = self._net_before(first)
+
+        series = []
+        for bucket_start, bucket in rows:
+            bucket = bucket or [0, 0, 0, 0, 0]
+            cumulative_cents += bucket[_VOLUME] - bucket[_REFUNDED]
+            series.append({
+                "bucket": bucket_start,
+                "volume": bucket[_VOLUME] / 100,
+                "platform_fees": bucket[_FEES] / 100,
+                "backers": bucket[_BACKERS],
+                "refunded": bucket[_REFUNDED] / 100,
+                "refunds": bucket[_REFUNDS],
+                "cumulative": cumulative_cents / 100,
+            })
+        return series
+
+    def _net_before(self, moment: datetime) -> int:
+        """Net funding cents before `moment`: whole days, then hours of its day"""
+        day = _bucket_start(moment, "day")
+        net = sum(
+            bucket[_VOLUME] - bucket[_REFUNDED]
+            for start, bucket in self._buckets["day"].items() if start < day
+        )
+        if moment > day:
+            net += sum(
+                bucket[_VOLUME] - bucket[_REFUNDED]
+                for start, bucket in self._buckets["hour"].items() if day <= start < moment
+            )
+        return net
+
+    def get_totals(self) -> Dict:
+        """All-time net funding"""
+        return {"net_funding": self._net_total_cents / 100}
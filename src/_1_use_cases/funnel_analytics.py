@@ -0,0 +1,278 @@
+import threading
+from typing import Callable, Dict, List, Optional
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from src._0_domain.funding import FundingEntryType
+from src._0_domain.hackathon import Hackathon
+from src._0_domain.money import to_cents
+from src._0_domain.mvp import MVP, MVPStatus
+from src._0_domain.transaction import Transaction
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.transaction_store import TransactionStore
+
+_NEVER = np.iinfo(np.int64).max  # First-funded time of an MVP nobody has backed
+_NS_PER_DAY = 86_400 * 10**9
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _to_ns(timestamp: Optional[datetime]) -> int:
+    return _NEVER if timestamp is None else (timestamp - _EPOCH) // _MICROSECOND * 1000
+
+class FunnelAnalytics:
+    """Hackathon → MVP → funding conversion, per hackathon, theme and city.
+
+    Every MVP is one row of NumPy columns (hackathon, submitted, funding,
+    when it opened for funding, when it was first backed) kept current from
+    MVP and hackathon service events and transaction store batches. A
+    report is a handful of pandas group-bys over those columns, recomputed
+    at most once per `refresh_interval` and only after something changed.
+    Once a night, after `rebuild_hour`, the columns are rebuilt from the
+    services and a full scan of the transaction store.
+    """
+
+    def __init__(self, hackathon_service: HackathonService, mvp_service: MVPService,
+                 transaction_store: TransactionStore, refresh_interval: timedelta = timedelta(seconds=30),
+                 rebuild_hour: int = 3, clock: Callable[[], datetime] = datetime.now):
+        self.hackathon_service = hackathon_service
+        self.mvp_service = mvp_service
+        self.transaction_store = transaction_store
+        self.refresh_interval = refresh_interval
+        self.rebuild_hour = rebuild_hour
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._report: Optional[Dict] = None
+        self._changes = 0
+
+        # Listen first so nothing added during the first scan is missed;
+        # first-funded times take the minimum, so seeing a backing twice is harmless
+        hackathon_service.add_listener(self._on_hackathon_event)
+        mvp_service.add_listener(self._on_mvp_event)
+        transaction_store.add_listener(self.add_transactions)
+        self.rebuild()
+
+    # State
+
+    def rebuild(self):
+        """Recompute every column from the services and the transaction store"""
+        with self._lock:
+            self._hackathon_codes: Dict[str, int] = {}
+            self._hackathon_ids: List[str] = []
+            self._hackathon_titles: List[str] = []
+            self._themes: List[str] = []
+            self._cities: List[str] = []
+            self._participants: List[int] = []
+            self._hackathon_ends: List[int] = []
+            self._rows: Dict[str, int] = {}
+            self._count = 0
+            self._hackathon = np.zeros(1024, dtype=np.int32)
+            self._submitted = np.zeros(1024, dtype=bool)
+            self._funding_cents = np.zeros(1024, dtype=np.int64)
+            self._opened = np.full(1024, _NEVER, dtype=np.int64)
+            self._first_funded = np.full(1024, _NEVER, dtype=np.int64)
+
+            for hackathon in self.hackathon_service.get_all_hackathons():
+                self._add_hackathon(hackathon)
+            for mvp in self.mvp_service.get_all_mvps():
+                self._add_mvp(mvp)
+            self.rebuilt_at = self.clock()
+        for transactions in self.transaction_store.iter_chunks():
+            self.add_transactions(transactions)
+        with self._lock:
+            self._report = None
+
+    def _hackathon_code(self, hackathon_id: str) -> int:
+        code = self._hackathon_codes.get(hackathon_id)
+        if code is None:
+            # An MVP of a hackathon not seen yet; filled in if it is created later
+            code = self._hackathon_codes[hackathon_id] = len(self._hackathon_ids)
+            self._hackathon_ids.append(hackathon_id)
+            self._hackathon_titles.append(hackathon_id or "No hackathon")
+            self._themes.append("")
+            self._cities.append("")
+            self._participants.append(0)
+            self._hackathon_ends.append(_NEVER)
+        return code
+
+    def _add_hackathon(self, hackathon: Hackathon):
+        code = self._hackathon_code(hackathon.id)
+        self._hackathon_titles[code] = hackathon.title
+        self._themes[code] = hackathon.theme
+        self._cities[code] = hackathon.venue.city
+        self._participants[code] = hackathon.current_participants
+        self._hackathon_ends[code] = _to_ns(hackathon.end_datetime)
+
+    def _add_mvp(self, mvp: MVP):
+        row = self._rows.get(mvp.id)
+        if row is None:
+            row = self._rows[mvp.id] = self._count
+            self._count += 1
+            if row == len(self._hackathon):
+                self._grow()
+        code = self._hackathon_code(mvp.hackathon_id)
+        self._hackathon[row] = code
+        self._update_mvp(row, mvp)
+        # Funding opens at submission, or when the hackathon ends if that is not recorded
+        self._opened[row] = (_to_ns(mvp.submission_datetime) if mvp.submission_datetime
+                             else self._hackathon_ends[code])
+
+    def _update_mvp(self, row: int, mvp: MVP):
+        self._submitted[row] = mvp.status != MVPStatus.DRAFT
+        self._funding_cents[row] = to_cents(mvp.current_funding)
+
+    def _grow(self):
+        size = len(self._hackathon) * 2
+        for name, fill in (("_hackathon", 0), ("_submitted", False), ("_funding_cents", 0),
+                           ("_opened", _NEVER), ("_first_funded", _NEVER)):
+            column = getattr(self, name)
+            grown = np.full(size, fill, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+    # Events
+
+    def _on_hackathon_event(self, event: str, hackathon: Hackathon, **data):
+        with self._lock:
+            if event in ("hackathon_created", "hackathon_updated"):
+                self._add_hackathon(hackathon)
+            elif event == "participant_joined":
+                self._participants[self._hackathon_code(hackathon.id)] = hackathon.current_participants
+            self._changes += 1
+
+    def _on_mvp_event(self, event: str, mvp: MVP, **data):
+        with self._lock:
+            row = self._rows.get(mvp.id)
+            if row is None:
+                self._add_mvp(mvp)
+            else:
+                self._update_mvp(row, mvp)
+            self._changes += 1
+
+    def add_transactions(self, transactions: List[Transaction]):
+        """Record when each MVP in a batch of transactions was first backed"""
+        refund = FundingEntryType.REFUND.value
+        backings = [transaction for transaction in transactions if transaction.kind != refund]
+        if not backings:
+            return
+        # DatetimeIndex converts a list of datetimes far faster than np.array does
+        times = pd.DatetimeIndex([transaction.created_at for transaction in backings]).as_unit("ns").asi8
+        with self._lock:
+            rows = np.fromiter((self._rows.get(transaction.mvp_id, -1) for transaction in backings),
+                               dtype=np.int64, count=len(backings))
+            known = rows >= 0
+            np.minimum.at(self._first_funded, rows[known], times[known])
+            self._changes += 1
+
+    # Report
+
+    def get_report(self) -> Dict:
+        """Funnel tables by hackathon, theme and city plus platform totals.
+
+        Rebuilds the columns first if the nightly rebuild is due, and reuses
+        the previous report if it is younger than `refresh_interval`.
+        """
+        now = self.clock()
+        last_due = now.replace(hour=self.rebuild_hour, minute=0, second=0, microsecond=0)
+        if last_due > now:
+            last_due -= timedelta(days=1)
+        if self.rebuilt_at < last_due:
+            self.rebuild()
+
+        with self._lock:
+            report = self._report
+            if report is not None and (not self._changes or now - report["computed_at"] < self.refresh_interval):
+                return report
+            self._changes = 0
+            columns = self._snapshot()
+        report = self._compute(columns)
+        report["computed_at"] = now
+        report["rebuilt_at"] = self.rebuilt_at
+        with self._lock:
+            self._report = report
+        return report
+
+    def _snapshot(self) -> Dict:
+        count = self._count
+        return {
+            "hackathon": self._hackathon[:count].copy(),
+            "submitted": self._submitted[:count].copy(),
+            "funding_cents": self._funding_cents[:count].copy(),
+            "opened": self._opened[:count].copy(),
+            "first_funded": self._first_funded[:count].copy(),
+            "titles": list(self._hackathon_titles),
+            "themes": [theme or "Unspecified" for theme in self._themes],
+            "cities": [city or "Unknown" for city in self._cities],
+            "participants": np.array(self._participants, dtype=np.int64),
+        }
+
+    def _compute(self, columns: Dict) -> Dict:
+        funded = columns["first_funded"] != _NEVER
+        timed = funded & (columns["opened"] != _NEVER)
+        days = np.full(len(funded), np.nan)
+        days[timed] = np.maximum(columns["first_funded"][timed] - columns["opened"][timed], 0) / _NS_PER_DAY
+        mvps = {
+            "hackathon": columns["hackathon"],
+            "submitted": columns["submitted"],
+            "funded": funded,
+            "funding": columns["funding_cents"] / 100,
+            "days_to_funding": days,
+        }
+
+        hackathons = pd.DataFrame({
+            "hackathon": columns["titles"],
+            "theme": columns["themes"],
+            "city": columns["cities"],
+        })
+        participants = columns["participants"]
+        report = {"by_hackathon": self._funnel(mvps, hackathons[["hackathon", "theme", "city"]],
+                                               np.arange(len(hackathons)), participants)}
+        for dimension in ("theme", "city"):
+            codes, uniques = pd.factorize(hackathons[dimension], sort=True)
+            labels = pd.DataFrame({dimension: uniques, "hackathons": np.bincount(codes, minlength=len(uniques))})
+            report[f"by_{dimension}"] = self._funnel(mvps, labels, codes, participants)
+
+        total = len(funded)
+        submitted = int(columns["submitted"].sum())
+        funded_count = int(funded.sum())
+        participant_count = int(participants.sum())
+        report["overall"] = {
+            "participants": participant_count,
+            "mvps": total,
+            "submitted": submitted,
+            "funded": funded_count,
+            "mvps_per_participant": total / participant_count if participant_count else 0.0,
+            "submission_rate": submitted / total if total else 0.0,
+            "funding_rate": funded_count / submitted if submitted else 0.0,
+            "median_days_to_funding": float(np.median(days[timed])) if timed.any() else None,
+        }
+        return report
+
+    @staticmethod
+    def _funnel(mvps: Dict[str, np.ndarray], labels: pd.DataFrame, group_of_hackathon: np.ndarray,
+                participants: np.ndarray) -> pd.DataFrame:
+        """Funnel stages and rates for each group of hackathons, one row per row of `labels`"""
+        groups = len(labels)
+        group = group_of_hackathon[mvps["hackathon"]]
+        participants = np.bincount(group_of_hackathon, weights=participants, minlength=groups).astype(np.int64)
+        count = np.bincount(group, minlength=groups)
+        submitted = np.bincount(group, weights=mvps["submitted"], minlength=groups).astype(np.int64)
+        funded = np.bincount(group, weights=mvps["funded"], minlength=groups).astype(np.int64)
+        # Medians do not add up across groups, so only they need a real group-by
+        timed = ~np.isnan(mvps["days_to_funding"])
+        medians = pd.Series(mvps["days_to_funding"][timed]).groupby(group[timed]).median()
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            funnel = pd.DataFrame({
+                **{column: labels[column].to_numpy() for column in labels.columns},
+                "participants": participants,
+                "mvps": count,
+                "submitted": submitted,
+                "funded": funded,
+                "funding": np.bincount(group, weights=mvps["funding"], minlength=groups),
+                "median_days_to_funding": medians.reindex(range(groups)).to_numpy(),
+                "mvps_per_participant": np.where(participants > 0, count / participants, np.nan),
+                "submission_rate": np.where(count > 0, submitted / count, np.nan),
+                "funding_rate": np.where(submitted > 0, funded / submitted, np.nan),
+            })
+        return funnel.sort_values(["funded", "mvps"], ascending=False, ignore_index=True)
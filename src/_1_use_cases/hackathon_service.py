@@ -1,13 +1,49 @@
-from typing import List, Optional
+import threading
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
 from src._0_domain.hackathon import Hackathon, Venue, HackathonStatus
 from src._0_domain.user import UserProfile
+from src._1_use_cases.pagination import CatalogIndex
 
 class HackathonService:
     def __init__(self):
         self._hackathons = {}
+        self._listeners: List[Callable[..., None]] = []
+        self.version = 0  # Bumped on every change, for caches of derived data
+        self._version_lock = threading.Lock()  # Changes to different entities emit concurrently
+        self.catalog_version = 0  # Bumped only by creates and edits, for the catalog's sort orders
+        self._index = CatalogIndex(
+            self.get_all_hackathons,
+            sort_keys={
+                "start": lambda h: h.start_datetime,
+                "title": lambda h: h.title.lower(),
+                "participants": lambda h: h.current_participants,
+                "prize_pool": lambda h: h.prize_pool,
+            },
+            search_text=lambda h: " ".join([h.title, h.description, h.theme, h.venue.name, *h.tags]),
+            volatile=("participants",)
+        )
         self._initialize_sample_data()
     
+    def add_listener(self, listener: Callable[..., None]):
+        """Call `listener(event, **data)` after every change from now on.
+        
+        Events: hackathon_created (hackathon), hackathon_updated (hackathon),
+        hackathon_status_changed (hackathon, old_status), participant_joined
+        (hackathon).
+        """
+        self._listeners.append(listener)
+    
+    def _emit(self, event: str, **data):
+        with self._version_lock:
+            self.version += 1
+            if event in ("hackathon_created", "hackathon_updated"):
+                self.catalog_version += 1
+        if event == "participant_joined":
+            self._index.reposition(data["hackathon"])
+        for listener in self._listeners:
+            listener(event, **data)
+    
     def _initialize_sample_data(self):
         """Initialize with sample hackathons for demonstration"""
         sample_venues = [
@@ -100,12 +136,21 @@ class HackathonService:
         )
         
         self._hackathons[hackathon_id] = hackathon
+        self._emit("hackathon_created", hackathon=hackathon)
         return hackathon
     
     def get_all_hackathons(self) -> List[Hackathon]:
         """Get all hackathons"""
         return list(self._hackathons.values())
     
+    def query_hackathons(self, search: str = "", status: Optional[HackathonStatus] = None,
+                         sort_by: str = "start", descending: bool = False,
+                         page: int = 1, page_size: int = 10) -> Dict:
+        """One page of hackathons matching a search and status, sorted by
+        start, title, participants or prize_pool"""
+        matches = (lambda h: h.status == status) if status else None
+        return self._index.query(self.catalog_version, search, matches, sort_by, descending, page, page_size)
+    
     def get_hackathon(self, hackathon_id: str) -> Optional[Hackathon]:
         """Get hackathon by ID"""
         return self._hackathons.get(hackathon_id)
@@ -119,13 +164,27 @@ class HackathonService:
         hackathon = self._hackathons.get(hackathon_id)
         if hackathon and hackathon.can_join():
             hackathon.current_participants += 1
+            self._emit("participant_joined", hackathon=hackathon)
             return True
         return False
     
+    def update_hackathon(self, hackathon_id: str, changes: dict) -> Optional[Hackathon]:
+        """Edit the title, description, theme, tags or requirements of a hackathon"""
+        hackathon = self._hackathons.get(hackathon_id)
+        if hackathon:
+            for field in ("title", "description", "theme", "tags", "requirements"):
+                if field in changes:
+                    setattr(hackathon, field, changes[field])
+            self._emit("hackathon_updated", hackathon=hackathon)
+        return hackathon
+    
     def update_hackathon_status(self, hackathon_id: str, status: HackathonStatus) -> bool:
         """Update hackathon status"""
         hackathon = self._hackathons.get(hackathon_id)
         if hackathon:
+            old_status = hackathon.status
             hackathon.status = status
+            if status != old_status:
+                self._emit("hackathon_status_changed", hackathon=hackathon, old_status=old_status)
             return True
         return False
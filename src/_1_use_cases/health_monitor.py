@@ -0,0 +1,193 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+from datetime import datetime, timedelta
+
+HEALTHY, DEGRADED, DOWN = "healthy", "degraded", "down"
+
+class _Probe:
+    """One registered check with its last result and recent history"""
+    __slots__ = ("name", "check", "ttl", "warn_ms", "result", "history", "lock")
+
+    def __init__(self, name: str, check: Callable[[], Dict], ttl: timedelta, warn_ms: float, history: int):
+        self.name = name
+        self.check = check
+        self.ttl = ttl
+        self.warn_ms = warn_ms
+        self.result: Optional[Dict] = None
+        self.history: Deque[Dict] = deque(maxlen=history)
+        self.lock = threading.Lock()
+
+class HealthMonitor:
+    """Active health probes with short-lived cached results and trends.
+
+    Each probe is a callable that exercises one dependency and returns a
+    dict of measurements, optionally with its own `status`, `detail` or
+    `latency_ms`. The monitor times the call, marks it degraded past the
+    probe's `warn_ms` and down if it raises, and caches the result for the
+    probe's `ttl`, so any number of dashboards cost one probe per TTL. The
+    last `history` results of each probe are kept for trend lines.
+    """
+
+    def __init__(self, history: int = 120, clock: Callable[[], datetime] = datetime.now):
+        self.history = history
+        self.clock = clock
+        self._probes: Dict[str, _Probe] = {}
+        self._history_lock = threading.Lock()
+
+    def register(self, name: str, check: Callable[[], Dict], ttl: timedelta = timedelta(seconds=15),
+                 warn_ms: float = 100.0):
+        """Add a probe; `check` raises or returns a dict of measurements"""
+        self._probes[name] = _Probe(name, check, ttl, warn_ms, self.history)
+
+    def check(self, name: str, force: bool = False) -> Dict:
+        """The probe's cached result, running it first if older than its TTL"""
+        probe = self._probes[name]
+        result = probe.result
+        if not force and result is not None and self.clock() - result["checked_at"] < probe.ttl:
+            return result
+        # While another caller is running this probe, show its last result rather than wait
+        if not probe.lock.acquire(blocking=result is None or force):
+            return result
+        try:
+            if probe.result is result:
+                result = probe.result = self._run(probe)
+                with self._history_lock:
+                    probe.history.append(result)
+            return probe.result
+        finally:
+            probe.lock.release()
+
+    def check_all(self, force: bool = False) -> Dict[str, Dict]:
+        """Results of every probe, in registration order"""
+        return {name: self.check(name, force) for name in self._probes}
+
+    def get_history(self, name: str) -> List[Dict]:
+        """Recent results of a probe, oldest first"""
+        probe = self._probes[name]
+        with self._history_lock:
+            return list(probe.history)
+
+    def availability(self, name: str) -> float:
+        """Share of recent results that were not down"""
+        history = self.get_history(name)
+        if not history:
+            return 1.0
+        return sum(1 for result in history if result["status"] != DOWN) / len(history)
+
+    def _run(self, probe: _Probe) -> Dict:
+        started = time.perf_counter()
+        try:
+            measurements = dict(probe.check() or {})
+            error = None
+        except Exception as e:
+            measurements, error = {}, f"{type(e).__name__}: {e}"
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        latency_ms = measurements.pop("latency_ms", elapsed_ms)
+        status = measurements.pop("status", None)
+        if error:
+            status = DOWN
+        elif status is None:
+            status = DEGRADED if latency_ms >= probe.warn_ms else HEALTHY
+        return {
+            "name": probe.name,
+            "status": status,
+            "latency_ms": latency_ms,
+            "detail": error or measurements.pop("detail", ""),
+            "metrics": measurements,
+            "checked_at": self.clock(),
+        }
+
+# Probes
+
+def storage_probe(path: str, size: int = 4096) -> Callable[[], Dict]:
+    """Write, flush to disk and read back a small file at `path`"""
+    payload = os.urandom(size)
+
+    def check() -> Dict:
+        started = time.perf_counter()
+        with open(path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        written = time.perf_counter()
+        with open(path, "rb") as f:
+            if f.read() != payload:
+                return {"status": DOWN, "detail": "Read back different bytes than written"}
+        read = time.perf_counter()
+        return {
+            "write_ms": (written - started) * 1000,
+            "read_ms": (read - written) * 1000,
+            "detail": os.path.dirname(path) or ".",
+        }
+    return check
+
+def database_probe(queue) -> Callable[[], Dict]:
+    """Time a committed write and a count query on the webhook queue database"""
+    def check() -> Dict:
+        started = time.perf_counter()
+        queue.heartbeat()
+        written = time.perf_counter()
+        pending = queue.pending_count()
+        read = time.perf_counter()
+        return {
+            "write_ms": (written - started) * 1000,
+            "read_ms": (read - written) * 1000,
+            "pending_webhooks": pending,
+            "detail": f"{pending:,} webhooks pending",
+        }
+    return check
+
+def payment_gateway_probe(adapter) -> Callable[[], Dict]:
+    """Round trip to the payment gateway: list the payment methods.
+
+    The pooled client returns no methods when the request fails, so an
+    empty list counts as the gateway being down.
+    """
+    name = "Mollie API" if hasattr(adapter, "client") else "Mock gateway"
+
+    def check() -> Dict:
+        methods = adapter.get_payment_methods()
+        if not methods:
+            return {"status": DOWN, "detail": f"{name}: no payment methods returned"}
+        return {"methods": len(methods), "detail": name}
+    return check
+
+def websocket_probe(adapter) -> Callable[[], Dict]:
+    """Connection and channel counts and undelivered broadcasts of the WebSocket adapter"""
+    def check() -> Dict:
+        stats = adapter.stats()
+        loop = adapter.loop
+        if loop is None or loop.is_closed():
+            stats["detail"] = "No clients connected yet"
+        else:
+            stats["detail"] = f"{stats['connections']:,} clients, {stats['pending_broadcasts']:,} broadcasts queued"
+        return stats
+    return check
+
+def event_loop_probe(loops: Callable[[], Dict[str, object]], timeout: float = 1.0) -> Callable[[], Dict]:
+    """Scheduling lag of the background asyncio loops.
+
+    Schedules a callback on each running loop from this thread and measures
+    how long it waits to run; a busy or blocked loop shows up as lag. The
+    probe's latency is the worst lag. Loops that are not running are skipped.
+    """
+    def check() -> Dict:
+        lags = {}
+        for name, loop in loops().items():
+            if loop is None or loop.is_closed() or not loop.is_running():
+                continue
+            ran = threading.Event()
+            started = time.perf_counter()
+            loop.call_soon_threadsafe(ran.set)
+            if not ran.wait(timeout):
+                return {"status": DOWN, "detail": f"{name} loop did not respond within {timeout:.0f}s",
+                        "latency_ms": timeout * 1000}
+            lags[f"{name}_lag_ms"] = (time.perf_counter() - started) * 1000
+        if not lags:
+            return {"latency_ms": 0.0, "detail": "No event loops running"}
+        return {**lags, "latency_ms": max(lags.values()), "detail": f"{len(lags)} loop(s) responding"}
+    return check
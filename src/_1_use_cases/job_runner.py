@@ -0,0 +1,262 @@
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from datetime import datetime
+from src._0_domain.job import Job, JobStatus
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested"""
+
+class JobContext:
+    """Handed to every job: progress reporting, cancellation and output files.
+
+    Progress goes to a small file next to the job record, written at most
+    every `report_interval` seconds, which is also when the cancel marker is
+    checked. Both work the same from a worker process or a thread.
+    """
+
+    def __init__(self, job_id: str, jobs_dir: str, report_interval: float = 0.5):
+        self.job_id = job_id
+        self.jobs_dir = jobs_dir
+        self.report_interval = report_interval
+        self.started_at = datetime.now()
+        self._last_report = 0.0
+
+    def output_path(self, filename: str) -> str:
+        """Path for a result file of this job"""
+        return os.path.join(self.jobs_dir, "results", f"{self.job_id}_{filename}")
+
+    def report(self, progress: float, message: str = "", force: bool = False):
+        """Record progress (0..1); raises JobCancelled once cancel was requested"""
+        now = time.monotonic()
+        if not force and now - self._last_report < self.report_interval:
+            return
+        self._last_report = now
+        if os.path.exists(_cancel_path(self.jobs_dir, self.job_id)):
+            raise JobCancelled(self.job_id)
+        _write_json(_progress_path(self.jobs_dir, self.job_id), {
+            "progress": min(max(progress, 0.0), 1.0),
+            "message": message,
+            "started_at": self.started_at.isoformat()
+        })
+
+def _run_job(fn: Callable[..., Dict], job_id: str, jobs_dir: str, params: Dict) -> Dict:
+    """Worker entry point, in a pool process or thread"""
+    context = JobContext(job_id, jobs_dir)
+    context.report(0.0, "Started", force=True)
+    return fn(context, **params) or {}
+
+def _record_path(jobs_dir: str, job_id: str) -> str:
+    return os.path.join(jobs_dir, f"{job_id}.json")
+
+def _progress_path(jobs_dir: str, job_id: str) -> str:
+    return os.path.join(jobs_dir, f"{job_id}.progress")
+
+def _cancel_path(jobs_dir: str, job_id: str) -> str:
+    return os.path.join(jobs_dir, f"{job_id}.cancel")
+
+def _write_json(path: str, data: Dict):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+class JobRunner:
+    """Runs heavy admin work in the background.
+
+    Job kinds are registered by name. CPU-bound kinds run on a process pool,
+    so several jobs use several cores; kinds that need this process's
+    in-memory services (exports of the live stores) run on a small thread
+    pool instead. A job may run `after` another and take its result as
+    `input`, e.g. a report built from a fresh export. Records are persisted
+    as one JSON file per job when submitted and when finished; status reads
+    are served from memory plus the job's progress file while it runs.
+    Jobs left unfinished by a restart are marked failed.
+    """
+
+    def __init__(self, jobs_dir: str, max_workers: Optional[int] = None,
+                 max_threads: int = 2, history: int = 200):
+        self.jobs_dir = jobs_dir
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_threads = max_threads
+        self.history = history
+        self._kinds: Dict[str, Tuple[Callable[..., Dict], bool]] = {}
+        self._jobs: Dict[str, Job] = {}
+        self._futures: Dict[str, Future] = {}
+        self._waiting: Dict[str, List[str]] = {}  # Job id -> ids of jobs to run after it
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.RLock()
+        os.makedirs(os.path.join(jobs_dir, "results"), exist_ok=True)
+        self._load_records()
+
+    def register(self, name: str, fn: Callable[..., Dict], in_process: bool = False):
+        """Add a job kind; `fn(context, **params)` returns a result dict.
+
+        Process jobs need a picklable module-level `fn` and parameters.
+        """
+        self._kinds[name] = (fn, in_process)
+
+    # Submitting
+
+    def submit(self, name: str, params: Optional[Dict] = None, after: Optional[str] = None) -> Job:
+        """Queue a job, to start now or once job `after` has succeeded"""
+        if name not in self._kinds:
+            raise ValueError(f"Unknown job kind: {name}")
+        job = Job(id=uuid.uuid4().hex[:12], name=name, params=params or {}, after=after)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._persist(job)
+            parent = self._jobs.get(after) if after else None
+            if after and parent is None:
+                self._finish(job, JobStatus.FAILED, error=f"Unknown job {after}")
+            elif parent is not None and not parent.is_finished:
+                self._waiting.setdefault(after, []).append(job.id)
+            else:
+                self._start_or_skip(job, parent)
+        return job
+
+    def _start_or_skip(self, job: Job, parent: Optional[Job]):
+        if parent is not None and parent.status != JobStatus.SUCCEEDED:
+            self._finish(job, JobStatus.CANCELLED, error=f"Job {parent.id} did not succeed")
+            return
+        fn, in_process = self._kinds[job.name]
+        params = dict(job.params, input=parent.result) if parent is not None else job.params
+        future = self._executor(in_process).submit(_run_job, fn, job.id, self.jobs_dir, params)
+        self._futures[job.id] = future
+        future.add_done_callback(lambda done, job_id=job.id: self._on_done(job_id, done))
+
+    def _executor(self, in_process: bool) -> Executor:
+        if in_process:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(self.max_threads, thread_name_prefix="job")
+            return self._thread_pool
+        if self._process_pool is None:
+            # Spawned rather than forked: the app process runs threads of its own
+            self._process_pool = ProcessPoolExecutor(
+                self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._process_pool
+
+    def _on_done(self, job_id: str, future: Future):
+        with self._lock:
+            job = self._jobs[job_id]
+            self._futures.pop(job_id, None)
+            if future.cancelled():
+                self._finish(job, JobStatus.CANCELLED)
+            elif isinstance(future.exception(), JobCancelled):
+                self._finish(job, JobStatus.CANCELLED, started=True)
+            elif future.exception() is not None:
+                error = future.exception()
+                self._finish(job, JobStatus.FAILED, error=f"{type(error).__name__}: {error}", started=True)
+            else:
+                self._finish(job, JobStatus.SUCCEEDED, result=future.result(), started=True)
+
+            for child_id in self._waiting.pop(job_id, []):
+                child = self._jobs[child_id]
+                if not child.is_finished:
+                    self._start_or_skip(child, job)
+
+    def _finish(self, job: Job, status: JobStatus, result: Optional[Dict] = None,
+                error: str = "", started: bool = False):
+        if started:
+            self._merge_progress(job)
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = datetime.now()
+        if status == JobStatus.SUCCEEDED:
+            job.progress = 1.0
+        for path in (_progress_path(self.jobs_dir, job.id), _cancel_path(self.jobs_dir, job.id)):
+            if os.path.exists(path):
+                os.remove(path)
+        self._persist(job)
+        self._prune()
+
+    # Reading
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """A job with its latest progress"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and not job.is_finished:
+                self._merge_progress(job)
+            return job
+
+    def list_jobs(self, limit: int = 20) -> List[Job]:
+        """Most recent jobs first"""
+        with self._lock:
+            jobs = sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)[:limit]
+            for job in jobs:
+                if not job.is_finished:
+                    self._merge_progress(job)
+            return jobs
+
+    def _merge_progress(self, job: Job):
+        try:
+            with open(_progress_path(self.jobs_dir, job.id)) as f:
+                progress = json.load(f)
+        except (OSError, ValueError):
+            return
+        job.status = JobStatus.RUNNING if not job.is_finished else job.status
+        job.progress = progress["progress"]
+        job.message = progress["message"]
+        job.started_at = datetime.fromisoformat(progress["started_at"])
+
+    # Cancelling
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job, or ask a running one to stop at its next progress report"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.is_finished:
+                return False
+            future = self._futures.get(job_id)
+            if future is None:
+                # Waiting for the job it runs after
+                self._finish(job, JobStatus.CANCELLED)
+                return True
+            if future.cancel():
+                return True
+            with open(_cancel_path(self.jobs_dir, job_id), "w"):
+                pass
+            return True
+
+    def shutdown(self):
+        """Stop the pools, cancelling jobs that have not started"""
+        for pool in (self._process_pool, self._thread_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    # Records
+
+    def _persist(self, job: Job):
+        _write_json(_record_path(self.jobs_dir, job.id), job.to_dict())
+
+    def _load_records(self):
+        for filename in os.listdir(self.jobs_dir):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.jobs_dir, filename)) as f:
+                    job = Job.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            self._jobs[job.id] = job
+            if not job.is_finished:
+                self._finish(job, JobStatus.FAILED, error="Interrupted by a restart")
+
+    def _prune(self):
+        finished = sorted((job for job in self._jobs.values() if job.is_finished), key=lambda job: job.created_at)
+        for job in finished[:max(len(finished) - self.history, 0)]:
+            del self._jobs[job.id]
+            os.remove(_record_path(self.jobs_dir, job.id))
+            path = (job.result or {}).get("path")
+            if path and os.path.dirname(os.path.abspath(path)) == os.path.abspath(os.path.join(self.jobs_dir, "results")):
+                if os.path.exists(path):
+                    os.remove(path)
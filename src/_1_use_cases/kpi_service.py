@@ -0,0 +1,139 @@
+import threading
+from bisect import bisect_right
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+from datetime import datetime, timedelta
+from src._0_domain.hackathon import HackathonStatus
+from src._0_domain.money import to_cents
+from src._0_domain.mvp import MVPStatus
+from src._1_use_cases.fee_engine import FeeEngine
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.mvp_service import MVPService
+
+class KPIService:
+    """Platform KPIs kept current from hackathon and MVP service events.
+
+    Counters are computed once from the services' current state, then every
+    event adjusts them in place, so reads are O(1) whatever the number of
+    hackathons and MVPs. A snapshot of the counters is kept every
+    `snapshot_interval` for `history` so metric deltas compare against the
+    real value from that long ago. Platform revenue adds up the fee charged
+    on each backing, as the ledger does, rather than taking the fee on the
+    total.
+    """
+
+    def __init__(self, hackathon_service: HackathonService, mvp_service: MVPService,
+                 snapshot_interval: timedelta = timedelta(minutes=15),
+                 history: timedelta = timedelta(days=30),
+                 clock: Callable[[], datetime] = datetime.now):
+        self.snapshot_interval = snapshot_interval
+        self.clock = clock
+        self.fee_engine = FeeEngine()
+        self._counters: Dict[str, int] = {}
+        kept = int(history / snapshot_interval) + 1
+        self._snapshots: Deque[Tuple[datetime, Dict[str, int]]] = deque(maxlen=kept)
+        # Snapshot times alone, in step with _snapshots, for get_deltas to bisect
+        self._snapshot_times: Deque[datetime] = deque(maxlen=kept)
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._rebuild(hackathon_service, mvp_service)
+            self._take_snapshot(self.clock())
+        hackathon_service.add_listener(self._on_hackathon_event)
+        mvp_service.add_listener(self._on_mvp_event)
+
+    def _rebuild(self, hackathon_service: HackathonService, mvp_service: MVPService):
+        hackathons = hackathon_service.get_all_hackathons()
+        mvps = mvp_service.get_all_mvps()
+        self._counters = {
+            "total_hackathons": len(hackathons),
+            "active_hackathons": sum(1 for h in hackathons if h.status == HackathonStatus.OPEN),
+            "total_participants": sum(h.current_participants for h in hackathons),
+            "total_mvps": len(mvps),
+            "submitted_mvps": sum(1 for mvp in mvps if mvp.status == MVPStatus.SUBMITTED),
+            "funded_mvps": sum(1 for mvp in mvps if mvp.status == MVPStatus.FUNDED),
+            "total_funding_cents": sum(to_cents(mvp.current_funding) for mvp in mvps),
+            # Backings made before start-up are only known per MVP
+            "platform_revenue_cents": sum(self.fee_engine.fee_cents(to_cents(mvp.current_funding)) for mvp in mvps),
+            "total_backers": sum(mvp.backers_count for mvp in mvps),
+        }
+
+    # Events
+
+    def _on_hackathon_event(self, event: str, hackathon, old_status: Optional[HackathonStatus] = None):
+        with self._lock:
+            if event == "hackathon_created":
+                self._counters["total_hackathons"] += 1
+                self._count_hackathon_status(hackathon.status, 1)
+                self._counters["total_participants"] += hackathon.current_participants
+            elif event == "hackathon_status_changed":
+                self._count_hackathon_status(old_status, -1)
+                self._count_hackathon_status(hackathon.status, 1)
+            elif event == "participant_joined":
+                self._counters["total_participants"] += 1
+            self._maybe_snapshot()
+
+    def _on_mvp_event(self, event: str, mvp, old_status: Optional[MVPStatus] = None,
+                      amount: float = 0.0, backers: int = 0, platform_fee: float = 0.0):
+        with self._lock:
+            if event == "mvp_created":
+                self._counters["total_mvps"] += 1
+                self._count_mvp_status(mvp.status, 1)
+            elif event == "mvp_status_changed":
+                self._count_mvp_status(old_status, -1)
+                self._count_mvp_status(mvp.status, 1)
+            elif event == "funding_applied":
+                self._counters["total_funding_cents"] += to_cents(amount)
+                self._counters["platform_revenue_cents"] += to_cents(platform_fee)
+                self._counters["total_backers"] += backers
+            elif event == "funding_refunded":
+                self._counters["total_funding_cents"] -= to_cents(amount)
+                self._counters["platform_revenue_cents"] -= to_cents(platform_fee)
+                self._counters["total_backers"] -= backers
+            self._maybe_snapshot()
+
+    def _count_hackathon_status(self, status: HackathonStatus, change: int):
+        if status == HackathonStatus.OPEN:
+            self._counters["active_hackathons"] += change
+
+    def _count_mvp_status(self, status: MVPStatus, change: int):
+        if status == MVPStatus.SUBMITTED:
+            self._counters["submitted_mvps"] += change
+        elif status == MVPStatus.FUNDED:
+            self._counters["funded_mvps"] += change
+
+    # History
+
+    def _maybe_snapshot(self):
+        now = self.clock()
+        if now - self._snapshot_times[-1] >= self.snapshot_interval:
+            self._take_snapshot(now)
+
+    def _take_snapshot(self, now: datetime):
+        self._snapshots.append((now, dict(self._counters)))
+        self._snapshot_times.append(now)
+
+    # Reads
+
+    def get_metrics(self) -> Dict:
+        """Current platform KPIs"""
+        with self._lock:
+            self._maybe_snapshot()
+            return self._present(self._counters)
+
+    def get_deltas(self, period: timedelta = timedelta(days=1)) -> Dict:
+        """Change of every KPI over `period`, against the newest snapshot at least
+        that old (or the oldest one kept, if history is shorter)"""
+        with self._lock:
+            self._maybe_snapshot()
+            current = self._present(self._counters)
+            cutoff = self.clock() - period
+            index = max(bisect_right(self._snapshot_times, cutoff) - 1, 0)
+            past = self._present(self._snapshots[index][1])
+        return {key: current[key] - past[key] for key in current}
+
+    def _present(self, counters: Dict[str, int]) -> Dict:
+        metrics = {key: value for key, value in counters.items() if not key.endswith("_cents")}
+        metrics["total_funding"] = counters["total_funding_cents"] / 100
+        metrics["platform_revenue"] = counters["platform_revenue_cents"] / 100
+        return metrics
@@ -0,0 +1,190 @@
+import threading
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+from datetime import date, datetime, timedelta
+from src._0_domain.money import to_cents
+from src._0_domain.mvp import MVP
+from src._0_domain.transaction import Transaction
+from src._1_use_cases.mvp_service import MVPService
+
+class _Ranking:
+    """Every key's score, plus the top `capacity` kept in descending order.
+
+    Raising a score only touches the short top list. Only a top entry
+    falling below the rest needs a rescan of all scores to refill the list,
+    which happens on refunds, not on ordinary funding.
+    """
+    __slots__ = ("capacity", "scores", "top_order", "top_keys")
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.scores: Dict[str, int] = {}
+        self.top_order: List[Tuple[int, str]] = []  # (-score, key), ascending
+        self.top_keys: Set[str] = set()
+
+    def set(self, key: str, score: int):
+        old = self.scores.get(key, 0)
+        if old == score:
+            return
+        if score:
+            self.scores[key] = score
+        else:
+            del self.scores[key]
+
+        if key in self.top_keys:
+            del self.top_order[bisect_left(self.top_order, (-old, key))]
+            self.top_keys.discard(key)
+            others_outside = len(self.scores) - len(self.top_keys) - (1 if score else 0)
+            if others_outside > 0 and (not score or not self.top_order or (-score, key) > self.top_order[-1]):
+                self._refill()
+                return
+        if score and (len(self.top_order) < self.capacity or (-score, key) < self.top_order[-1]):
+            insort(self.top_order, (-score, key))
+            self.top_keys.add(key)
+            if len(self.top_order) > self.capacity:
+                self.top_keys.discard(self.top_order.pop()[1])
+
+    def _refill(self):
+        self.top_order = sorted((-score, key) for key, score in self.scores.items())[:self.capacity]
+        self.top_keys = {key for _, key in self.top_order}
+
+    def add(self, key: str, change: int):
+        self.set(key, self.scores.get(key, 0) + change)
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        if k > self.capacity:
+            return [(key, -negative) for negative, key in sorted((-s, key) for key, s in self.scores.items())[:k]]
+        return [(key, -negative) for negative, key in self.top_order[:k]]
+
+class _InvestorMonth:
+    """One calendar month of backing totals per investor"""
+    __slots__ = ("ranking", "projects")
+
+    def __init__(self):
+        self.ranking = _Ranking()
+        self.projects: Dict[str, Set[str]] = {}
+
+class LeaderboardService:
+    """Top-k leaderboards kept current from funding events.
+
+    MVPs are ranked by funding and by backers from MVP service events, and
+    investors by net amount backed per calendar month and over a rolling
+    window of days from transaction store batches. Every ranking keeps its
+    leaders in a short sorted list updated in place, so reading the top k
+    is a slice of k entries.
+    The rolling window keeps per-day totals and subtracts days as they
+    leave the window.
+    """
+
+    def __init__(self, mvp_service: MVPService, rolling_days: int = 30, months_kept: int = 24,
+                 clock: Callable[[], datetime] = datetime.now):
+        self.mvp_service = mvp_service
+        self.rolling_days = rolling_days
+        self.months_kept = months_kept
+        self.clock = clock
+        self._mvps_by_funding = _Ranking()
+        self._mvps_by_backers = _Ranking()
+        self._months: Dict[str, _InvestorMonth] = {}
+        self._rolling = _Ranking()
+        self._rolling_days: Deque[Tuple[date, Dict[str, int]]] = deque()  # Ascending days
+        self._lock = threading.Lock()
+
+        with self._lock:
+            for mvp in mvp_service.get_all_mvps():
+                self._rank_mvp(mvp)
+        mvp_service.add_listener(self._on_mvp_event)
+
+    # MVPs
+
+    def _on_mvp_event(self, event: str, mvp: MVP, **data):
+        if event in ("mvp_created", "funding_applied", "funding_refunded"):
+            with self._lock:
+                self._rank_mvp(mvp)
+
+    def _rank_mvp(self, mvp: MVP):
+        self._mvps_by_funding.set(mvp.id, to_cents(mvp.current_funding))
+        self._mvps_by_backers.set(mvp.id, mvp.backers_count)
+
+    def top_mvps_by_funding(self, k: int = 5) -> List[MVP]:
+        """MVPs with the most funding, highest first"""
+        with self._lock:
+            ranked = self._mvps_by_funding.top(k)
+        return [mvp for mvp in (self.mvp_service.get_mvp(mvp_id) for mvp_id, _ in ranked) if mvp]
+
+    def top_mvps_by_backers(self, k: int = 5) -> List[MVP]:
+        """MVPs with the most backers, highest first"""
+        with self._lock:
+            ranked = self._mvps_by_backers.top(k)
+        return [mvp for mvp in (self.mvp_service.get_mvp(mvp_id) for mvp_id, _ in ranked) if mvp]
+
+    # Investors
+
+    def add_transactions(self, transactions: List[Transaction]):
+        """Fold a batch of funding and refund transactions into the investor rankings"""
+        with self._lock:
+            today = self.clock().date()
+            self._expire(today)
+            window_start = today - timedelta(days=self.rolling_days - 1)
+            for transaction in transactions:
+                cents = to_cents(transaction.amount)
+                if transaction.is_refund:
+                    cents = -cents
+                month_key = transaction.created_at.strftime("%Y-%m")
+                month = self._months.get(month_key)
+                if month is None:
+                    month = self._months[month_key] = _InvestorMonth()
+                    self._prune_months()
+                month.ranking.add(transaction.backer_id, cents)
+                if not transaction.is_refund:
+                    month.projects.setdefault(transaction.backer_id, set()).add(transaction.mvp_id)
+
+                day = transaction.created_at.date()
+                if window_start <= day <= today:
+                    self._rolling.add(transaction.backer_id, cents)
+                    day_totals = self._day_totals(day)
+                    day_totals[transaction.backer_id] = day_totals.get(transaction.backer_id, 0) + cents
+
+    def _day_totals(self, day: date) -> Dict[str, int]:
+        for bucket_day, totals in reversed(self._rolling_days):
+            if bucket_day == day:
+                return totals
+            if bucket_day < day:
+                break
+        totals: Dict[str, int] = {}
+        self._rolling_days.append((day, totals))
+        if len(self._rolling_days) > 1 and self._rolling_days[-2][0] > day:
+            # A late transaction for an earlier day: keep the days in order
+            self._rolling_days = deque(sorted(self._rolling_days, key=lambda bucket: bucket[0]))
+        return totals
+
+    def _expire(self, today: date):
+        window_start = today - timedelta(days=self.rolling_days - 1)
+        while self._rolling_days and self._rolling_days[0][0] < window_start:
+            _, totals = self._rolling_days.popleft()
+            for backer_id, cents in totals.items():
+                self._rolling.add(backer_id, -cents)
+
+    def _prune_months(self):
+        for month_key in sorted(self._months)[:-self.months_kept]:
+            del self._months[month_key]
+
+    def top_investors(self, k: int = 5, month: Optional[str] = None) -> List[Dict]:
+        """Investors who backed the most in a calendar month ("YYYY-MM",
+        default this month), with the number of projects they backed"""
+        month_key = month or self.clock().strftime("%Y-%m")
+        with self._lock:
+            investor_month = self._months.get(month_key)
+            if investor_month is None:
+                return []
+            return [
+                {"backer_id": backer_id, "invested": cents / 100,
+                 "projects": len(investor_month.projects.get(backer_id, ()))}
+                for backer_id, cents in investor_month.ranking.top(k)
+            ]
+
+    def top_investors_rolling(self, k: int = 5) -> List[Dict]:
+        """Investors who backed the most over the last `rolling_days` days"""
+        with self._lock:
+            self._expire(self.clock().date())
+            return [{"backer_id": backer_id, "invested": cents / 100} for backer_id, cents in self._rolling.top(k)]
@@ -1,13 +1,61 @@
-from typing import List, Optional
+import threading
+import zlib
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
+from src._0_domain.money import fee_cents, to_cents
 from src._0_domain.mvp import MVP, MediaFile, FundingGoal, MVPStatus, FundingTier
 from src._0_domain.user import UserProfile
+from src._1_use_cases.pagination import CatalogIndex
+
+# Funding updates lock one of these stripes, chosen by MVP id, so backers of
+# different MVPs rarely wait on each other while updates to one MVP serialize
+FUNDING_LOCK_STRIPES = 64
 
 class MVPService:
     def __init__(self):
         self._mvps = {}
+        self._create_lock = threading.Lock()
+        self._funding_locks = [threading.Lock() for _ in range(FUNDING_LOCK_STRIPES)]
+        self._listeners: List[Callable[..., None]] = []
+        self.version = 0  # Bumped on every change, for caches of derived data
+        self._version_lock = threading.Lock()  # Changes to different entities emit concurrently
+        self.catalog_version = 0  # Bumped only by creates and edits, for the catalog's sort orders
+        self._index = CatalogIndex(
+            self.get_all_mvps,
+            sort_keys={
+                "recent": lambda mvp: (mvp.submission_datetime or datetime.min, mvp.id),
+                "title": lambda mvp: mvp.title.lower(),
+                "funding": lambda mvp: mvp.current_funding,
+                "backers": lambda mvp: mvp.backers_count,
+            },
+            search_text=lambda mvp: " ".join([mvp.title, mvp.description, mvp.creator_id, *mvp.tech_stack]),
+            volatile=("funding", "backers")
+        )
         self._initialize_sample_data()
     
+    def add_listener(self, listener: Callable[..., None]):
+        """Call `listener(event, **data)` after every change from now on.
+        
+        Events: mvp_created (mvp), mvp_updated (mvp), mvp_status_changed
+        (mvp, old_status), funding_applied and funding_refunded (mvp, amount,
+        backers, platform_fee). `platform_fee` is the sum of the fees charged on
+        each backing, not the fee on `amount`.
+        """
+        self._listeners.append(listener)
+    
+    def _emit(self, event: str, **data):
+        with self._version_lock:
+            self.version += 1
+            if event in ("mvp_created", "mvp_updated"):
+                self.catalog_version += 1
+        if event in ("funding_applied", "funding_refunded"):
+            self._index.reposition(data["mvp"])
+        for listener in self._listeners:
+            listener(event, **data)
+    
+    def _funding_lock(self, mvp_id: str) -> threading.Lock:
+        return self._funding_locks[zlib.crc32(mvp_id.encode()) % FUNDING_LOCK_STRIPES]
+    
     def _initialize_sample_data(self):
         """Initialize with sample MVPs for demonstration"""
         sample_mvps = [
@@ -87,27 +135,39 @@ class MVPService:
     
     def create_mvp(self, mvp_data: dict, creator: UserProfile) -> MVP:
         """Create a new MVP"""
-        mvp_id = f"mvp{len(self._mvps) + 1:03d}"
-        
-        mvp = MVP(
-            id=mvp_id,
-            hackathon_id=mvp_data.get("hackathon_id", ""),
-            creator_id=creator.id,
-            title=mvp_data.get("title", ""),
-            description=mvp_data.get("description", ""),
-            tech_stack=mvp_data.get("tech_stack", []),
-            github_url=mvp_data.get("github_url", ""),
-            demo_url=mvp_data.get("demo_url", ""),
-            funding_goals=mvp_data.get("funding_goals", [])
-        )
-        
-        self._mvps[mvp_id] = mvp
+        with self._create_lock:
+            mvp_id = f"mvp{len(self._mvps) + 1:03d}"
+            mvp = MVP(
+                id=mvp_id,
+                hackathon_id=mvp_data.get("hackathon_id", ""),
+                creator_id=creator.id,
+                title=mvp_data.get("title", ""),
+                description=mvp_data.get("description", ""),
+                tech_stack=mvp_data.get("tech_stack", []),
+                github_url=mvp_data.get("github_url", ""),
+                demo_url=mvp_data.get("demo_url", ""),
+                funding_goals=mvp_data.get("funding_goals", [])
+            )
+            self._mvps[mvp_id] = mvp
+        self._emit("mvp_created", mvp=mvp)
         return mvp
     
     def get_all_mvps(self) -> List[MVP]:
         """Get all MVPs"""
         return list(self._mvps.values())
     
+    def query_mvps(self, search: str = "", status: Optional[MVPStatus] = None,
+                   hackathon_id: Optional[str] = None, sort_by: str = "recent", descending: bool = True,
+                   page: int = 1, page_size: int = 10) -> Dict:
+        """One page of MVPs matching a search, status and hackathon, sorted by
+        recent, title, funding or backers"""
+        if status or hackathon_id:
+            matches = lambda mvp: ((status is None or mvp.status == status)
+                                   and (hackathon_id is None or mvp.hackathon_id == hackathon_id))
+        else:
+            matches = None
+        return self._index.query(self.catalog_version, search, matches, sort_by, descending, page, page_size)
+    
     def get_mvp(self, mvp_id: str) -> Optional[MVP]:
         """Get MVP by ID"""
         return self._mvps.get(mvp_id)
@@ -122,19 +182,93 @@ class MVPService:
     
     def add_funding(self, mvp_id: str, amount: float, backer_id: str) -> bool:
         """Add funding to an MVP"""
+        return self._apply_funding(mvp_id, amount, 1, fee_cents(to_cents(amount)) / 100)
+    
+    def _apply_funding(self, mvp_id: str, amount: float, backers: int, platform_fee: float) -> bool:
         mvp = self._mvps.get(mvp_id)
-        if mvp and mvp.status in [MVPStatus.SUBMITTED, MVPStatus.FUNDED]:
+        if not mvp:
+            return False
+        with self._funding_lock(mvp_id):
+            if mvp.status not in [MVPStatus.SUBMITTED, MVPStatus.FUNDED]:
+                return False
+            old_status = mvp.status
             mvp.current_funding += amount
-            mvp.backers_count += 1
+            mvp.backers_count += backers
             if mvp.current_funding >= sum(goal.amount for goal in mvp.funding_goals):
                 mvp.status = MVPStatus.FUNDED
+            self._emit("funding_applied", mvp=mvp, amount=amount, backers=backers, platform_fee=platform_fee)
+            if mvp.status != old_status:
+                self._emit("mvp_status_changed", mvp=mvp, old_status=old_status)
             return True
-        return False
+    
+    def apply_funding_batch(self, fundings: List[Dict]) -> Dict[str, bool]:
+        """Apply many confirmed fundings, updating each MVP once.
+
+        Each funding is a dict with `mvp_id`, `amount` and optionally the
+        `platform_fee` charged on it. Returns whether each MVP accepted its
+        funding.
+        """
+        totals = self._batch_totals(fundings)
+        return {
+            mvp_id: self._apply_funding(mvp_id, amount, backers, fee / 100)
+            for mvp_id, (amount, backers, fee) in totals.items()
+        }
+    
+    @staticmethod
+    def _batch_totals(items: List[Dict]) -> Dict[str, list]:
+        """Amount, backers and platform fee cents per MVP"""
+        totals = {}
+        for item in items:
+            total = totals.setdefault(item["mvp_id"], [0.0, 0, 0])
+            total[0] += item["amount"]
+            total[1] += 1
+            if "platform_fee" in item:
+                total[2] += to_cents(item["platform_fee"])
+            else:
+                total[2] += fee_cents(to_cents(item["amount"]))
+        return totals
+    
+    def apply_refund_batch(self, refunds: List[Dict]):
+        """Take refunded backings back out of MVP funding, updating each MVP once.
+        
+        Each refund is a dict with `mvp_id`, `amount` and optionally the
+        `platform_fee` charged on it.
+        """
+        for mvp_id, (amount, backers, fee) in self._batch_totals(refunds).items():
+            mvp = self._mvps.get(mvp_id)
+            if not mvp:
+                continue
+            with self._funding_lock(mvp_id):
+                old_status = mvp.status
+                # Never take out more than was there, so listeners see the real change
+                amount = min(amount, mvp.current_funding)
+                backers = min(backers, mvp.backers_count)
+                mvp.current_funding -= amount
+                mvp.backers_count -= backers
+                if mvp.status == MVPStatus.FUNDED and mvp.current_funding < sum(goal.amount for goal in mvp.funding_goals):
+                    mvp.status = MVPStatus.SUBMITTED
+                self._emit("funding_refunded", mvp=mvp, amount=amount, backers=backers, platform_fee=fee / 100)
+                if mvp.status != old_status:
+                    self._emit("mvp_status_changed", mvp=mvp, old_status=old_status)
+    
+    def update_mvp(self, mvp_id: str, changes: dict) -> Optional[MVP]:
+        """Edit the title, description, tech stack or links of an MVP"""
+        mvp = self._mvps.get(mvp_id)
+        if mvp:
+            for field in ("title", "description", "tech_stack", "github_url", "demo_url"):
+                if field in changes:
+                    setattr(mvp, field, changes[field])
+            self._emit("mvp_updated", mvp=mvp)
+        return mvp
     
     def update_mvp_status(self, mvp_id: str, status: MVPStatus) -> bool:
         """Update MVP status"""
         mvp = self._mvps.get(mvp_id)
         if mvp:
-            mvp.status = status
+            with self._funding_lock(mvp_id):
+                old_status = mvp.status
+                mvp.status = status
+                if status != old_status:
+                    self._emit("mvp_status_changed", mvp=mvp, old_status=old_status)
             return True
         return False
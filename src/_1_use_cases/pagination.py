@@ -0,0 +1,114 @@
+import math
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class CatalogIndex(Generic[T]):
+    """Sorted views and search text of a service's catalog, for paged queries.
+
+    Each sort order, with the lowercase search text of its items alongside,
+    is built once per catalog version and reused until the owning service's
+    `catalog_version` changes, which only creates and edits bump. Sort keys
+    listed as `volatile`, such as funding, change far more often; the
+    service passes each changed item to `reposition`, which moves it within
+    those orders only. A query narrows the ready list by plain substring
+    checks and slices out the one page it returns, so what the caller
+    renders depends on the page size, not on the catalog size.
+    """
+
+    def __init__(self, items: Callable[[], List[T]], sort_keys: Dict[str, Callable[[T], object]],
+                 search_text: Callable[[T], str], volatile: Iterable[str] = ()):
+        self.items = items
+        self.sort_keys = sort_keys
+        self.search_text = search_text
+        self.volatile = tuple(volatile)
+        self._version: Optional[int] = None
+        # Sort key -> (items, their search text, their sort keys), all in sort order
+        self._sorted: Dict[str, Tuple[List[T], List[str], List]] = {}
+        self._item_keys: Dict[str, Dict[int, object]] = {}  # Volatile sort key -> id(item) -> its key in the view
+        self._lock = threading.Lock()
+
+    def query(self, version: int, search: str = "", matches: Optional[Callable[[T], bool]] = None,
+              sort_by: Optional[str] = None, descending: bool = False,
+              page: int = 1, page_size: int = 10) -> Dict:
+        """One page of the items matching `search` and `matches`, in sort order.
+
+        Returns the page's items, the number of matches, the page number
+        (clamped to the last page) and the page count.
+        """
+        sort_by = sort_by or next(iter(self.sort_keys))
+        if sort_by not in self.sort_keys:
+            raise ValueError(f"Unknown sort key: {sort_by}")
+        terms = search.lower().split()
+        # Held throughout, as `reposition` moves items within the lists in place
+        with self._lock:
+            ordered, texts, _ = self._views(version, sort_by)
+            if not terms and matches is None:
+                return _paginate(ordered, descending, page, page_size)
+            # Narrow by one search term at a time, cheapest check first
+            positions = range(len(ordered))
+            for term in terms:
+                positions = [i for i in positions if term in texts[i]]
+            if matches is not None:
+                positions = [i for i in positions if matches(ordered[i])]
+            return _paginate([ordered[i] for i in positions], descending, page, page_size)
+
+    def _views(self, version: int, sort_by: str) -> Tuple[List[T], List[str], List]:
+        """The items in `sort_by` order, their search text and their sort keys"""
+        if version != self._version:
+            self._sorted = {}
+            self._item_keys = {}
+            self._version = version
+        views = self._sorted.get(sort_by)
+        if views is None:
+            sort_key = self.sort_keys[sort_by]
+            keyed = sorted(((sort_key(item), item) for item in self.items()), key=lambda pair: pair[0])
+            ordered = [item for _, item in keyed]
+            keys = [key for key, _ in keyed]
+            texts = [self.search_text(item).lower() for item in ordered]
+            views = self._sorted[sort_by] = (ordered, texts, keys)
+            if sort_by in self.volatile:
+                self._item_keys[sort_by] = {id(item): key for key, item in keyed}
+        return views
+
+    def reposition(self, item: T):
+        """Move an item whose volatile sort keys changed to its new place in those orders"""
+        with self._lock:
+            for sort_by in self.volatile:
+                views, item_keys = self._sorted.get(sort_by), self._item_keys.get(sort_by)
+                if views is None or id(item) not in item_keys:
+                    continue
+                ordered, texts, keys = views
+                old_key, new_key = item_keys[id(item)], self.sort_keys[sort_by](item)
+                if new_key == old_key:
+                    continue
+                position = bisect_left(keys, old_key)
+                while ordered[position] is not item:
+                    position += 1
+                del ordered[position], keys[position]
+                text = texts.pop(position)
+                position = bisect_right(keys, new_key)
+                ordered.insert(position, item)
+                texts.insert(position, text)
+                keys.insert(position, new_key)
+                item_keys[id(item)] = new_key
+
+def _paginate(items: List[T], descending: bool, page: int, page_size: int) -> Dict:
+    page_size = max(page_size, 1)
+    total = len(items)
+    pages = max(math.ceil(total / page_size), 1)
+    page = min(max(page, 1), pages)
+    first = (page - 1) * page_size
+    if descending:
+        page_items = items[max(total - first - page_size, 0):total - first][::-1]
+    else:
+        page_items = items[first:first + page_size]
+    return {
+        "items": page_items,
+        "total": total,
+        "page": page,
+        "pages": pages,
+        "page_size": page_size,
+    }
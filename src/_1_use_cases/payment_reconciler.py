@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+from src._1_use_cases.payment_service import PaymentService
+from src._1_use_cases.webhook_processor import WebhookProcessor
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` calls per second"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate / 10)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call is allowed"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+class PaymentReconciler:
+    """Catches up on open payments whose webhooks never arrived.
+
+    Streams every non-terminal payment known to the payment service, fetches
+    its current status from Mollie on a thread pool under a rate limit and
+    applies whatever changed through the webhook processor, so funding lands
+    in the ledger exactly once whichever path sees it first. Progress is
+    checkpointed after every chunk; a run that crashes resumes after the
+    last completed chunk, also after a restart when the payment registry is
+    file-backed. A checkpoint saved against another payment registry is
+    discarded and the run starts from the beginning.
+    """
+
+    def __init__(self, payment_service: PaymentService, webhook_processor: WebhookProcessor,
+                 checkpoint_path: Optional[str] = None, concurrency: int = 16,
+                 rate_limit: float = 100.0, batch_size: int = 1000):
+        self.payment_service = payment_service
+        self.webhook_processor = webhook_processor
+        self.checkpoint_path = checkpoint_path
+        self.concurrency = concurrency
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.batch_size = batch_size
+        self._cancelled = threading.Event()
+        self._run_lock = threading.Lock()
+
+    def run(self, max_payments: Optional[int] = None,
+            progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """Reconcile open payments, resuming from the checkpoint if there is one.
+
+        `progress` is called with the stats after every checkpointed chunk;
+        an exception it raises stops the run, which resumes from there.
+        """
+        if not self._run_lock.acquire(blocking=False):
+            return {"error": "Reconciliation is already running"}
+        self._cancelled.clear()
+        try:
+            checkpoint = self.load_checkpoint()
+            stats = checkpoint["stats"]
+            stats["resumed_from"] = checkpoint["last_seq"]
+            last_seq = checkpoint["last_seq"]
+            start = time.perf_counter()
+
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="reconcile") as pool:
+                for chunk in self.payment_service.iter_open_payments(last_seq, self.batch_size):
+                    if self._cancelled.is_set():
+                        break
+                    if max_payments is not None:
+                        remaining = max_payments - stats["checked"]
+                        if remaining <= 0:
+                            break
+                        chunk = chunk[:remaining]
+
+                    payments = {}
+                    for payment_id, payment in pool.map(self._fetch, [payment_id for _, payment_id in chunk]):
+                        if "error" in payment:
+                            stats["errors"] += 1
+                        else:
+                            payments[payment_id] = payment
+
+                    # Statuses that did not move need no ledger work
+                    changed = {
+                        payment_id: payment for payment_id, payment in payments.items()
+                        if payment.get("status") != "open"
+                    }
+                    stats["applied"] += self.webhook_processor.apply_payment_statuses(changed)
+                    stats["changed"] += len(changed)
+                    stats["checked"] += len(chunk)
+                    last_seq = chunk[-1][0]
+                    self._save_checkpoint(last_seq, stats)
+                    if progress:
+                        progress(stats)
+                else:
+                    self.clear_checkpoint()
+                    stats["completed"] = True
+
+            stats["seconds"] = stats.get("seconds", 0.0) + time.perf_counter() - start
+            return stats
+        finally:
+            self._run_lock.release()
+
+    def cancel(self):
+        """Stop after the chunk in progress; the next run resumes from there"""
+        self._cancelled.set()
+
+    def _fetch(self, payment_id: str) -> Tuple[str, Dict]:
+        self.rate_limiter.acquire()
+        return payment_id, self.payment_service.get_payment_status(payment_id, refresh=True)
+
+    # Checkpointing
+
+    def load_checkpoint(self) -> Dict:
+        """Get the saved progress of this payment registry, or a fresh start"""
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as f:
+                checkpoint = json.load(f)
+            if checkpoint.get("epoch") == self.payment_service.registry_epoch:
+                return checkpoint
+            # Its seq numbers belong to another registry, e.g. an in-memory one that is gone
+            self.clear_checkpoint()
+        return {"last_seq": 0, "stats": {"checked": 0, "changed": 0, "applied": 0, "errors": 0, "completed": False}}
+
+    def _save_checkpoint(self, last_seq: int, stats: Dict):
+        if not self.checkpoint_path:
+            return
+        # Write then rename so a crash never leaves a half-written checkpoint
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"epoch": self.payment_service.registry_epoch, "last_seq": last_seq, "stats": stats}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
@@ -1,16 +1,30 @@
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from src._2_adapters.mollie_adapter import MollieAdapter
+from src._2_adapters.payment_registry import PaymentRegistry
+from src._1_use_cases.payment_status_cache import PaymentStatusCache, TERMINAL_STATUSES
+from src._1_use_cases.fee_engine import FeeEngine
 
 class PaymentService:
-    def __init__(self):
-        self.mollie_adapter = MollieAdapter()
-        self.platform_fee_rate = 0.20  # 20% platform fee
+    def __init__(self, mollie_adapter=None, registry: Optional[PaymentRegistry] = None):
+        # Any object with MollieAdapter's methods, e.g. the pooled MollieClient
+        self.mollie_adapter = mollie_adapter or MollieAdapter()
+        self.status_cache = PaymentStatusCache()
+        self.fee_engine = FeeEngine()  # 20% platform fee
+        
+        # Created payments and their last known status; pass a file-backed
+        # registry for open payments to be reconciled after a restart
+        self.registry = registry or PaymentRegistry()
+    
+    @property
+    def registry_epoch(self) -> str:
+        """Identifies the registry that payment sequence numbers belong to"""
+        return self.registry.epoch
     
     def create_payment(self, amount: float, description: str, mvp_id: str, backer_id: str) -> Dict:
         """Create a payment for MVP funding"""
-        platform_fee = amount * self.platform_fee_rate
-        creator_amount = amount - platform_fee
+        fees = self.calculate_fees(amount)
+        amount, platform_fee, creator_amount = fees["amount"], fees["platform_fee"], fees["creator_amount"]
         
         payment_data = {
             "amount": amount,
@@ -25,6 +39,9 @@ class PaymentService:
         
         # Create payment through Mollie
         mollie_payment = self.mollie_adapter.create_payment(payment_data)
+        if mollie_payment.get("id"):
+            self.register_payment(mollie_payment["id"], amount, mvp_id, backer_id,
+                                  mollie_payment.get("status", "open"))
         
         return {
             "payment_id": mollie_payment.get("id"),
@@ -36,31 +53,84 @@ class PaymentService:
             "created_at": datetime.now().isoformat()
         }
     
-    def get_payment_status(self, payment_id: str) -> Dict:
-        """Get payment status from Mollie"""
-        return self.mollie_adapter.get_payment_status(payment_id)
+    def get_payment_status(self, payment_id: str, refresh: bool = False) -> Dict:
+        """Get payment status, served from cache unless stale or `refresh` is set"""
+        if refresh:
+            self.status_cache.invalidate(payment_id)
+        return self.status_cache.get(payment_id, self._fetch_payment_status)
     
-    def handle_webhook(self, payment_id: str) -> Dict:
-        """Handle Mollie webhook for payment updates"""
-        payment_status = self.get_payment_status(payment_id)
+    def _fetch_payment_status(self, payment_id: str) -> Dict:
+        payment = self.mollie_adapter.get_payment_status(payment_id)
+        if "error" not in payment:
+            self.record_status(payment_id, payment.get("status"))
+        return payment
+    
+    def invalidate_payment_status(self, payment_id: str):
+        """Forget a cached payment status, e.g. when a webhook reports a change"""
+        self.status_cache.invalidate(payment_id)
+    
+    def register_payment(self, payment_id: str, amount: float, mvp_id: str, backer_id: str,
+                         status: str = "open") -> Dict:
+        """Track a payment so it can be reconciled until it settles"""
+        return self.registry.register(payment_id, amount, mvp_id, backer_id, status,
+                                      is_open=status not in TERMINAL_STATUSES)
+    
+    def record_status(self, payment_id: str, status: str):
+        """Remember the latest known status of a tracked payment"""
+        self.registry.set_status(payment_id, status, is_open=status not in TERMINAL_STATUSES)
+    
+    def get_payment_record(self, payment_id: str) -> Optional[Dict]:
+        """Get the registry record of a payment"""
+        return self.registry.get(payment_id)
+    
+    def open_payment_count(self) -> int:
+        return self.registry.open_count()
+    
+    def iter_open_payments(self, after_seq: int = 0, batch_size: int = 1000) -> Iterator[List[Tuple[int, str]]]:
+        """Stream (seq, payment_id) of non-terminal payments in creation order.
         
-        # Process payment completion
-        if payment_status.get("status") == "paid":
-            # Update MVP funding
-            # Send notifications
-            # Update user balances
-            pass
+        Each batch is read after the previous one was consumed, so payments
+        that settled meanwhile are skipped.
+        """
+        while True:
+            batch = self.registry.open_after(after_seq, batch_size)
+            if not batch:
+                return
+            yield batch
+            after_seq = batch[-1][0]
+    
+    def handle_webhook(self, payment_id: str) -> Dict:
+        """Look up the payment a Mollie webhook refers to.
         
-        return payment_status
+        Funding is applied by WebhookProcessor, which queues webhooks and
+        applies each payment status transition exactly once.
+        """
+        return self.get_payment_status(payment_id, refresh=True)
+    
+    def simulate_payment_completion(self, payment_id: str) -> bool:
+        """Mark a demo payment as paid (only supported by the mock adapter)"""
+        mark_paid = getattr(self.mollie_adapter, "mark_paid", None)
+        if not (mark_paid and mark_paid(payment_id)):
+            return False
+        self.invalidate_payment_status(payment_id)
+        return True
+    
+    def refund_payment(self, payment_id: str, amount: Optional[float] = None,
+                       idempotency_key: Optional[str] = None) -> Dict:
+        """Refund a payment, in full unless `amount` is given"""
+        return self.mollie_adapter.refund_payment(payment_id, amount, idempotency_key=idempotency_key)
     
     def calculate_fees(self, amount: float) -> Dict[str, float]:
         """Calculate platform and processing fees"""
-        platform_fee = amount * self.platform_fee_rate
-        creator_amount = amount - platform_fee
+        platform_fee, creator_amount = self.fee_engine.split(amount)
+        amount_cents = platform_fee.cents + creator_amount.cents
         
         return {
-            "amount": amount,
-            "platform_fee": platform_fee,
-            "creator_amount": creator_amount,
-            "fee_percentage": self.platform_fee_rate * 100
+            "amount": amount_cents / 100,
+            "platform_fee": platform_fee.amount,
+            "creator_amount": creator_amount.amount,
+            "amount_cents": amount_cents,
+            "platform_fee_cents": platform_fee.cents,
+            "creator_amount_cents": creator_amount.cents,
+            "fee_percentage": self.fee_engine.fee_rate * 100
         }
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+TERMINAL_STATUSES = {"paid", "failed", "expired", "canceled"}
+
+# Seconds a non-terminal status may be served from cache
+DEFAULT_STATUS_TTLS = {
+    "open": 5.0,
+    "pending": 2.0,
+    "authorized": 2.0,
+}
+
+class _Lookup:
+    """A status fetch in progress, shared by concurrent readers"""
+    __slots__ = ("future", "stale")
+
+    def __init__(self):
+        self.future = Future()
+        self.stale = False
+
+class PaymentStatusCache:
+    """Cache of payment status lookups.
+
+    Terminal statuses never change, so they are kept until evicted by the
+    LRU bound. Non-terminal statuses expire after a short per-status TTL and
+    are only re-fetched once stale. Concurrent misses for the same payment
+    share a single in-flight lookup, and `invalidate` (called for webhooks)
+    makes the next read fetch fresh data.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 2.0,
+                 max_entries: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.ttls = ttls or DEFAULT_STATUS_TTLS
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+        self._entries: "OrderedDict[str, Tuple[Dict, Optional[float]]]" = OrderedDict()
+        self._in_flight: Dict[str, _Lookup] = {}
+        self._lock = threading.Lock()
+
+    def get(self, payment_id: str, loader: Callable[[str], Dict]) -> Dict:
+        """Get a payment's status, calling `loader` only when needed"""
+        with self._lock:
+            entry = self._entries.get(payment_id)
+            if entry is not None:
+                payment, expires_at = entry
+                if expires_at is None or self.clock() < expires_at:
+                    self._entries.move_to_end(payment_id)
+                    self.stats["hits"] += 1
+                    return payment
+
+            lookup = self._in_flight.get(payment_id)
+            if lookup is not None:
+                self.stats["coalesced"] += 1
+                owner = False
+            else:
+                lookup = self._in_flight[payment_id] = _Lookup()
+                self.stats["misses"] += 1
+                owner = True
+
+        if not owner:
+            return lookup.future.result()
+
+        try:
+            payment = loader(payment_id)
+        except BaseException as e:
+            with self._lock:
+                self._finish(payment_id, lookup)
+            lookup.future.set_exception(e)
+            raise
+
+        with self._lock:
+            # Skip storing results that an invalidation made obsolete mid-flight
+            if "error" not in payment and not lookup.stale:
+                self._store(payment_id, payment)
+            self._finish(payment_id, lookup)
+        lookup.future.set_result(payment)
+        return payment
+
+    def _store(self, payment_id: str, payment: Dict):
+        status = payment.get("status")
+        if status in TERMINAL_STATUSES:
+            expires_at = None
+        else:
+            expires_at = self.clock() + self.ttls.get(status, self.default_ttl)
+        self._entries[payment_id] = (payment, expires_at)
+        self._entries.move_to_end(payment_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _finish(self, payment_id: str, lookup: _Lookup):
+        if self._in_flight.get(payment_id) is lookup:
+            del self._in_flight[payment_id]
+
+    def invalidate(self, payment_id: str):
+        """Drop a cached status and detach any lookup already in flight"""
+        with self._lock:
+            self._entries.pop(payment_id, None)
+            lookup = self._in_flight.pop(payment_id, None)
+            if lookup is not None:
+                lookup.stale = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
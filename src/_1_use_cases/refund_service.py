@@ -0,0 +1,120 @@
+import html
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from src._0_domain.funding import FundingEntry, FundingEntryType
+from src._1_use_cases.payment_service import PaymentService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.funding_ledger import FundingLedger
+from src._1_use_cases.activity_feed_service import ActivityFeedService
+
+MAX_REPORTED_ERRORS = 100
+
+class RefundService:
+    """Bulk full refunds of funded payments.
+
+    Payment IDs are processed in chunks: refunds for a chunk are requested
+    from Mollie on a bounded thread pool, each with an idempotency key derived
+    from the payment ID so a retried or repeated run can never refund twice.
+    Successful refunds are then reversed in one go: refund entries are
+    appended to the funding ledger and MVP funding is reduced once per MVP.
+    """
+
+    def __init__(self, payment_service: PaymentService, mvp_service: MVPService,
+                 funding_ledger: FundingLedger, activity_feed: Optional[ActivityFeedService] = None,
+                 concurrency: int = 8, batch_size: int = 500):
+        self.payment_service = payment_service
+        self.mvp_service = mvp_service
+        self.funding_ledger = funding_ledger
+        self.activity_feed = activity_feed
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+
+        self._in_progress = set()
+        self._lock = threading.Lock()
+
+    def refund_payments(self, payment_ids: Iterable[str], reason: str = "") -> Dict:
+        """Refund every listed payment that was funded and not refunded yet"""
+        payment_ids = list(dict.fromkeys(payment_ids))
+        result = {"requested": len(payment_ids), "refunded": 0, "skipped": 0, "failed": 0,
+                  "amount_refunded": 0.0, "errors": {}}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="refund") as pool:
+            for start in range(0, len(payment_ids), self.batch_size):
+                chunk = self._claim(payment_ids[start:start + self.batch_size], result)
+                try:
+                    refunded = []
+                    for entry, refund in pool.map(self._refund, chunk):
+                        if "error" in refund:
+                            result["failed"] += 1
+                            if len(result["errors"]) < MAX_REPORTED_ERRORS:
+                                result["errors"][entry.payment_id] = refund["error"]
+                        else:
+                            refunded.append(entry)
+                    self._reverse(refunded, reason)
+                finally:
+                    with self._lock:
+                        self._in_progress.difference_update(entry.payment_id for entry in chunk)
+
+                result["refunded"] += len(refunded)
+                result["amount_refunded"] += sum(entry.amount for entry in refunded)
+        return result
+
+    def refund_hackathon_backers(self, hackathon_id: str, reason: str = "") -> Dict:
+        """Refund every backer of every MVP in a hackathon, e.g. after it is cancelled"""
+        payment_ids = []
+        for mvp in self.mvp_service.get_mvps_by_hackathon(hackathon_id):
+            payment_ids.extend(self.funding_ledger.get_payment_ids_for_mvp(mvp.id))
+        return self.refund_payments(payment_ids, reason or f"Hackathon {hackathon_id} refund")
+
+    def _claim(self, payment_ids: List[str], result: Dict) -> List[FundingEntry]:
+        """Pick the funded, unrefunded payments no other run is refunding"""
+        claimed = []
+        with self._lock:
+            for payment_id in payment_ids:
+                entry = self.funding_ledger.get_funded_entry(payment_id)
+                if (entry is None or payment_id in self._in_progress
+                        or self.funding_ledger.is_refunded(payment_id)):
+                    result["skipped"] += 1
+                    continue
+                self._in_progress.add(payment_id)
+                claimed.append(entry)
+        return claimed
+
+    def _refund(self, entry: FundingEntry) -> Tuple[FundingEntry, Dict]:
+        try:
+            refund = self.payment_service.refund_payment(
+                entry.payment_id, idempotency_key=f"refund-{entry.payment_id}"
+            )
+        except Exception as e:
+            refund = {"error": str(e)}
+        return entry, refund
+
+    def _reverse(self, entries: List[FundingEntry], reason: str):
+        if not entries:
+            return
+        self.mvp_service.apply_refund_batch(
+            [{"mvp_id": entry.mvp_id, "amount": entry.amount, "platform_fee": entry.platform_fee}
+             for entry in entries]
+        )
+        self.funding_ledger.append([
+            FundingEntry(
+                payment_id=entry.payment_id,
+                mvp_id=entry.mvp_id,
+                backer_id=entry.backer_id,
+                amount=entry.amount,
+                platform_fee=entry.platform_fee,
+                creator_amount=entry.creator_amount,
+                entry_type=FundingEntryType.REFUND,
+                creator_id=entry.creator_id
+            )
+            for entry in entries
+        ])
+
+        if self.activity_feed:
+            total = sum(entry.amount for entry in entries)
+            self.activity_feed.publish(
+                "refund",
+                f"↩️ {len(entries):,} backing(s) refunded (€{total:,.0f})" + (f" — {html.escape(reason)}" if reason else ""),
+                count=len(entries), amount=total
+            )
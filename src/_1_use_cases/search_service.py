@@ -0,0 +1,296 @@
+import math
+import re
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+from src._0_domain.hackathon import Hackathon
+from src._0_domain.mvp import MVP
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.mvp_service import MVPService
+
+# Words, numbers and tech names such as "node.js", "c++" and "c#"
+_TOKEN = re.compile(r"[a-z0-9]+(?:[+#]+|(?:\.[a-z0-9]+)+)?")
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the to was were will with".split()
+)
+
+def tokenize(text: Union[str, Iterable[str]]) -> List[str]:
+    """Lowercase search terms of a text or a list of texts, stop words removed"""
+    if not isinstance(text, str):
+        text = " ".join(text)
+    return [token for token in _TOKEN.findall(text.lower()) if token not in STOP_WORDS]
+
+class SearchIndex:
+    """Inverted index with BM25 ranking over documents with boosted fields.
+
+    A document's term frequency and length count each field's tokens times
+    the field's boost, so a title match outweighs a description match
+    (a simple form of BM25F). Each term's postings are two append-only
+    arrays of document numbers and weighted frequencies, read as NumPy
+    views. Queries score the rarest terms' postings and look up the common
+    terms only for those documents unless that could change the top results
+    (MaxScore). Replacing or removing a document only marks its old number
+    dead; the postings are compacted once dead documents outnumber live ones.
+    """
+
+    def __init__(self, field_boosts: Dict[str, float], k1: float = 1.2, b: float = 0.75):
+        self.field_boosts = field_boosts
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._keys: List[Optional[Tuple[str, str]]] = []  # Document number -> (kind, id)
+        self._numbers: Dict[Tuple[str, str], int] = {}
+        self._kind_codes: Dict[str, int] = {}
+        self._kinds = array("b")
+        self._lengths = array("f")
+        self._alive = bytearray()
+        self._live_length = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def add(self, kind: str, doc_id: str, fields: Dict[str, Union[str, Iterable[str]]]):
+        """Index a document, replacing any earlier version of it"""
+        frequencies: Dict[str, float] = {}
+        length = 0.0
+        for field, text in fields.items():
+            boost = self.field_boosts.get(field, 1.0)
+            tokens = tokenize(text)
+            for token in tokens:
+                frequencies[token] = frequencies.get(token, 0.0) + boost
+            length += boost * len(tokens)
+
+        with self._lock:
+            self._remove((kind, doc_id))
+            number = len(self._keys)
+            self._keys.append((kind, doc_id))
+            self._numbers[(kind, doc_id)] = number
+            self._kinds.append(self._kind_codes.setdefault(kind, len(self._kind_codes)))
+            self._lengths.append(length)
+            self._alive.append(1)
+            self._live_length += length
+            for term, frequency in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("i"), array("f"))
+                postings[0].append(number)
+                postings[1].append(frequency)
+
+    def remove(self, kind: str, doc_id: str) -> bool:
+        """Drop a document from results; returns whether it was indexed"""
+        with self._lock:
+            return self._remove((kind, doc_id))
+
+    def _remove(self, key: Tuple[str, str]) -> bool:
+        number = self._numbers.pop(key, None)
+        if number is None:
+            return False
+        self._alive[number] = 0
+        self._keys[number] = None
+        self._live_length -= self._lengths[number]
+        if len(self._keys) - len(self._numbers) > max(len(self._numbers), 1000):
+            self._compact()
+        return True
+
+    def _compact(self):
+        """Renumber live documents and drop dead ones from every posting list"""
+        alive = np.frombuffer(self._alive, dtype=bool)
+        renumber = np.cumsum(alive, dtype=np.int32) - 1
+        keep = np.flatnonzero(alive)
+        for term, (numbers, frequencies) in list(self._postings.items()):
+            ids = np.frombuffer(numbers, dtype=np.int32)
+            live = alive[ids]
+            if not live.any():
+                del self._postings[term]
+                continue
+            compacted = (array("i", renumber[ids[live]].tobytes()),
+                         array("f", np.frombuffer(frequencies, dtype=np.float32)[live].tobytes()))
+            del ids, live
+            self._postings[term] = compacted
+        kinds = np.frombuffer(self._kinds, dtype=np.int8)[keep].tobytes()
+        lengths = np.frombuffer(self._lengths, dtype=np.float32)[keep].tobytes()
+        del alive
+        self._keys = [self._keys[number] for number in keep.tolist()]
+        self._numbers = {key: number for number, key in enumerate(self._keys)}
+        self._kinds = array("b", kinds)
+        self._lengths = array("f", lengths)
+        self._alive = bytearray(b"\x01" * len(self._keys))
+
+    def search(self, query: str, limit: int = 20, kind: Optional[str] = None) -> List[Tuple[str, str, float]]:
+        """Best `limit` documents for any of the query's terms, as (kind, id, score)"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            if not terms or not self._numbers or limit <= 0:
+                return []
+            if kind is not None and kind not in self._kind_codes:
+                return []
+            return self._search(terms, limit, None if kind is None else self._kind_codes[kind])
+
+    def _search(self, terms: List[str], limit: int, kind_code: Optional[int]) -> List[Tuple[str, str, float]]:
+        # NumPy views of the arrays; they must not outlive the lock, or appends would fail
+        lengths = np.frombuffer(self._lengths, dtype=np.float32)
+        alive = np.frombuffer(self._alive, dtype=bool)
+        if kind_code is not None:
+            excluded = ~alive | (np.frombuffer(self._kinds, dtype=np.int8) != kind_code)
+        elif len(self._numbers) < len(self._keys):
+            dead = np.flatnonzero(~alive)
+        # As in Lucene, document counts include replaced documents until the next
+        # compaction, so idf needs no pass over the postings
+        documents = len(self._keys)
+        weights = []
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                df = len(postings[0])
+                idf = math.log(1 + (documents - df + 0.5) / (df + 0.5))
+                weights.append((idf * (self.k1 + 1), np.frombuffer(postings[0], dtype=np.int32),
+                                np.frombuffer(postings[1], dtype=np.float32)))
+        if not weights:
+            return []
+        length_scale = np.float32(self.k1 * self.b * len(self._numbers) / (self._live_length or 1.0))
+        length_base = np.float32(self.k1 * (1 - self.b))
+
+        def score(weight: float, frequencies: np.ndarray, ids: np.ndarray) -> np.ndarray:
+            scores = lengths.take(ids)
+            scores *= length_scale
+            scores += length_base
+            scores += frequencies
+            np.divide(frequencies * np.float32(weight), scores, out=scores)
+            return scores
+
+        def score_postings(weight: float, ids: np.ndarray, frequencies: np.ndarray) -> np.ndarray:
+            """Scores of a whole posting list, -inf for documents that may not match"""
+            scores = score(weight, frequencies, ids)
+            if kind_code is not None:
+                scores[excluded.take(ids)] = -np.inf
+            elif len(self._numbers) < len(self._keys):
+                found = np.searchsorted(ids, dead)
+                inside = found < len(ids)
+                found = found[inside]
+                scores[found[ids[found] == dead[inside]]] = -np.inf
+            return scores
+
+        # MaxScore: a term adds less than its weight to any score. Take the rarest
+        # terms' documents as candidates and look the other terms up for them only;
+        # once the candidates' `limit`-th score reaches the other terms' combined
+        # weight, no document without a rare term can rank.
+        weights.sort(key=lambda weight: -weight[0])
+        for rare in range(1, len(weights) + 1):
+            ids, scores = self._merge([(ids, score_postings(weight, ids, frequencies))
+                                       for weight, ids, frequencies in weights[:rare]], len(lengths))
+            others = sum(weight for weight, _, _ in weights[rare:])
+            best = self._top(scores, limit)
+            if others and len(best) == limit:
+                # Candidates short of the current limit-th score by more than the
+                # other terms can add stay out of the results whatever they contain
+                reachable = np.flatnonzero(scores >= scores[best].min() - others)
+                ids, scores = ids[reachable], scores[reachable]
+            for weight, term_ids, frequencies in weights[rare:]:
+                # Posting lists are in document order, so a binary search finds each candidate
+                found = np.minimum(np.searchsorted(term_ids, ids), len(term_ids) - 1)
+                hit = term_ids[found] == ids
+                scores[hit] += score(weight, frequencies[found[hit]], ids[hit])
+            best = self._top(scores, limit)
+            if rare == len(weights) or (len(best) == limit and scores[best].min() > others):
+                break
+
+        ids, scores = ids[best], scores[best]
+        order = np.lexsort((ids, -scores))
+        return [(*self._keys[number], float(score))
+                for number, score in zip(ids[order].tolist(), scores[order].tolist())]
+
+    @staticmethod
+    def _top(scores: np.ndarray, limit: int) -> np.ndarray:
+        """Positions of the `limit` highest finite scores, in no particular order"""
+        if len(scores) > limit * 128:
+            # The limit-th best of every 64th score is a lower bound for the limit-th
+            # best overall, and few scores reach it
+            sample = scores[::64]
+            candidates = np.flatnonzero(scores >= np.partition(sample, len(sample) - limit)[len(sample) - limit])
+        else:
+            candidates = np.arange(len(scores))
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        return candidates[np.isfinite(scores[candidates])]
+
+    @staticmethod
+    def _merge(matches: List[Tuple[np.ndarray, np.ndarray]], size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Each matched document once, with its scores summed over terms"""
+        if len(matches) == 1:
+            return matches[0]
+        if sum(len(ids) for ids, _ in matches) * 16 < size:
+            # Few matches: sum each document's scores over its sorted postings
+            ids = np.concatenate([ids for ids, _ in matches])
+            order = np.argsort(ids, kind="stable")
+            ids = ids[order]
+            starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+            scores = np.add.reduceat(np.concatenate([scores for _, scores in matches])[order], starts)
+            return ids[starts], scores
+        # Many matches: add into one score per document; each term lists a document
+        # once, so plain indexed adds are safe
+        totals = np.zeros(size, dtype=np.float32)
+        for ids, scores in matches:
+            totals[ids] += scores
+        ids = np.flatnonzero(totals)
+        return ids, totals[ids]
+
+class SearchService:
+    """Full-text search over hackathons and MVPs.
+
+    Keeps a SearchIndex current from hackathon and MVP service events, so
+    new and edited entities are searchable as soon as they are saved.
+    """
+
+    FIELD_BOOSTS = {"title": 3.0, "tags": 2.0, "theme": 2.0, "tech_stack": 2.0, "description": 1.0, "venue": 1.0}
+
+    def __init__(self, hackathon_service: HackathonService, mvp_service: MVPService):
+        self.hackathon_service = hackathon_service
+        self.mvp_service = mvp_service
+        self.index = SearchIndex(self.FIELD_BOOSTS)
+        hackathon_service.add_listener(self._on_hackathon_event)
+        mvp_service.add_listener(self._on_mvp_event)
+        for hackathon in hackathon_service.get_all_hackathons():
+            self._index_hackathon(hackathon)
+        for mvp in mvp_service.get_all_mvps():
+            self._index_mvp(mvp)
+
+    def _on_hackathon_event(self, event: str, hackathon: Hackathon, **data):
+        if event in ("hackathon_created", "hackathon_updated"):
+            self._index_hackathon(hackathon)
+
+    def _on_mvp_event(self, event: str, mvp: MVP, **data):
+        if event in ("mvp_created", "mvp_updated"):
+            self._index_mvp(mvp)
+
+    def _index_hackathon(self, hackathon: Hackathon):
+        self.index.add("hackathon", hackathon.id, {
+            "title": hackathon.title,
+            "tags": hackathon.tags,
+            "theme": hackathon.theme,
+            "description": hackathon.description,
+            "venue": f"{hackathon.venue.name} {hackathon.venue.address}",
+        })
+
+    def _index_mvp(self, mvp: MVP):
+        self.index.add("mvp", mvp.id, {
+            "title": mvp.title,
+            "tech_stack": mvp.tech_stack,
+            "description": mvp.description,
+        })
+
+    def search(self, query: str, limit: int = 20, kind: Optional[str] = None) -> List[Dict]:
+        """Best matches as {kind, id, score}, over both kinds unless `kind` is given"""
+        return [{"kind": kind, "id": doc_id, "score": score}
+                for kind, doc_id, score in self.index.search(query, limit, kind)]
+
+    def search_hackathons(self, query: str, limit: int = 20) -> List[Hackathon]:
+        """Hackathons best matching `query`, most relevant first"""
+        found = (self.hackathon_service.get_hackathon(doc_id) for _, doc_id, _ in self.index.search(query, limit, "hackathon"))
+        return [hackathon for hackathon in found if hackathon]
+
+    def search_mvps(self, query: str, limit: int = 20) -> List[MVP]:
+        """MVPs best matching `query`, most relevant first"""
+        found = (self.mvp_service.get_mvp(doc_id) for _, doc_id, _ in self.index.search(query, limit, "mvp"))
+        return [mvp for mvp in found if mvp]
@@ -0,0 +1,182 @@
+import csv
+import json
+import os
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+from src._0_domain.funding import FundingEntry, FundingEntryType
+from src._0_domain.money import to_cents
+from src._0_domain.settlement import Payout, SettlementBatch
+from src._1_use_cases.funding_ledger import FundingLedger
+
+PERIOD_FORMATS = {
+    "day": "%Y-%m-%d",
+    "week": "%G-W%V",
+    "month": "%Y-%m",
+}
+
+# Newest manifest batches kept in memory for get_state and get_recent_batches
+RECENT_BATCHES = 100
+
+class SettlementService:
+    """Settles creator payouts from the funding ledger.
+
+    Each settlement batch covers a contiguous range of ledger offsets: the
+    entries are streamed once, creator shares are summed per creator and
+    period in integer cents (refunds subtract), and the totals are written as
+    a payout CSV plus a line in the settlement manifest. Only the sums for the
+    current batch are held in memory, so memory depends on `batch_size` and
+    not on how long the ledger is. The manifest records the offset each batch
+    settled up to and the ledger epoch it belongs to. The next run resumes
+    from the last one if the epoch matches the live ledger's, and starts
+    over from offset 0 of the new ledger if the process restarted since.
+    The manifest is read once, when the service starts, and the newest
+    batches are then kept in memory as batches are committed.
+    """
+
+    def __init__(self, funding_ledger: FundingLedger, output_dir: str,
+                 period: str = "month", batch_size: int = 50_000):
+        if period not in PERIOD_FORMATS:
+            raise ValueError(f"Unknown settlement period: {period}")
+        self.funding_ledger = funding_ledger
+        self.output_dir = output_dir
+        self.period = period
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        os.makedirs(output_dir, exist_ok=True)
+        self._recent: Deque[SettlementBatch] = deque(self.iter_batches(), maxlen=RECENT_BATCHES)
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.output_dir, "settlements.jsonl")
+
+    def get_state(self) -> Dict:
+        """Get the last settled offset of the live ledger and the next batch id"""
+        last_batch = self._recent[-1] if self._recent else None
+        if last_batch is None:
+            return {"settled_offset": 0, "next_batch_id": 1}
+        # Offsets of an earlier ledger say nothing about this one, whose offsets restarted at 0
+        settled_offset = last_batch.to_offset if last_batch.ledger_epoch == self.funding_ledger.epoch else 0
+        return {"settled_offset": settled_offset, "next_batch_id": last_batch.batch_id + 1}
+
+    def pending_entries(self) -> int:
+        """Number of ledger entries not settled yet"""
+        return max(0, self.funding_ledger.next_offset - self.get_state()["settled_offset"])
+
+    def settle(self, max_batches: Optional[int] = None) -> List[SettlementBatch]:
+        """Settle everything appended to the ledger since the last run"""
+        batches = []
+        with self._lock:
+            self._repair_manifest()
+            state = self.get_state()
+            end_offset = self.funding_ledger.next_offset
+            while state["settled_offset"] < end_offset:
+                if max_batches is not None and len(batches) >= max_batches:
+                    break
+                batch_end = min(state["settled_offset"] + self.batch_size, end_offset)
+                batch = self._settle_range(state["next_batch_id"], state["settled_offset"], batch_end)
+                self._commit(batch)
+                state = {"settled_offset": batch_end, "next_batch_id": batch.batch_id + 1}
+                batches.append(batch)
+        return batches
+
+    def _settle_range(self, batch_id: int, from_offset: int, to_offset: int) -> SettlementBatch:
+        period_format = PERIOD_FORMATS[self.period]
+        totals: Dict[Tuple[str, str], List[int]] = {}
+        for entry in self._entries_between(from_offset, to_offset):
+            key = (entry.creator_id, entry.created_at.strftime(period_format))
+            cents = _creator_cents(entry)
+            total = totals.get(key)
+            if total is None:
+                totals[key] = [cents, 1]
+            else:
+                total[0] += cents
+                total[1] += 1
+
+        payouts = [
+            Payout(creator_id, period, amount_cents, entry_count)
+            for (creator_id, period), (amount_cents, entry_count) in sorted(totals.items())
+        ]
+        payout_file = self._write_payouts(batch_id, payouts)
+        return SettlementBatch(
+            batch_id=batch_id,
+            from_offset=from_offset,
+            to_offset=to_offset,
+            payout_count=len(payouts),
+            total_cents=sum(payout.amount_cents for payout in payouts),
+            payout_file=payout_file,
+            ledger_epoch=self.funding_ledger.epoch
+        )
+
+    def _entries_between(self, from_offset: int, to_offset: int) -> Iterator[FundingEntry]:
+        for entries in self.funding_ledger.entries_since(from_offset, self.batch_size):
+            for entry in entries:
+                if entry.offset >= to_offset:
+                    return
+                yield entry
+
+    def _write_payouts(self, batch_id: int, payouts: List[Payout]) -> str:
+        # A batch rerun after a crash rewrites the same file, so this is idempotent
+        filename = f"payouts_{batch_id:06d}.csv"
+        path = os.path.join(self.output_dir, filename)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["creator_id", "period", "amount_cents", "amount", "entry_count"])
+            for payout in payouts:
+                writer.writerow([payout.creator_id, payout.period, payout.amount_cents,
+                                 f"{payout.amount_cents / 100:.2f}", payout.entry_count])
+        os.replace(tmp_path, path)
+        return filename
+
+    def _commit(self, batch: SettlementBatch):
+        # The manifest line is the commit point: a batch without one is redone
+        with open(self.manifest_path, "a") as f:
+            f.write(json.dumps(batch.to_dict()) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._recent.append(batch)
+
+    def _repair_manifest(self):
+        """Cut off a line left half-written by a crash so appends stay valid"""
+        if not os.path.exists(self.manifest_path):
+            return
+        with open(self.manifest_path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(max(0, size - 4096))
+            tail = f.read()
+            if tail.endswith(b"\n"):
+                return
+            cut = tail.rfind(b"\n")
+            f.truncate(size - len(tail) + cut + 1 if cut >= 0 else 0)
+
+    def iter_batches(self) -> Iterator[SettlementBatch]:
+        """Stream recorded settlement batches, oldest first"""
+        if not os.path.exists(self.manifest_path):
+            return
+        with open(self.manifest_path) as f:
+            for line in f:
+                try:
+                    yield SettlementBatch.from_dict(json.loads(line))
+                except ValueError:
+                    # A line torn by a crash mid-write; that batch is redone
+                    return
+
+    def get_recent_batches(self, limit: int = 10) -> List[SettlementBatch]:
+        """Get the most recent settlement batches, newest first"""
+        if limit > RECENT_BATCHES:
+            return list(reversed(deque(self.iter_batches(), maxlen=limit)))
+        return list(reversed(self._recent))[:limit]
+
+    def read_payouts(self, batch: SettlementBatch) -> Iterator[Payout]:
+        """Stream the payouts written for a batch"""
+        with open(os.path.join(self.output_dir, batch.payout_file), newline="") as f:
+            for row in csv.DictReader(f):
+                yield Payout(row["creator_id"], row["period"], int(row["amount_cents"]), int(row["entry_count"]))
+
+def _creator_cents(entry: FundingEntry) -> int:
+    cents = to_cents(entry.creator_amount)
+    return -cents if entry.entry_type == FundingEntryType.REFUND else cents
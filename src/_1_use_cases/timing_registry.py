@@ -0,0 +1,157 @@
+import functools
+import threading
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from contextlib import contextmanager
+
+# Latency buckets: one per µs below 4 µs, then four per power of two, so a
+# bucket is at most 25% wide; the last one catches anything over three weeks
+_SUB_BUCKETS = 4
+_BUCKETS = 160
+
+def _bucket(elapsed_ns: int) -> int:
+    micros = elapsed_ns // 1000
+    if micros < _SUB_BUCKETS:
+        return micros
+    bits = micros.bit_length()
+    return min((bits - 2) * _SUB_BUCKETS + ((micros >> (bits - 3)) & 3), _BUCKETS - 1)
+
+def _bucket_bounds_ms(bucket: int) -> Tuple[float, float]:
+    if bucket < _SUB_BUCKETS:
+        return bucket / 1000, (bucket + 1) / 1000
+    bits, sub = bucket // _SUB_BUCKETS + 2, bucket % _SUB_BUCKETS
+    width = 1 << (bits - 3)
+    lower = (_SUB_BUCKETS + sub) * width
+    return lower / 1000, (lower + width) / 1000
+
+class _Section:
+    """Call count, total and max time, and latency histogram of one section"""
+    __slots__ = ("count", "total_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * _BUCKETS
+
+    def percentile_ms(self, pct: float) -> float:
+        """Upper bound of the bucket holding the `pct` percentile"""
+        rank = max(pct / 100 * self.count, 1)
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_bounds_ms(bucket)[1], self.max_ns / 1e6)
+        return self.max_ns / 1e6
+
+class TimingRegistry:
+    """In-process latency histograms per named section of a rerun.
+
+    Sections are page scripts, VibratonicApp renderers, service queries and
+    adapter calls, wrapped with `instrument` or timed with `start`/`stop`.
+    Recording a call is a bucket lookup and three additions with no lock,
+    so a count can rarely be lost when two threads record the same section
+    at once; that is the price of keeping the hot path to well under a
+    microsecond. Setting `enabled` to False turns every hook into a plain
+    call at runtime.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._sections: Dict[str, _Section] = {}
+        self._lock = threading.Lock()
+
+    def record(self, section: str, elapsed_ns: int):
+        """Add one call of `section` that took `elapsed_ns`"""
+        stats = self._sections.get(section)
+        if stats is None:
+            with self._lock:
+                stats = self._sections.setdefault(section, _Section())
+        stats.count += 1
+        stats.total_ns += elapsed_ns
+        stats.buckets[_bucket(elapsed_ns)] += 1
+        if elapsed_ns > stats.max_ns:
+            stats.max_ns = elapsed_ns
+
+    # Hooks
+
+    def start(self) -> Optional[int]:
+        """Start timing a stretch of code; pass the result to `stop`"""
+        return perf_counter_ns() if self.enabled else None
+
+    def stop(self, section: str, started: Optional[int]):
+        """Record the time since `start`, unless timing was off when it started"""
+        if started is not None:
+            self.record(section, perf_counter_ns() - started)
+
+    @contextmanager
+    def timed(self, section: str) -> Iterator[None]:
+        """Time the body of a with-block as `section`"""
+        started = self.start()
+        try:
+            yield
+        finally:
+            self.stop(section, started)
+
+    def wrap(self, section: str, fn: Callable) -> Callable:
+        """`fn`, timed as `section` on every call while timing is enabled"""
+        registry = self
+
+        @functools.wraps(fn)
+        def timed_call(*args, **kwargs):
+            if not registry.enabled:
+                return fn(*args, **kwargs)
+            started = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                registry.record(section, perf_counter_ns() - started)
+        return timed_call
+
+    def instrument(self, target, prefix: str, methods: List[str]):
+        """Replace `methods` of an object or class with timed wrappers named
+        "<prefix>.<method>"; returns `target`"""
+        for name in methods:
+            setattr(target, name, self.wrap(f"{prefix}.{name}", getattr(target, name)))
+        return target
+
+    # Reads
+
+    def snapshot(self) -> List[Dict]:
+        """Call count and latency summary of every section, in milliseconds"""
+        with self._lock:
+            sections = list(self._sections.items())
+        return [
+            {
+                "section": name,
+                "calls": stats.count,
+                "total_ms": stats.total_ns / 1e6,
+                "mean_ms": stats.total_ns / stats.count / 1e6,
+                "p50_ms": stats.percentile_ms(50),
+                "p95_ms": stats.percentile_ms(95),
+                "p99_ms": stats.percentile_ms(99),
+                "max_ms": stats.max_ns / 1e6,
+            }
+            for name, stats in sections if stats.count
+        ]
+
+    def slowest(self, limit: int = 10, by: str = "p95_ms") -> List[Dict]:
+        """The `limit` sections with the highest `by` (e.g. p95_ms or total_ms)"""
+        return sorted(self.snapshot(), key=lambda section: section[by], reverse=True)[:limit]
+
+    def histogram(self, section: str) -> List[Dict]:
+        """Non-empty latency buckets of one section, fastest first"""
+        stats = self._sections.get(section)
+        if stats is None:
+            return []
+        rows = []
+        for bucket, count in enumerate(stats.buckets):
+            if count:
+                lower, upper = _bucket_bounds_ms(bucket)
+                rows.append({"lower_ms": lower, "upper_ms": upper, "calls": count})
+        return rows
+
+    def reset(self):
+        """Forget every recorded timing"""
+        with self._lock:
+            self._sections = {}
@@ -0,0 +1,244 @@
+import base64
+import random
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta
+from src._0_domain.funding import FundingEntryType
+from src._0_domain.transaction import Transaction
+from src._1_use_cases.funding_ledger import FundingLedger
+from src._1_use_cases.mvp_service import MVPService
+
+INDEXES = ("backer_id", "mvp_id", "creator_id")
+_LATEST_SEQ = float("inf")
+
+def _sort_key(transaction: Transaction) -> Tuple[datetime, float]:
+    return transaction.created_at, transaction.seq
+
+def _month(timestamp: datetime) -> str:
+    return timestamp.strftime("%Y-%m")
+
+class _MonthPartition:
+    """One month of transactions, kept sorted by time, with secondary indexes"""
+    __slots__ = ("rows", "indexes")
+
+    def __init__(self):
+        self.rows: List[Transaction] = []
+        self.indexes: Dict[str, Dict[str, List[Transaction]]] = {name: {} for name in INDEXES}
+
+    def add(self, transaction: Transaction):
+        _insert(self.rows, transaction)
+        for name in INDEXES:
+            _insert(self.indexes[name].setdefault(getattr(transaction, name), []), transaction)
+
+    def select(self, index: Optional[str], key: Optional[str]) -> List[Transaction]:
+        if index is None:
+            return self.rows
+        return self.indexes[index].get(key, [])
+
+def _insert(rows: List[Transaction], transaction: Transaction):
+    # Transactions nearly always arrive in time order, making this an append
+    if not rows or _sort_key(rows[-1]) <= _sort_key(transaction):
+        rows.append(transaction)
+    else:
+        insort(rows, transaction, key=_sort_key)
+
+class TransactionStore:
+    """Funding and refund transactions partitioned by month.
+
+    Each month partition keeps its rows sorted by time plus per-backer,
+    per-MVP and per-creator index lists, so every query reads newest first
+    from the end of one list per month and stops as soon as a page is full,
+    however many rows the store holds. Pages continue from an opaque cursor.
+    Transactions are pulled from the funding ledger with `sync`.
+    """
+
+    def __init__(self, funding_ledger: Optional[FundingLedger] = None):
+        self.funding_ledger = funding_ledger
+        self.ledger_offset = 0
+        self._partitions: Dict[str, _MonthPartition] = {}
+        self._months: List[str] = []  # Ascending
+        self._next_seq = 0
+        self._investor_totals: Dict[str, Dict] = {}
+        self._listeners: List[Callable[[List[Transaction]], None]] = []
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._next_seq
+
+    def add_listener(self, listener: Callable[[List[Transaction]], None]):
+        """Call `listener` with every batch of transactions added from now on"""
+        self._listeners.append(listener)
+
+    def sync(self) -> int:
+        """Pull entries appended to the funding ledger since the last sync"""
+        if self.funding_ledger is None:
+            return 0
+        added = 0
+        with self._sync_lock:
+            for entries in self.funding_ledger.entries_since(self.ledger_offset):
+                with self._lock:
+                    transactions = [self._add(Transaction.from_funding_entry(self._next_seq, entry))
+                                    for entry in entries]
+                    self.ledger_offset = entries[-1].offset + 1
+                self._notify(transactions)
+                added += len(entries)
+        return added
+
+    def add_many(self, records: Iterable[Dict]) -> int:
+        """Add transactions that are not in the ledger, e.g. imported history"""
+        with self._lock:
+            transactions = [self._add(Transaction(seq=self._next_seq, **record)) for record in records]
+        self._notify(transactions)
+        return len(transactions)
+
+    def _notify(self, transactions: List[Transaction]):
+        for listener in self._listeners:
+            listener(transactions)
+
+    def _add(self, transaction: Transaction) -> Transaction:
+        self._next_seq += 1
+        month = _month(transaction.created_at)
+        partition = self._partitions.get(month)
+        if partition is None:
+            partition = self._partitions[month] = _MonthPartition()
+            insort(self._months, month)
+        partition.add(transaction)
+
+        totals = self._investor_totals.setdefault(transaction.backer_id, {"invested": 0.0, "count": 0, "mvps": set()})
+        if transaction.is_refund:
+            totals["invested"] -= transaction.amount
+        else:
+            totals["invested"] += transaction.amount
+            totals["count"] += 1
+            totals["mvps"].add(transaction.mvp_id)
+        return transaction
+
+    # Queries
+
+    def get_latest(self, limit: int = 20, cursor: Optional[str] = None) -> Dict:
+        """Newest transactions first"""
+        return self._query(None, None, limit, cursor)
+
+    def get_by_investor(self, backer_id: str, limit: int = 20, cursor: Optional[str] = None) -> Dict:
+        """An investor's transactions, newest first"""
+        return self._query("backer_id", backer_id, limit, cursor)
+
+    def get_by_mvp(self, mvp_id: str, limit: int = 20, cursor: Optional[str] = None) -> Dict:
+        """An MVP's transactions, newest first"""
+        return self._query("mvp_id", mvp_id, limit, cursor)
+
+    def get_by_creator(self, creator_id: str, limit: int = 20, cursor: Optional[str] = None) -> Dict:
+        """Transactions for a creator's MVPs, newest first"""
+        return self._query("creator_id", creator_id, limit, cursor)
+
+    def get_by_date_range(self, start: datetime, end: datetime, limit: int = 20,
+                          cursor: Optional[str] = None, backer_id: Optional[str] = None) -> Dict:
+        """Transactions with start <= created_at <= end, newest first"""
+        index = "backer_id" if backer_id else None
+        return self._query(index, backer_id, limit, cursor, start, end)
+
+    def get_investor_summary(self, backer_id: str) -> Dict:
+        """Net amount invested, number of backings and projects backed"""
+        totals = self._investor_totals.get(backer_id)
+        if not totals:
+            return {"invested": 0.0, "count": 0, "projects": 0}
+        return {"invested": totals["invested"], "count": totals["count"], "projects": len(totals["mvps"])}
+
+    def investor_count(self) -> int:
+        """Number of distinct backers"""
+        return len(self._investor_totals)
+
+    def iter_chunks(self, chunk_size: int = 50_000) -> Iterator[List[Transaction]]:
+        """Stream every transaction, oldest first, `chunk_size` at a time.
+
+        Each month is copied under the lock just before it is streamed, as a
+        late transaction inserted into it shifts the rows after it.
+        Transactions added meanwhile to a month already copied are not
+        included.
+        """
+        with self._lock:
+            months = list(self._months)
+        for month in months:
+            with self._lock:
+                rows = list(self._partitions[month].rows)
+            for start in range(0, len(rows), chunk_size):
+                yield rows[start:start + chunk_size]
+
+    def iter_investor_summaries(self, chunk_size: int = 50_000) -> Iterator[List[Dict]]:
+        """Stream `get_investor_summary` for every backer, with `backer_id`, in chunks"""
+        with self._lock:
+            backer_ids = list(self._investor_totals)
+        for start in range(0, len(backer_ids), chunk_size):
+            yield [{"backer_id": backer_id, **self.get_investor_summary(backer_id)}
+                   for backer_id in backer_ids[start:start + chunk_size]]
+
+    def _query(self, index: Optional[str], key: Optional[str], limit: int, cursor: Optional[str],
+               start: Optional[datetime] = None, end: Optional[datetime] = None) -> Dict:
+        upper = (end, _LATEST_SEQ) if end else None
+        if cursor:
+            before = self._decode_cursor(cursor)
+            upper = min(upper, before) if upper else before
+        lower = (start, -1) if start else None
+
+        items: List[Transaction] = []
+        with self._lock:
+            months = self._months
+            first = bisect_left(months, _month(start)) if start else 0
+            last = bisect_right(months, _month(upper[0])) if upper else len(months)
+            for month in reversed(months[first:last]):
+                rows = self._partitions[month].select(index, key)
+                hi = bisect_left(rows, upper, key=_sort_key) if upper else len(rows)
+                lo = bisect_left(rows, lower, key=_sort_key) if lower else 0
+                # One row beyond the page tells whether another page exists
+                take = limit + 1 - len(items)
+                items.extend(reversed(rows[max(lo, hi - take):hi]))
+                if len(items) > limit:
+                    break
+
+        next_cursor = self._encode_cursor(items[limit - 1]) if len(items) > limit else None
+        return {"items": items[:limit], "next_cursor": next_cursor}
+
+    @staticmethod
+    def _encode_cursor(transaction: Transaction) -> str:
+        return base64.urlsafe_b64encode(
+            f"tx:{transaction.created_at.isoformat()}:{transaction.seq}".encode()
+        ).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            prefix, rest = base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+            timestamp, seq = rest.rsplit(":", 1)
+            if prefix != "tx":
+                raise ValueError(cursor)
+            return datetime.fromisoformat(timestamp), int(seq)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid transaction cursor: {cursor}") from e
+
+    def load_sample_history(self, mvp_service: MVPService, investor_ids: List[str], seed: int = 7):
+        """Spread the sample MVPs' existing funding over backings for demonstration"""
+        rng = random.Random(seed)
+        now = datetime.now()
+        records = []
+        for mvp in mvp_service.get_all_mvps():
+            if mvp.backers_count <= 0 or mvp.current_funding <= 0:
+                continue
+            opened = mvp.submission_datetime or now - timedelta(days=30)
+            span = max((now - opened).total_seconds(), 3600)
+            amount = round(mvp.current_funding / mvp.backers_count, 2)
+            for i in range(mvp.backers_count):
+                platform_fee, creator_amount = mvp.get_platform_fee(amount), mvp.get_creator_amount(amount)
+                records.append({
+                    "payment_id": f"tr_sample_{mvp.id}_{i:03d}",
+                    "mvp_id": mvp.id,
+                    "backer_id": rng.choice(investor_ids),
+                    "creator_id": mvp.creator_id,
+                    "amount": amount,
+                    "platform_fee": platform_fee,
+                    "creator_amount": creator_amount,
+                    "kind": FundingEntryType.FUNDING.value,
+                    "created_at": opened + timedelta(seconds=rng.uniform(0, span))
+                })
+        self.add_many(records)
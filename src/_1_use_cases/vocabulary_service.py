@@ -0,0 +1,241 @@
+import heapq
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from src._0_domain.hackathon import Hackathon
+from src._0_domain.mvp import MVP
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.mvp_service import MVPService
+
+TAGS, TECH_STACK, SKILLS = "tags", "tech_stack", "skills"
+
+def normalize_term(term: str) -> str:
+    """Case- and spacing-insensitive key of a term, so "AI/ML" and "ai/ml " are one"""
+    return " ".join(term.lower().split())
+
+class _Node:
+    """Trie node with the most used terms of its subtree"""
+    __slots__ = ("children", "top", "ends")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[str] = []
+        self.ends: Optional[set] = None  # Terms whose path ends here
+
+class PrefixTrie:
+    """Terms with usage counts, completed by prefix, most used first.
+
+    Every node keeps its subtree's `capacity` most used terms in order, so a
+    completion walks the prefix and slices a list. Terms are also reachable
+    from the start of each of their words, so "learn" completes "Machine
+    Learning". A raised count only re-sorts the lists on its paths; when a
+    lowered count leaves a full list, that list is refilled from the child
+    lists below it. The root keeps a longer list of `root_capacity` terms
+    for pickers that show the most used ones; it is refilled from every
+    count.
+    """
+
+    def __init__(self, capacity: int = 10, root_capacity: int = 200):
+        self.capacity = capacity
+        self.root_capacity = root_capacity
+        self._root = _Node()
+        self._counts: Dict[str, int] = {}
+        self._labels: Dict[str, str] = {}  # Key -> spelling it was first added with
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _rank(self, key: str) -> Tuple[int, str]:
+        return -self._counts[key], key
+
+    def _capacity(self, node: _Node) -> int:
+        return self.root_capacity if node is self._root else self.capacity
+
+    def _paths(self, key: str, create: bool) -> List[List[_Node]]:
+        """Nodes below the root along the key from the start of each word"""
+        paths = []
+        for start, char in enumerate(key):
+            if start and key[start - 1] not in " -/":
+                continue
+            node, path = self._root, []
+            for letter in key[start:]:
+                child = node.children.get(letter)
+                if child is None:
+                    if not create:
+                        break
+                    child = node.children[letter] = _Node()
+                node = child
+                path.append(node)
+            paths.append(path)
+        return paths
+
+    def add(self, term: str, count: int = 1):
+        """Count `count` more uses of a term"""
+        key = normalize_term(term)
+        if not key or count <= 0:
+            return
+        with self._lock:
+            self._labels.setdefault(key, term.strip())
+            self._counts[key] = self._counts.get(key, 0) + count
+            for path in self._paths(key, create=True):
+                if path[-1].ends is None:
+                    path[-1].ends = set()
+                path[-1].ends.add(key)
+                for node in path:
+                    self._offer(node, key)
+            self._offer(self._root, key)
+
+    def _offer(self, node: _Node, key: str):
+        top = node.top
+        if key in top:
+            position = top.index(key)
+        elif len(top) < self._capacity(node):
+            position = len(top)
+            top.append(key)
+        elif self._rank(key) < self._rank(top[-1]):
+            position = len(top) - 1
+            top[position] = key
+        else:
+            return
+        # Only this term's count went up, so it moves towards the front
+        rank = self._rank(key)
+        while position and self._rank(top[position - 1]) > rank:
+            top[position] = top[position - 1]
+            position -= 1
+        top[position] = key
+
+    def remove(self, term: str, count: int = 1):
+        """Count `count` fewer uses of a term, forgetting it at zero"""
+        key = normalize_term(term)
+        with self._lock:
+            if key not in self._counts:
+                return
+            self._counts[key] -= count
+            gone = self._counts[key] <= 0
+            # Paths share nodes, e.g. "d" for both words of "Data Driven"
+            nodes = {}
+            for path in self._paths(key, create=False):
+                if gone:
+                    path[-1].ends.discard(key)
+                for depth, node in enumerate(path):
+                    nodes[id(node)] = depth, node
+            # Deepest first, so each refill reads lists already updated below it
+            for _, node in sorted(nodes.values(), key=lambda item: -item[0]):
+                self._demote(node, key, gone)
+            self._demote(self._root, key, gone)
+            if gone:
+                del self._counts[key], self._labels[key]
+
+    def _demote(self, node: _Node, key: str, gone: bool):
+        top = node.top
+        if key not in top:
+            return
+        full = len(top) == self._capacity(node)
+        if gone:
+            top.remove(key)
+        else:
+            top.sort(key=self._rank)
+        # Terms outside a full list may now outrank the one that dropped
+        if full and (gone or top[-1] == key):
+            if node is self._root:
+                # The root's list is longer than its children's, so they cannot refill it
+                candidates = set(self._counts)
+            else:
+                candidates = set(node.ends or ())
+                for child in node.children.values():
+                    candidates.update(child.top)
+            if gone:
+                candidates.discard(key)
+            node.top = heapq.nsmallest(self._capacity(node), candidates, key=self._rank)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """The `limit` most used terms with a word starting with `prefix`"""
+        key = normalize_term(prefix)
+        with self._lock:
+            node = self._root
+            for letter in key:
+                node = node.children.get(letter)
+                if node is None:
+                    return []
+            if limit <= self._capacity(node):
+                return [self._labels[term] for term in node.top[:limit]]
+            terms = set()
+            stack = [node]
+            while stack:
+                node = stack.pop()
+                terms.update(node.ends or ())
+                stack.extend(node.children.values())
+            return [self._labels[term] for term in heapq.nsmallest(limit, terms, key=self._rank)]
+
+    def count(self, term: str) -> int:
+        """Uses of a term"""
+        return self._counts.get(normalize_term(term), 0)
+
+    def canonical(self, term: str) -> str:
+        """The known spelling of a term, or the term itself if it is new"""
+        return self._labels.get(normalize_term(term), term.strip())
+
+class VocabularyService:
+    """Hackathon tags, MVP tech stacks and user skills for autocompletion.
+
+    One PrefixTrie per vocabulary counts how many hackathons, MVPs or users
+    use each term. Tags and tech stacks follow hackathon and MVP service
+    events; skills are set by the profile page, as users have no service.
+    The last terms seen for each owner are kept so an edit only counts the
+    difference.
+    """
+
+    VOCABULARIES = (TAGS, TECH_STACK, SKILLS)
+
+    def __init__(self, hackathon_service: HackathonService, mvp_service: MVPService,
+                 capacity: int = 10, root_capacity: int = 200):
+        self._tries = {name: PrefixTrie(capacity, root_capacity) for name in self.VOCABULARIES}
+        self._owned: Dict[Tuple[str, str], List[str]] = {}
+        self._lock = threading.Lock()
+        hackathon_service.add_listener(self._on_hackathon_event)
+        mvp_service.add_listener(self._on_mvp_event)
+        for hackathon in hackathon_service.get_all_hackathons():
+            self.set_terms(TAGS, hackathon.id, hackathon.tags)
+        for mvp in mvp_service.get_all_mvps():
+            self.set_terms(TECH_STACK, mvp.id, mvp.tech_stack)
+
+    def _on_hackathon_event(self, event: str, hackathon: Hackathon, **data):
+        if event in ("hackathon_created", "hackathon_updated"):
+            self.set_terms(TAGS, hackathon.id, hackathon.tags)
+
+    def _on_mvp_event(self, event: str, mvp: MVP, **data):
+        if event in ("mvp_created", "mvp_updated"):
+            self.set_terms(TECH_STACK, mvp.id, mvp.tech_stack)
+
+    def set_terms(self, vocabulary: str, owner_id: str, terms: Iterable[str]):
+        """Replace the terms a hackathon, MVP or user uses in a vocabulary"""
+        trie = self._tries[vocabulary]
+        unique = list({normalize_term(term): term for term in terms if normalize_term(term)}.values())
+        with self._lock:
+            old = self._owned.get((vocabulary, owner_id), [])
+            self._owned[(vocabulary, owner_id)] = unique
+        old_keys = {normalize_term(term) for term in old}
+        new_keys = {normalize_term(term) for term in unique}
+        for term in old:
+            if normalize_term(term) not in new_keys:
+                trie.remove(term)
+        for term in unique:
+            if normalize_term(term) not in old_keys:
+                trie.add(term)
+
+    def complete(self, vocabulary: str, prefix: str, limit: int = 10) -> List[str]:
+        """The `limit` most used terms of a vocabulary with a word starting with `prefix`"""
+        return self._tries[vocabulary].complete(prefix, limit)
+
+    def popular(self, vocabulary: str, limit: int = 50) -> List[str]:
+        """The `limit` most used terms of a vocabulary"""
+        return self._tries[vocabulary].complete("", limit)
+
+    def canonicalize(self, vocabulary: str, terms: Iterable[str]) -> List[str]:
+        """Terms in their known spelling, duplicates and blanks dropped"""
+        trie = self._tries[vocabulary]
+        return list({normalize_term(term): trie.canonical(term) for term in terms if normalize_term(term)}.values())
+
+    def count(self, vocabulary: str, term: str) -> int:
+        """How many hackathons, MVPs or users use a term"""
+        return self._tries[vocabulary].count(term)
@@ -0,0 +1,196 @@
+import html
+import threading
+from typing import Dict, List, Optional, Sequence
+from src._0_domain.funding import FundingEntry
+from src._1_use_cases.payment_service import PaymentService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.funding_ledger import FundingLedger
+from src._1_use_cases.activity_feed_service import ActivityFeedService
+from src._2_adapters.webhook_queue import WebhookQueue
+
+class WebhookProcessor:
+    """Queued, idempotent processing of Mollie payment webhooks.
+
+    `acknowledge` only appends the webhook to the durable queue so the HTTP
+    handler can answer immediately. Worker threads claim batches, look up the
+    current payment status and apply each (payment_id, status) transition at
+    most once: paid payments become ledger entries and MVP funding, applied
+    per MVP in one update, and are announced on the activity feed. Paid
+    payments an MVP rejects, e.g. because it closed, are recorded in the
+    queue as rejected so admins can refund them.
+    """
+
+    def __init__(self, payment_service: PaymentService, mvp_service: MVPService,
+                 funding_ledger: FundingLedger, queue: WebhookQueue,
+                 activity_feed: Optional[ActivityFeedService] = None, batch_size: int = 500):
+        self.payment_service = payment_service
+        self.mvp_service = mvp_service
+        self.funding_ledger = funding_ledger
+        self.queue = queue
+        self.activity_feed = activity_feed
+        self.batch_size = batch_size
+        self.stats = {"received": 0, "processed": 0, "duplicates": 0, "applied": 0, "rejected": 0}
+        self._stats_lock = threading.Lock()  # Updated from page threads and workers
+        self.last_error: Optional[Exception] = None
+
+        self._apply_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._running = False
+        self._workers: List[threading.Thread] = []
+
+    def acknowledge(self, payment_id: str) -> Dict:
+        """Accept a webhook for later processing"""
+        self.queue.enqueue(payment_id)
+        self.payment_service.invalidate_payment_status(payment_id)
+        self._count(received=1)
+        self._wakeup.set()
+        return {"status": "accepted", "payment_id": payment_id}
+
+    def process_batch(self) -> int:
+        """Claim and process one batch of webhooks; returns how many were handled"""
+        claimed = self.queue.claim(self.batch_size)
+        if not claimed:
+            return 0
+        webhook_ids = [webhook_id for webhook_id, _ in claimed]
+
+        try:
+            # Several webhooks for one payment need only one status lookup
+            payments = {}
+            for payment_id in {payment_id for _, payment_id in claimed}:
+                payment = self.payment_service.get_payment_status(payment_id, refresh=True)
+                if "error" not in payment:
+                    payments[payment_id] = payment
+
+            new_transitions = self.apply_payment_statuses(payments, webhook_ids)
+        except Exception:
+            self.queue.release(webhook_ids)
+            raise
+
+        self._count(processed=len(claimed), duplicates=len(claimed) - new_transitions)
+        return len(claimed)
+
+    def _count(self, **changes: int):
+        with self._stats_lock:
+            for name, change in changes.items():
+                self.stats[name] += change
+
+    def apply_payment_statuses(self, payments: Dict[str, Dict], webhook_ids: Sequence[int] = ()) -> int:
+        """Apply fetched payment statuses not applied before; returns how many were new.
+
+        Used for webhook batches and by reconciliation. Check-and-apply is
+        serialized so two callers holding the same payment cannot both apply it.
+        """
+        with self._apply_lock:
+            transitions = {(payment_id, payment.get("status")) for payment_id, payment in payments.items()}
+            new_transitions = transitions - self.queue.applied_transitions(transitions)
+            paid = [payments[payment_id] for payment_id, status in new_transitions if status == "paid"]
+            rejected = self._apply_paid_payments(paid)
+            self.queue.complete(list(webhook_ids), list(new_transitions), rejected)
+        return len(new_transitions)
+
+    def _apply_paid_payments(self, payments: List[Dict]) -> List[Dict]:
+        """Fund MVPs with paid payments; returns the fundings MVPs rejected"""
+        if not payments:
+            return []
+
+        fundings = []
+        for payment in payments:
+            metadata = payment.get("metadata") or {}
+            amount = float(payment["amount"]["value"])
+            fees = self.payment_service.calculate_fees(amount)
+            fundings.append({
+                "payment_id": payment["id"],
+                "mvp_id": metadata.get("mvp_id"),
+                "backer_id": metadata.get("backer_id", ""),
+                "amount": amount,
+                "platform_fee": fees["platform_fee"],
+                "creator_amount": fees["creator_amount"]
+            })
+
+        accepted = self.mvp_service.apply_funding_batch(fundings)
+        entries, rejected = [], []
+        for funding in fundings:
+            if not accepted.get(funding["mvp_id"]):
+                rejected.append(funding)
+                continue
+            mvp = self.mvp_service.get_mvp(funding["mvp_id"])
+            entries.append(FundingEntry(creator_id=mvp.creator_id, **funding))
+
+        self.funding_ledger.append(entries)
+        self._count(applied=len(entries), rejected=len(rejected))
+
+        if self.activity_feed:
+            for entry in entries:
+                mvp = self.mvp_service.get_mvp(entry.mvp_id)
+                self.activity_feed.publish(
+                    "funding",
+                    # Shown to every session with HTML enabled, and both are user input
+                    f"💰 **{html.escape(mvp.title)}** received €{entry.amount:,.0f} from **{html.escape(entry.backer_id)}**",
+                    mvp_id=mvp.id, mvp=mvp.title, amount=entry.amount, investor=entry.backer_id
+                )
+        return rejected
+
+    def refund_rejected(self, limit: int = 500) -> Dict:
+        """Refund up to `limit` rejected payments to their backers, oldest first.
+
+        Uses the same idempotency key as bulk refunds, so a payment is never
+        refunded twice.
+        """
+        result = {"requested": 0, "refunded": 0, "failed": 0, "amount_refunded": 0.0, "errors": {}}
+        refunded = []
+        for payment in self.queue.rejected_payments(limit):
+            result["requested"] += 1
+            try:
+                refund = self.payment_service.refund_payment(
+                    payment["payment_id"], idempotency_key=f"refund-{payment['payment_id']}"
+                )
+            except Exception as e:
+                refund = {"error": str(e)}
+            if "error" in refund:
+                result["failed"] += 1
+                result["errors"][payment["payment_id"]] = refund["error"]
+            else:
+                refunded.append(payment["payment_id"])
+                result["amount_refunded"] += payment["amount"]
+        self.queue.mark_refunded(refunded)
+        result["refunded"] = len(refunded)
+        return result
+
+    def drain(self) -> int:
+        """Process until the queue is empty; returns how many webhooks were handled"""
+        total = 0
+        while True:
+            handled = self.process_batch()
+            if handled == 0:
+                return total
+            total += handled
+
+    def start(self, workers: int = 2):
+        """Start background worker threads"""
+        if self._running:
+            return
+        self._running = True
+        for i in range(workers):
+            worker = threading.Thread(target=self._run_worker, name=f"webhook-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _run_worker(self):
+        while self._running:
+            try:
+                handled = self.process_batch()
+            except Exception as e:
+                # Claimed webhooks were released; keep the worker alive and retry
+                self.last_error = e
+                handled = 0
+            if handled == 0:
+                self._wakeup.wait(timeout=0.5)
+                self._wakeup.clear()
+
+    def stop(self):
+        """Stop worker threads after their current batch"""
+        self._running = False
+        self._wakeup.set()
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
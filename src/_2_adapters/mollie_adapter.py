@@ -1,4 +1,6 @@
 import os
+import itertools
+import threading
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 
@@ -9,13 +11,20 @@ class MollieAdapter:
         
         # Mock payment storage for demo purposes
         self._mock_payments = {}
+        self._mock_ids = itertools.count(1)
+        self._mock_created = {}  # payment_id -> creation datetime, kept parsed
+        self._mock_refunds = {}
+        self._refunds_by_key = {}  # idempotency key -> refund
+        self._refund_lock = threading.Lock()
     
     def create_payment(self, payment_data: Dict) -> Dict:
         """Create a payment through Mollie API"""
         # In production, this would make an actual API call to Mollie
         # For demo purposes, we'll simulate the response
         
-        payment_id = f"tr_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        # Sequence suffix keeps IDs unique when several are created per second
+        created_at = datetime.now()
+        payment_id = f"tr_{created_at.strftime('%Y%m%d%H%M%S')}{next(self._mock_ids):06d}"
         
         mock_payment = {
             "id": payment_id,
@@ -34,11 +43,12 @@ class MollieAdapter:
                 "platform_fee": payment_data.get("platform_fee", 0.0),
                 "creator_amount": payment_data.get("creator_amount", 0.0)
             },
-            "created_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(minutes=15)).isoformat()
+            "created_at": created_at.isoformat(),
+            "expires_at": (created_at + timedelta(minutes=15)).isoformat()
         }
         
         self._mock_payments[payment_id] = mock_payment
+        self._mock_created[payment_id] = created_at
         return mock_payment
     
     def get_payment_status(self, payment_id: str) -> Dict:
@@ -50,9 +60,12 @@ class MollieAdapter:
         if not payment:
             return {"error": "Payment not found"}
         
+        # Settled payments no longer progress
+        if payment["status"] not in ("open", "pending"):
+            return payment
+        
         # Simulate payment progression
-        created_time = datetime.fromisoformat(payment["created_at"].replace('Z', '+00:00').replace('+00:00', ''))
-        time_elapsed = datetime.now() - created_time
+        time_elapsed = datetime.now() - self._mock_created[payment_id]
         
         if time_elapsed.total_seconds() > 300:  # 5 minutes
             payment["status"] = "paid"
@@ -62,6 +75,15 @@ class MollieAdapter:
         
         return payment
     
+    def mark_paid(self, payment_id: str) -> bool:
+        """Complete a mock payment immediately (demo only)"""
+        payment = self._mock_payments.get(payment_id)
+        if not payment:
+            return False
+        payment["status"] = "paid"
+        payment["paid_at"] = datetime.now().isoformat()
+        return True
+    
     def get_payment_methods(self) -> list:
         """Get available payment methods"""
         return [
@@ -87,24 +109,42 @@ class MollieAdapter:
             }
         ]
     
-    def refund_payment(self, payment_id: str, amount: Optional[float] = None) -> Dict:
-        """Create a refund for a payment"""
-        payment = self._mock_payments.get(payment_id)
-        if not payment or payment["status"] != "paid":
-            return {"error": "Cannot refund this payment"}
-        
-        refund_id = f"re_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        refund_amount = amount or float(payment["amount"]["value"])
+    def refund_payment(self, payment_id: str, amount: Optional[float] = None,
+                       idempotency_key: Optional[str] = None) -> Dict:
+        """Create a refund for a payment.
         
-        refund = {
-            "id": refund_id,
-            "payment_id": payment_id,
-            "amount": {
-                "value": f"{refund_amount:.2f}",
-                "currency": "EUR"
-            },
-            "status": "processing",
-            "created_at": datetime.now().isoformat()
-        }
-        
-        return refund
+        Retrying with the same idempotency key returns the original refund
+        instead of refunding twice.
+        """
+        with self._refund_lock:
+            if idempotency_key and idempotency_key in self._refunds_by_key:
+                return self._refunds_by_key[idempotency_key]
+            
+            payment = self._mock_payments.get(payment_id)
+            if not payment or payment["status"] != "paid":
+                return {"error": "Cannot refund this payment"}
+            
+            paid_amount = float(payment["amount"]["value"])
+            already_refunded = payment.get("amount_refunded", 0.0)
+            refund_amount = amount or round(paid_amount - already_refunded, 2)
+            if refund_amount <= 0 or already_refunded + refund_amount > paid_amount + 1e-9:
+                return {"error": "Refund exceeds the remaining payment amount"}
+            
+            created_at = datetime.now()
+            refund_id = f"re_{created_at.strftime('%Y%m%d%H%M%S')}{next(self._mock_ids):06d}"
+            refund = {
+                "id": refund_id,
+                "payment_id": payment_id,
+                "amount": {
+                    "value": f"{refund_amount:.2f}",
+                    "currency": "EUR"
+                },
+                "status": "processing",
+                "created_at": created_at.isoformat()
+            }
+            
+            payment["amount_refunded"] = round(already_refunded + refund_amount, 2)
+            self._mock_refunds[refund_id] = refund
+            if idempotency_key:
+                self._refunds_by_key[idempotency_key] = refund
+            return refund
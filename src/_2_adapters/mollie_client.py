@@ -0,0 +1,361 @@
+import asyncio
+import concurrent.futures
+import json
+import os
+import ssl
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+class MollieAPIError(Exception):
+    """Error response or transport failure talking to the Mollie API"""
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(f"Mollie API error {status}: {detail}")
+        self.status = status
+        self.detail = detail
+
+
+class _Connection:
+    """A single keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+
+    def is_usable(self) -> bool:
+        return self.reusable and not self.writer.is_closing() and not self.reader.at_eof()
+
+    async def request(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Tuple[int, bytes]:
+        lines = [f"{method} {target} HTTP/1.1"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b"\r\n")
+        status = int(status_line.split(b" ", 2)[1])
+
+        response_headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            payload = b"".join(chunks)
+        else:
+            payload = await self.reader.readexactly(int(response_headers.get("content-length", 0)))
+
+        if response_headers.get("connection", "").lower() == "close":
+            self.reusable = False
+        return status, payload
+
+    def close(self):
+        self.reusable = False
+        self.writer.close()
+
+
+class AsyncMollieClient:
+    """Async Mollie API client with keep-alive connection pooling.
+
+    Idle connections are reused instead of opening a new TLS connection per
+    call, `max_concurrency` bounds in-flight requests and every request,
+    including its wait for a free connection, is limited by `timeout` seconds.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 max_connections: int = 10, max_concurrency: int = 20, timeout: float = 10.0,
+                 keep_alive: bool = True):
+        self.api_key = api_key or os.getenv("MOLLIE_API_KEY", "test_api_key")
+        self.base_url = (base_url or os.getenv("MOLLIE_API_URL", "https://api.mollie.com/v2")).rstrip("/")
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+
+        url = urlsplit(self.base_url)
+        self._host = url.hostname
+        self._port = url.port or (443 if url.scheme == "https" else 80)
+        self._path_prefix = url.path
+        self._ssl = ssl.create_default_context() if url.scheme == "https" else None
+
+        self._idle: List[_Connection] = []
+        self._open_connections = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _acquire(self) -> Tuple[_Connection, bool]:
+        """Get an idle connection or open a new one; returns (connection, reused).
+
+        When the pool is exhausted callers queue in FIFO order and released
+        connections are handed straight to the longest waiter, so a burst of
+        new callers cannot starve earlier ones.
+        """
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.is_usable():
+                return connection, True
+            self._open_connections -= 1
+            connection.close()
+
+        if self._open_connections >= self.max_connections:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                connection = await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Handed a connection or slot just as we were cancelled
+                    if waiter.result() is not None:
+                        self._release(waiter.result())
+                    else:
+                        self._discard(None)
+                raise
+            if connection is not None:
+                return connection, True
+            # Handed a free slot: fall through and open a connection in it
+        else:
+            self._open_connections += 1
+
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port, ssl=self._ssl), self.timeout
+            )
+        except BaseException:
+            self._discard(None)
+            raise
+        return _Connection(reader, writer), False
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                return waiter
+        return None
+
+    def _release(self, connection: _Connection):
+        """Return a connection to the pool or hand it to a waiter"""
+        if not connection.is_usable():
+            self._discard(connection)
+            return
+        waiter = self._next_waiter()
+        if waiter:
+            waiter.set_result(connection)
+        else:
+            self._idle.append(connection)
+
+    def _discard(self, connection: Optional[_Connection]):
+        """Drop a connection; its pool slot goes to a waiter if there is one"""
+        if connection is not None:
+            connection.close()
+        waiter = self._next_waiter()
+        if waiter:
+            waiter.set_result(None)
+        else:
+            self._open_connections -= 1
+
+    async def request(self, method: str, path: str, payload: Optional[Dict] = None,
+                      idempotency_key: Optional[str] = None) -> Dict:
+        """Send a request and return the decoded JSON response"""
+        try:
+            status, raw = await asyncio.wait_for(self._send(method, path, payload, idempotency_key), self.timeout)
+        except asyncio.TimeoutError as e:
+            raise MollieAPIError(0, f"Request timed out after {self.timeout}s") from e
+
+        try:
+            data = json.loads(raw) if raw else {}
+        except ValueError as e:
+            # e.g. an HTML error page from a proxy in front of the API
+            raise MollieAPIError(status, raw[:500].decode(errors="replace")) from e
+        if status >= 400:
+            raise MollieAPIError(status, data.get("detail", raw.decode(errors="replace")))
+        return data
+
+    async def _send(self, method: str, path: str, payload: Optional[Dict],
+                    idempotency_key: Optional[str]) -> Tuple[int, bytes]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        body = json.dumps(payload).encode() if payload is not None else b""
+        headers = {
+            "Host": self._host,
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+            "Connection": "keep-alive" if self.keep_alive else "close",
+            "Content-Length": str(len(body)),
+        }
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+
+        # A pooled connection may have been closed by the server while idle.
+        # Only replay requests that cannot create a duplicate on the server.
+        can_retry = method == "GET" or idempotency_key is not None
+
+        async with self._semaphore:
+            for attempt in range(2):
+                try:
+                    connection, reused = await self._acquire()
+                except (OSError, asyncio.TimeoutError) as e:
+                    raise MollieAPIError(0, f"Could not connect to {self._host}:{self._port}: {e}") from e
+                try:
+                    status, raw = await connection.request(method, self._path_prefix + path, headers, body)
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    self._discard(connection)
+                    if reused and can_retry and attempt == 0:
+                        continue
+                    raise MollieAPIError(0, f"Connection failed: {e}") from e
+                except BaseException:
+                    # Includes cancellation when the request's deadline passes
+                    self._discard(connection)
+                    raise
+                self._release(connection)
+                return status, raw
+
+    async def create_payment(self, payment_data: Dict, idempotency_key: Optional[str] = None) -> Dict:
+        """Create a payment"""
+        return await self.request("POST", "/payments", {
+            "amount": {"currency": "EUR", "value": f"{payment_data['amount']:.2f}"},
+            "description": payment_data.get("description", "MVP Funding"),
+            "redirectUrl": payment_data.get("redirect_url"),
+            "webhookUrl": payment_data.get("webhook_url"),
+            "metadata": {
+                "mvp_id": payment_data.get("mvp_id"),
+                "backer_id": payment_data.get("backer_id"),
+                "platform_fee": payment_data.get("platform_fee", 0.0),
+                "creator_amount": payment_data.get("creator_amount", 0.0)
+            }
+        }, idempotency_key=idempotency_key)
+
+    async def get_payment(self, payment_id: str) -> Dict:
+        """Get a payment"""
+        return await self.request("GET", f"/payments/{payment_id}")
+
+    async def create_refund(self, payment_id: str, amount: Optional[float] = None,
+                            idempotency_key: Optional[str] = None) -> Dict:
+        """Create a refund for a payment (full refund when amount is None)"""
+        payload = {}
+        if amount is not None:
+            payload["amount"] = {"currency": "EUR", "value": f"{amount:.2f}"}
+        return await self.request("POST", f"/payments/{payment_id}/refunds", payload,
+                                  idempotency_key=idempotency_key)
+
+    async def get_methods(self) -> Dict:
+        """Get enabled payment methods"""
+        return await self.request("GET", "/methods")
+
+    async def close(self):
+        """Close all idle connections"""
+        while self._idle:
+            self._idle.pop().close()
+            self._open_connections -= 1
+
+
+def _to_adapter_payment(payment: Dict) -> Dict:
+    """Map a Mollie API payment onto the shape MollieAdapter returns"""
+    return {
+        "id": payment.get("id"),
+        "status": payment.get("status"),
+        "amount": payment.get("amount"),
+        "description": payment.get("description"),
+        "checkout_url": payment.get("_links", {}).get("checkout", {}).get("href"),
+        "redirect_url": payment.get("redirectUrl"),
+        "webhook_url": payment.get("webhookUrl"),
+        "metadata": payment.get("metadata") or {},
+        "created_at": payment.get("createdAt"),
+        "expires_at": payment.get("expiresAt"),
+        "paid_at": payment.get("paidAt")
+    }
+
+
+class MollieClient:
+    """Synchronous facade over AsyncMollieClient for Streamlit pages.
+
+    Runs the async client on a private event loop in a background thread so
+    the connection pool survives between calls. Exposes the same methods as
+    MollieAdapter, so PaymentService can use either.
+    """
+
+    def __init__(self, **client_options):
+        self.client = AsyncMollieClient(**client_options)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="mollie-client", daemon=True)
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop the pooled connections run on"""
+        return self._loop
+
+    def run(self, coroutine):
+        """Run a coroutine on the client loop and wait for its result.
+
+        Requests time themselves out; the extra second only covers a busy
+        loop. The coroutine is cancelled if it is still running then, so it
+        cannot complete a request nobody is waiting for.
+        """
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(self.client.timeout + 1)
+        except concurrent.futures.TimeoutError as e:
+            future.cancel()
+            raise MollieAPIError(0, f"Request timed out after {self.client.timeout}s") from e
+
+    def create_payment(self, payment_data: Dict) -> Dict:
+        """Create a payment through Mollie API"""
+        try:
+            return _to_adapter_payment(self.run(self.client.create_payment(payment_data)))
+        except MollieAPIError as e:
+            return {"error": e.detail}
+
+    def get_payment_status(self, payment_id: str) -> Dict:
+        """Get payment status from Mollie API"""
+        try:
+            return _to_adapter_payment(self.run(self.client.get_payment(payment_id)))
+        except MollieAPIError as e:
+            return {"error": e.detail}
+
+    def get_payment_methods(self) -> list:
+        """Get available payment methods"""
+        try:
+            methods = self.run(self.client.get_methods())
+        except MollieAPIError:
+            return []
+        return [
+            {"id": m.get("id"), "description": m.get("description"), "image": m.get("image", {})}
+            for m in methods.get("_embedded", {}).get("methods", [])
+        ]
+
+    def refund_payment(self, payment_id: str, amount: Optional[float] = None,
+                       idempotency_key: Optional[str] = None) -> Dict:
+        """Create a refund for a payment"""
+        try:
+            refund = self.run(self.client.create_refund(payment_id, amount, idempotency_key))
+        except MollieAPIError as e:
+            return {"error": e.detail}
+        return {
+            "id": refund.get("id"),
+            "payment_id": refund.get("paymentId", payment_id),
+            "amount": refund.get("amount"),
+            "status": refund.get("status"),
+            "created_at": refund.get("createdAt")
+        }
+
+    def close(self):
+        """Close pooled connections and stop the background loop"""
+        self.run(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=1)
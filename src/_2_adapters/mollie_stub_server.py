@@ -0,0 +1,268 @@
+"""Local Mollie-compatible stub server for offline testing.
+
+Implements the subset of the Mollie v2 API the platform uses (payments,
+refunds, methods) over keep-alive HTTP/1.1 with in-memory state.
+
+    python -m src._2_adapters.mollie_stub_server --port 8765 --latency-ms 20
+    MOLLIE_API_URL=http://127.0.0.1:8765/v2 streamlit run app.py
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+from datetime import datetime, timedelta
+
+
+class MollieStubServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: float = 0.0, paid_after: Optional[float] = None):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.paid_after = paid_after  # Seconds until open payments become paid
+
+        self.payments: Dict[str, Dict] = {}
+        self.refunds: Dict[str, Dict] = {}
+        self.request_count = 0
+        self.connection_count = 0
+        self._ids = itertools.count(1)
+        self._idempotent_responses: Dict[Tuple[str, str, str], Tuple[int, Dict]] = {}
+        self._created_monotonic: Dict[str, float] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handlers: Set[asyncio.Task] = set()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v2"
+
+    async def start(self):
+        """Start listening; port 0 picks a free port"""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            for handler in list(self._handlers):
+                handler.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+
+    def serve_in_thread(self) -> str:
+        """Run the server on a background thread; returns its base URL"""
+        started = threading.Event()
+        loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, name="mollie-stub", daemon=True).start()
+        started.wait()
+        return self.base_url
+
+    # HTTP handling
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connection_count += 1
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                body = json.loads(await reader.readexactly(length)) if length else {}
+
+                if self.latency_ms:
+                    await asyncio.sleep(self.latency_ms / 1000)
+
+                self.request_count += 1
+                status, response = self._dispatch(method, target, body, headers.get("idempotency-key"))
+                payload = json.dumps(response).encode()
+                keep_alive = headers.get("connection", "keep-alive").lower() != "close"
+
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status < 400 else 'Error'}\r\n"
+                    f"Content-Type: application/hal+json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+
+    def _dispatch(self, method: str, target: str, body: Dict, idempotency_key: Optional[str]) -> Tuple[int, Dict]:
+        if idempotency_key and method == "POST":
+            cache_key = (method, target, idempotency_key)
+            if cache_key not in self._idempotent_responses:
+                self._idempotent_responses[cache_key] = self._route(method, target, body)
+            return self._idempotent_responses[cache_key]
+        return self._route(method, target, body)
+
+    def _route(self, method: str, target: str, body: Dict) -> Tuple[int, Dict]:
+        parts = [p for p in target.split("?")[0].split("/") if p]
+        if parts[:1] == ["v2"]:
+            parts = parts[1:]
+
+        if parts == ["payments"] and method == "POST":
+            return self._create_payment(body)
+        if len(parts) == 2 and parts[0] == "payments" and method == "GET":
+            return self._get_payment(parts[1])
+        if len(parts) == 3 and parts[0] == "payments" and parts[2] == "refunds" and method == "POST":
+            return self._create_refund(parts[1], body)
+        if parts == ["methods"] and method == "GET":
+            return 200, self._methods()
+        # Test hook: force a payment into a given status
+        if len(parts) == 3 and parts[:2] == ["stub", "payments"] and method == "POST":
+            return self._set_status(parts[2], body.get("status", "paid"))
+        return 404, _error(404, "Not Found", f"No route for {method} {target}")
+
+    # Resources
+
+    def _create_payment(self, body: Dict) -> Tuple[int, Dict]:
+        amount = body.get("amount") or {}
+        if not amount.get("value"):
+            return 422, _error(422, "Unprocessable Entity", "The amount is required")
+
+        payment_id = f"tr_stub{next(self._ids):010d}"
+        now = datetime.now()
+        payment = {
+            "resource": "payment",
+            "id": payment_id,
+            "mode": "test",
+            "status": "open",
+            "amount": amount,
+            "description": body.get("description", ""),
+            "redirectUrl": body.get("redirectUrl"),
+            "webhookUrl": body.get("webhookUrl"),
+            "metadata": body.get("metadata"),
+            "createdAt": now.isoformat(),
+            "expiresAt": (now + timedelta(minutes=15)).isoformat(),
+            "_links": {
+                "self": {"href": f"{self.base_url}/payments/{payment_id}"},
+                "checkout": {"href": f"https://www.mollie.com/checkout/select-method/{payment_id}"}
+            }
+        }
+        self.payments[payment_id] = payment
+        self._created_monotonic[payment_id] = time.monotonic()
+        return 201, payment
+
+    def _get_payment(self, payment_id: str) -> Tuple[int, Dict]:
+        payment = self.payments.get(payment_id)
+        if not payment:
+            return 404, _error(404, "Not Found", f"No payment exists with token {payment_id}.")
+
+        if self.paid_after is not None and payment["status"] == "open":
+            if time.monotonic() - self._created_monotonic[payment_id] >= self.paid_after:
+                payment["status"] = "paid"
+                payment["paidAt"] = datetime.now().isoformat()
+        return 200, payment
+
+    def _create_refund(self, payment_id: str, body: Dict) -> Tuple[int, Dict]:
+        payment = self.payments.get(payment_id)
+        if not payment:
+            return 404, _error(404, "Not Found", f"No payment exists with token {payment_id}.")
+        if payment["status"] != "paid":
+            return 422, _error(422, "Unprocessable Entity", "The payment cannot be refunded")
+
+        paid_cents = _cents(payment["amount"]["value"])
+        refunded_cents = _cents(payment.get("amountRefunded", {}).get("value", "0"))
+        amount = body.get("amount") or {"currency": payment["amount"]["currency"],
+                                         "value": f"{(paid_cents - refunded_cents) / 100:.2f}"}
+        if _cents(amount["value"]) <= 0 or refunded_cents + _cents(amount["value"]) > paid_cents:
+            return 422, _error(422, "Unprocessable Entity", "The refund amount exceeds the remaining amount")
+        payment["amountRefunded"] = {"currency": amount["currency"],
+                                     "value": f"{(refunded_cents + _cents(amount['value'])) / 100:.2f}"}
+
+        refund_id = f"re_stub{next(self._ids):010d}"
+        refund = {
+            "resource": "refund",
+            "id": refund_id,
+            "paymentId": payment_id,
+            "amount": amount,
+            "status": "pending",
+            "createdAt": datetime.now().isoformat()
+        }
+        self.refunds[refund_id] = refund
+        return 201, refund
+
+    def _set_status(self, payment_id: str, status: str) -> Tuple[int, Dict]:
+        payment = self.payments.get(payment_id)
+        if not payment:
+            return 404, _error(404, "Not Found", f"No payment exists with token {payment_id}.")
+        payment["status"] = status
+        if status == "paid":
+            payment["paidAt"] = datetime.now().isoformat()
+        return 200, payment
+
+    @staticmethod
+    def _methods() -> Dict:
+        methods = [("ideal", "iDEAL"), ("creditcard", "Credit card"),
+                   ("paypal", "PayPal"), ("banktransfer", "Bank transfer")]
+        return {
+            "count": len(methods),
+            "_embedded": {"methods": [
+                {
+                    "resource": "method",
+                    "id": method_id,
+                    "description": description,
+                    "image": {"size1x": f"https://www.mollie.com/external/icons/payment-methods/{method_id}.png"}
+                }
+                for method_id, description in methods
+            ]}
+        }
+
+
+def _cents(value: str) -> int:
+    return round(float(value) * 100)
+
+
+def _error(status: int, title: str, detail: str) -> Dict:
+    return {"status": status, "title": title, "detail": detail}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Mollie API stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Artificial per-request latency")
+    parser.add_argument("--paid-after", type=float, default=None,
+                        help="Seconds after which open payments report as paid")
+    args = parser.parse_args()
+
+    async def serve():
+        server = MollieStubServer(args.host, args.port, args.latency_ms, args.paid_after)
+        await server.start()
+        print(f"Mollie stub listening on {server.base_url}")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
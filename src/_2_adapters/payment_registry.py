@@ -0,0 +1,91 @@
+import sqlite3
+import threading
+import uuid
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+
+class PaymentRegistry:
+    """Durable SQLite-backed registry of created payments.
+
+    Every payment gets a sequence number in creation order and keeps its last
+    known status, so open payments can be reconciled, and resumed from a
+    sequence number, after a restart. The registry's `epoch` is created with
+    the database, so anything saved with a sequence number can tell whether
+    it belongs to this registry.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS payments (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    payment_id TEXT NOT NULL UNIQUE,
+                    amount REAL NOT NULL,
+                    mvp_id TEXT,
+                    backer_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    is_open INTEGER NOT NULL,
+                    created_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_payments_open ON payments (is_open, seq);
+                CREATE TABLE IF NOT EXISTS registry_meta (
+                    name TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                ) WITHOUT ROWID;
+            """)
+            self._conn.execute("INSERT OR IGNORE INTO registry_meta (name, value) VALUES ('epoch', ?)",
+                               (uuid.uuid4().hex,))
+            self.epoch = self._conn.execute("SELECT value FROM registry_meta WHERE name = 'epoch'").fetchone()[0]
+
+    def register(self, payment_id: str, amount: float, mvp_id: str, backer_id: str,
+                 status: str, is_open: bool) -> Dict:
+        """Record a new payment; registering it again returns the existing record"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO payments (payment_id, amount, mvp_id, backer_id, status, is_open, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (payment_id, amount, mvp_id, backer_id, status, int(is_open), datetime.now().isoformat())
+            )
+            return self._get(payment_id)
+
+    def set_status(self, payment_id: str, status: str, is_open: bool):
+        """Remember the latest known status of a payment"""
+        with self._lock:
+            self._conn.execute("UPDATE payments SET status = ?, is_open = ? WHERE payment_id = ? AND status != ?",
+                               (status, int(is_open), payment_id, status))
+
+    def get(self, payment_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self._get(payment_id)
+
+    def _get(self, payment_id: str) -> Optional[Dict]:
+        row = self._conn.execute(
+            "SELECT seq, payment_id, amount, mvp_id, backer_id, status, created_at FROM payments WHERE payment_id = ?",
+            (payment_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        record = dict(zip(("seq", "payment_id", "amount", "mvp_id", "backer_id", "status", "created_at"), row))
+        record["created_at"] = datetime.fromisoformat(record["created_at"])
+        return record
+
+    def open_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM payments WHERE is_open = 1").fetchone()[0]
+
+    def open_after(self, after_seq: int, limit: int) -> List[Tuple[int, str]]:
+        """(seq, payment_id) of up to `limit` open payments after `after_seq`, in creation order"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT seq, payment_id FROM payments WHERE is_open = 1 AND seq > ? ORDER BY seq LIMIT ?",
+                (after_seq, limit)
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
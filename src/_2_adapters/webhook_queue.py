@@ -0,0 +1,168 @@
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Set, Tuple
+from datetime import datetime
+
+class WebhookQueue:
+    """Durable SQLite-backed queue of received payment webhooks.
+
+    Also records every (payment_id, status) transition that has been applied,
+    so replayed or duplicated webhooks are never applied twice, even across
+    restarts. Paid payments an MVP would not accept are kept as rejected
+    until an admin refunds them.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS webhooks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    payment_id TEXT NOT NULL,
+                    received_at TEXT NOT NULL,
+                    state TEXT NOT NULL DEFAULT 'pending'
+                );
+                CREATE INDEX IF NOT EXISTS idx_webhooks_state ON webhooks (state, id);
+                CREATE TABLE IF NOT EXISTS applied_transitions (
+                    payment_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    applied_at TEXT NOT NULL,
+                    PRIMARY KEY (payment_id, status)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS rejected_payments (
+                    payment_id TEXT PRIMARY KEY,
+                    mvp_id TEXT,
+                    backer_id TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    rejected_at TEXT NOT NULL,
+                    refunded_at TEXT
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS heartbeats (
+                    name TEXT PRIMARY KEY,
+                    beat_at TEXT NOT NULL
+                ) WITHOUT ROWID;
+            """)
+            # Webhooks claimed by workers that died before finishing go back in line
+            self._conn.execute("UPDATE webhooks SET state = 'pending' WHERE state = 'processing'")
+
+    def enqueue(self, payment_id: str) -> int:
+        """Durably record a received webhook; returns its queue id"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO webhooks (payment_id, received_at) VALUES (?, ?)",
+                (payment_id, datetime.now().isoformat())
+            )
+            return cursor.lastrowid
+
+    def enqueue_many(self, payment_ids: Iterable[str]):
+        """Record several webhooks in one transaction"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT INTO webhooks (payment_id, received_at) VALUES (?, ?)",
+                ((payment_id, now) for payment_id in payment_ids)
+            )
+            self._conn.execute("COMMIT")
+
+    def claim(self, limit: int) -> List[Tuple[int, str]]:
+        """Claim up to `limit` pending webhooks for processing"""
+        with self._lock:
+            return self._conn.execute("""
+                UPDATE webhooks SET state = 'processing'
+                WHERE id IN (SELECT id FROM webhooks WHERE state = 'pending' ORDER BY id LIMIT ?)
+                RETURNING id, payment_id
+            """, (limit,)).fetchall()
+
+    def applied_transitions(self, keys: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """Return which of the (payment_id, status) pairs were already applied"""
+        keys = set(keys)
+        payment_ids = list({payment_id for payment_id, _ in keys})
+        applied = set()
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(payment_ids), 500):
+                chunk = payment_ids[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT payment_id, status FROM applied_transitions "
+                    f"WHERE payment_id IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                applied.update(row for row in rows if row in keys)
+        return applied
+
+    def complete(self, webhook_ids: List[int], transitions: List[Tuple[str, str]],
+                 rejected: Iterable[Dict] = ()):
+        """Mark webhooks done and record applied transitions and rejected payments atomically.
+
+        Each rejected payment is a dict with `payment_id`, `mvp_id`,
+        `backer_id` and `amount`.
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO applied_transitions (payment_id, status, applied_at) VALUES (?, ?, ?)",
+                ((payment_id, status, now) for payment_id, status in transitions)
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO rejected_payments (payment_id, mvp_id, backer_id, amount, rejected_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((payment["payment_id"], payment["mvp_id"], payment["backer_id"], payment["amount"], now)
+                 for payment in rejected)
+            )
+            self._conn.executemany("UPDATE webhooks SET state = 'done' WHERE id = ?",
+                                   ((webhook_id,) for webhook_id in webhook_ids))
+            self._conn.execute("COMMIT")
+
+    def release(self, webhook_ids: List[int]):
+        """Put claimed webhooks back in the queue after a failure"""
+        with self._lock:
+            self._conn.executemany("UPDATE webhooks SET state = 'pending' WHERE id = ?",
+                                   ((webhook_id,) for webhook_id in webhook_ids))
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM webhooks WHERE state != 'done'").fetchone()[0]
+
+    def rejected_payments(self, limit: int = 1000) -> List[Dict]:
+        """Rejected payments not refunded yet, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT payment_id, mvp_id, backer_id, amount, rejected_at FROM rejected_payments "
+                "WHERE refunded_at IS NULL ORDER BY rejected_at, payment_id LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(zip(("payment_id", "mvp_id", "backer_id", "amount", "rejected_at"), row)) for row in rows]
+
+    def rejected_count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM rejected_payments WHERE refunded_at IS NULL"
+            ).fetchone()[0]
+
+    def mark_refunded(self, payment_ids: Iterable[str]):
+        """Record that rejected payments were refunded to their backers"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("UPDATE rejected_payments SET refunded_at = ? WHERE payment_id = ?",
+                                   ((now, payment_id) for payment_id in payment_ids))
+            self._conn.execute("COMMIT")
+
+    def heartbeat(self, name: str = "health"):
+        """Write and commit one small row, so health checks can time a real write"""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO heartbeats (name, beat_at) VALUES (?, ?)",
+                               (name, datetime.now().isoformat()))
+    
+    def purge_completed(self) -> int:
+        """Delete processed webhooks; applied transitions are kept for deduplication"""
+        with self._lock:
+            return self._conn.execute("DELETE FROM webhooks WHERE state = 'done'").rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import threading
 from typing import Dict, List, Callable
 from datetime import datetime
 
@@ -8,9 +9,27 @@ class WebSocketAdapter:
         self.connections = {}
         self.channels = {}
         self._running = False
+        self._loop = None
+        self._pending_broadcasts = 0  # Published from other threads, not yet sent
+        self._pending_lock = threading.Lock()
+    
+    @property
+    def loop(self):
+        """Event loop the clients are served on, once one has connected"""
+        return self._loop
+    
+    def stats(self) -> Dict:
+        """Connection, channel and send queue counts"""
+        return {
+            "connections": len(self.connections),
+            "channels": len(self.channels),
+            "subscriptions": sum(len(clients) for clients in self.channels.values()),
+            "pending_broadcasts": self._pending_broadcasts,
+        }
     
     async def connect(self, client_id: str, websocket):
         """Connect a new WebSocket client"""
+        self._loop = asyncio.get_running_loop()
         self.connections[client_id] = websocket
         await self.send_to_client(client_id, {
             "type": "connection",
@@ -58,6 +77,21 @@ class WebSocketAdapter:
             for client_id in self.channels[channel].copy():
                 await self.send_to_client(client_id, message)
     
+    def publish(self, channel: str, message: Dict) -> bool:
+        """Broadcast to a channel from synchronous code (e.g. a Streamlit script thread)"""
+        loop = self._loop
+        if loop is None or loop.is_closed() or not self.channels.get(channel):
+            return False
+        with self._pending_lock:
+            self._pending_broadcasts += 1
+        future = asyncio.run_coroutine_threadsafe(self.broadcast_to_channel(channel, message), loop)
+        future.add_done_callback(self._broadcast_done)
+        return True
+    
+    def _broadcast_done(self, future):
+        with self._pending_lock:
+            self._pending_broadcasts -= 1
+    
     async def broadcast_to_all(self, message: Dict):
         """Broadcast message to all connected clients"""
         for client_id in list(self.connections.keys()):
@@ -1,15 +1,14 @@
 import streamlit as st
 from typing import Dict, Any
 from src._0_domain.user import UserProfile, UserRole, UserStatus
-from src._1_use_cases.hackathon_service import HackathonService
-from src._1_use_cases.mvp_service import MVPService
-from src._1_use_cases.payment_service import PaymentService
+from utils.shared_services import get_hackathon_service, get_mvp_service, get_payment_service
+from src._1_use_cases.fee_engine import to_cents_array
 
 class VibratonicApp:
     def __init__(self):
-        self.hackathon_service = HackathonService()
-        self.mvp_service = MVPService()
-        self.payment_service = PaymentService()
+        self.hackathon_service = get_hackathon_service()
+        self.mvp_service = get_mvp_service()
+        self.payment_service = get_payment_service()
         self._initialize_user()
     
     def _initialize_user(self):
@@ -388,8 +387,11 @@ class VibratonicApp:
         
         hackathons = self.hackathon_service.get_all_hackathons()
         mvps = self.mvp_service.get_all_mvps()
-        total_funding = sum(mvp.current_funding for mvp in mvps)
-        total_fees = total_funding * 0.20
+        fee_totals = self.payment_service.fee_engine.batch_totals(
+            to_cents_array([mvp.current_funding for mvp in mvps])
+        )
+        total_funding = fee_totals["amount_cents"] / 100
+        total_fees = fee_totals["platform_fee_cents"] / 100
         
         with col1:
             st.metric("Total Hackathons", len(hackathons))
@@ -0,0 +1,224 @@
+import os
+from datetime import timedelta
+import streamlit as st
+from src._1_use_cases.hackathon_service import HackathonService
+from src._1_use_cases.mvp_service import MVPService
+from src._1_use_cases.activity_feed_service import ActivityFeedService
+from src._1_use_cases.chat_service import ChatService
+from src._1_use_cases.payment_service import PaymentService
+from src._1_use_cases.funding_ledger import FundingLedger
+from src._1_use_cases.webhook_processor import WebhookProcessor
+from src._1_use_cases.payment_reconciler import PaymentReconciler
+from src._1_use_cases.settlement_service import SettlementService
+from src._1_use_cases.refund_service import RefundService
+from src._1_use_cases.transaction_store import TransactionStore
+from src._1_use_cases.funding_rollups import FundingRollups
+from src._1_use_cases.kpi_service import KPIService
+from src._1_use_cases.funnel_analytics import FunnelAnalytics
+from src._1_use_cases.leaderboard_service import LeaderboardService
+from src._1_use_cases.search_service import SearchService
+from src._1_use_cases.vocabulary_service import VocabularyService
+from src._1_use_cases.figure_cache import FigureCache
+from src._1_use_cases.export_service import ExportService
+from src._1_use_cases.job_runner import JobRunner
+from src._1_use_cases.timing_registry import TimingRegistry
+from src._1_use_cases.health_monitor import (
+    HealthMonitor, storage_probe, database_probe, payment_gateway_probe, websocket_probe, event_loop_probe
+)
+from src._1_use_cases import admin_jobs
+from src._2_adapters.websocket_adapter import WebSocketAdapter
+from src._2_adapters.mollie_client import MollieClient
+from src._2_adapters.payment_registry import PaymentRegistry
+from src._2_adapters.webhook_queue import WebhookQueue
+
+# Process-wide service instances shared by every Streamlit session.
+# st.cache_resource keeps a single object per server process, so state
+# kept here is visible to all users instead of living in session_state.
+
+def data_path(filename: str) -> str:
+    """Path for persistent files under VIBRATONIC_DATA_DIR (default ./data)"""
+    data_dir = os.getenv("VIBRATONIC_DATA_DIR", "data")
+    os.makedirs(data_dir, exist_ok=True)
+    return os.path.join(data_dir, filename)
+
+@st.cache_resource
+def get_timing_registry() -> TimingRegistry:
+    """Get the shared section timings; VIBRATONIC_TIMINGS=0 starts with timing off"""
+    return TimingRegistry(enabled=os.getenv("VIBRATONIC_TIMINGS", "1") != "0")
+
+def _timed(target, prefix: str, methods: list):
+    """Time `methods` of a shared service or adapter in the timing registry"""
+    return get_timing_registry().instrument(target, prefix, methods)
+
+@st.cache_resource
+def get_hackathon_service() -> HackathonService:
+    """Get the shared hackathon service"""
+    return _timed(HackathonService(), "hackathon_service",
+                  ["get_all_hackathons", "query_hackathons", "get_open_hackathons"])
+
+@st.cache_resource
+def get_mvp_service() -> MVPService:
+    """Get the shared MVP service"""
+    return _timed(MVPService(), "mvp_service",
+                  ["get_all_mvps", "query_mvps", "get_mvps_by_hackathon", "get_funded_mvps"])
+
+@st.cache_resource
+def get_activity_feed_service() -> ActivityFeedService:
+    """Get the shared activity feed"""
+    return _timed(ActivityFeedService(), "activity_feed", ["get_page", "get_latest"])
+
+@st.cache_resource
+def get_websocket_adapter() -> WebSocketAdapter:
+    """Get the shared WebSocket adapter"""
+    return _timed(WebSocketAdapter(), "websocket", ["publish"])
+
+@st.cache_resource
+def get_chat_service() -> ChatService:
+    """Get the shared chat rooms"""
+    return _timed(ChatService(websocket_adapter=get_websocket_adapter()), "chat_service",
+                  ["post_message", "get_recent_messages"])
+
+@st.cache_resource
+def get_payment_service() -> PaymentService:
+    """Get the shared payment service.
+
+    Uses the pooled Mollie API client when MOLLIE_API_URL points at a real
+    or stub API, and the in-memory mock otherwise.
+    """
+    # Shares the webhook database, so open payments survive a restart
+    registry = PaymentRegistry(data_path("webhooks.db"))
+    if os.getenv("MOLLIE_API_URL"):
+        service = PaymentService(mollie_adapter=MollieClient(), registry=registry)
+    else:
+        service = PaymentService(registry=registry)
+    _timed(service.mollie_adapter, "mollie",
+           ["create_payment", "get_payment_status", "get_payment_methods", "refund_payment"])
+    return _timed(service, "payment_service", ["create_payment", "get_payment_status"])
+
+@st.cache_resource
+def get_funding_ledger() -> FundingLedger:
+    """Get the shared funding ledger"""
+    return FundingLedger()
+
+@st.cache_resource
+def get_webhook_processor() -> WebhookProcessor:
+    """Get the shared webhook processor with its workers running"""
+    processor = WebhookProcessor(
+        payment_service=get_payment_service(),
+        mvp_service=get_mvp_service(),
+        funding_ledger=get_funding_ledger(),
+        queue=_timed(WebhookQueue(data_path("webhooks.db")), "webhook_queue", ["enqueue", "claim", "complete"]),
+        activity_feed=get_activity_feed_service()
+    )
+    processor.start()
+    return processor
+
+@st.cache_resource
+def get_payment_reconciler() -> PaymentReconciler:
+    """Get the shared reconciler for open payments with lost webhooks"""
+    return PaymentReconciler(
+        payment_service=get_payment_service(),
+        webhook_processor=get_webhook_processor(),
+        checkpoint_path=data_path("reconciliation.json")
+    )
+
+@st.cache_resource
+def get_settlement_service() -> SettlementService:
+    """Get the shared creator payout settlement"""
+    return SettlementService(get_funding_ledger(), data_path("settlements"))
+
+@st.cache_resource
+def get_refund_service() -> RefundService:
+    """Get the shared bulk refund service"""
+    return RefundService(
+        payment_service=get_payment_service(),
+        mvp_service=get_mvp_service(),
+        funding_ledger=get_funding_ledger(),
+        activity_feed=get_activity_feed_service()
+    )
+
+@st.cache_resource
+def get_transaction_store() -> TransactionStore:
+    """Get the shared transaction store; call `sync()` before reading"""
+    store = _timed(TransactionStore(get_funding_ledger()), "transaction_store",
+                   ["sync", "get_latest", "get_by_investor", "get_by_mvp", "get_by_creator", "get_by_date_range"])
+    store.add_listener(get_funding_rollups().add_transactions)
+    store.add_listener(get_leaderboards().add_transactions)
+    # Backings of the sample MVPs that predate the ledger, including the demo user's
+    store.load_sample_history(get_mvp_service(), ["user001", "inv_greentech", "inv_alice", "inv_nordic", "inv_angel"])
+    return store
+
+@st.cache_resource
+def get_funding_rollups() -> FundingRollups:
+    """Get the shared hourly and daily funding rollups, fed by the transaction store"""
+    return _timed(FundingRollups(), "funding_rollups", ["get_series"])
+
+@st.cache_resource
+def get_leaderboards() -> LeaderboardService:
+    """Get the shared MVP and investor leaderboards, fed investor totals by the transaction store"""
+    return _timed(LeaderboardService(get_mvp_service()), "leaderboards",
+                  ["top_mvps_by_funding", "top_mvps_by_backers", "top_investors", "top_investors_rolling"])
+
+@st.cache_resource
+def get_kpi_service() -> KPIService:
+    """Get the shared platform KPIs"""
+    return _timed(KPIService(get_hackathon_service(), get_mvp_service()), "kpi_service",
+                  ["get_metrics", "get_deltas"])
+
+@st.cache_resource
+def get_funnel_analytics() -> FunnelAnalytics:
+    """Get the shared hackathon → MVP → funding funnel, fed by the services and the transaction store"""
+    return _timed(FunnelAnalytics(get_hackathon_service(), get_mvp_service(), get_transaction_store()),
+                  "funnel_analytics", ["get_report"])
+
+@st.cache_resource
+def get_search_service() -> SearchService:
+    """Get the shared full-text search over hackathons and MVPs"""
+    return _timed(SearchService(get_hackathon_service(), get_mvp_service()), "search_service",
+                  ["search", "search_hackathons", "search_mvps"])
+
+@st.cache_resource
+def get_vocabulary_service() -> VocabularyService:
+    """Get the shared tag, tech stack and skill vocabularies for autocompletion"""
+    return _timed(VocabularyService(get_hackathon_service(), get_mvp_service()), "vocabulary_service",
+                  ["complete", "popular"])
+
+@st.cache_resource
+def get_figure_cache() -> FigureCache:
+    """Get the shared cache of rendered admin charts"""
+    return _timed(FigureCache(), "figure_cache", ["get"])
+
+@st.cache_resource
+def get_export_service() -> ExportService:
+    """Get the shared CSV/Parquet exporter"""
+    return ExportService(
+        transaction_store=get_transaction_store(),
+        mvp_service=get_mvp_service(),
+        hackathon_service=get_hackathon_service(),
+        output_dir=data_path("exports")
+    )
+
+@st.cache_resource
+def get_job_runner() -> JobRunner:
+    """Get the shared background job runner with the admin jobs registered"""
+    runner = JobRunner(data_path("jobs"))
+    runner.register("export", admin_jobs.export_job(get_export_service()), in_process=True)
+    runner.register("reconcile_payments", admin_jobs.reconcile_job(get_payment_reconciler()), in_process=True)
+    runner.register("revenue_report", admin_jobs.build_revenue_report)
+    runner.register("transaction_audit", admin_jobs.audit_transactions)
+    return runner
+
+@st.cache_resource
+def get_health_monitor() -> HealthMonitor:
+    """Get the shared health probes of storage, database, payment gateway, WebSocket and event loops"""
+    websocket_adapter = get_websocket_adapter()
+    payment_adapter = get_payment_service().mollie_adapter
+    monitor = HealthMonitor()
+    monitor.register("storage", storage_probe(data_path(".health_probe")), ttl=timedelta(seconds=30), warn_ms=50)
+    monitor.register("database", database_probe(get_webhook_processor().queue), ttl=timedelta(seconds=15), warn_ms=50)
+    monitor.register("payment_gateway", payment_gateway_probe(payment_adapter), ttl=timedelta(seconds=60), warn_ms=800)
+    monitor.register("websocket", websocket_probe(websocket_adapter), ttl=timedelta(seconds=5), warn_ms=20)
+    monitor.register("event_loops", event_loop_probe(
+        lambda: {"websocket": websocket_adapter.loop, "mollie": getattr(payment_adapter, "loop", None)}
+    ), ttl=timedelta(seconds=5), warn_ms=50)
+    return monitor
@@ -1,4 +1,5 @@
 import streamlit as st
+from collections import deque
 from datetime import datetime
 from src._0_domain.user import UserProfile, UserRole, UserStatus
 
@@ -34,17 +35,6 @@ def initialize_session_state():
     if "mvp_filter" not in st.session_state:
         st.session_state.mvp_filter = "All"
     
-    # Activity feed state
-    if "activity_feed" not in st.session_state:
-        st.session_state.activity_feed = []
-    
-    if "last_activity_update" not in st.session_state:
-        st.session_state.last_activity_update = datetime.now()
-    
-    # Chat state
-    if "chat_messages" not in st.session_state:
-        st.session_state.chat_messages = []
-    
     # Notification state
     if "notifications" not in st.session_state:
         st.session_state.notifications = []
@@ -182,8 +172,9 @@ def update_user_activity(activity_type, details=None):
     """Update user activity log"""
     activity_key = "user_activity"
     
+    # Bounded deque keeps only the last 50 activities without copying
     if activity_key not in st.session_state:
-        st.session_state[activity_key] = []
+        st.session_state[activity_key] = deque(maxlen=50)
     
     activity = {
         "type": activity_type,
@@ -193,13 +184,10 @@ def update_user_activity(activity_type, details=None):
     }
     
     st.session_state[activity_key].append(activity)
-    
-    # Keep only last 50 activities
-    st.session_state[activity_key] = st.session_state[activity_key][-50:]
 
 def get_user_activity():
     """Get user activity log"""
-    return st.session_state.get("user_activity", [])
+    return list(st.session_state.get("user_activity", []))
 
 def is_mobile():
     """Check if user is on mobile device (simplified check)"""